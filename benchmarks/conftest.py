@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import logging
+import os
+import sys
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator
+
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+ROUNDS = 2000
+"""Rounds for benchmarks that need a fresh record for each call."""
+
+SMALL_EXTRA: dict[str, Any] = {"user_id": 42, "order_id": "A-1234"}
+
+LARGE_EXTRA: dict[str, Any] = {
+    **{f"field_{i}": "x" * 32 for i in range(50)},
+    "nested": {"items": list(range(20)), "meta": {"source": "bench", "tags": ["a", "b", "c"]}},
+}
+
+GUNICORN_EXTRA: dict[str, Any] = {
+    "http.url": "/api/v1/orders?page=2",
+    "http.status_code": "200",
+    "http.method": "GET",
+    "http.referer": "https://www.example.com/",
+    "http.request_id": "5f0c6a6e-2b1f-4e1b-9f0a-9b8e0c0b8e7c",
+    "http.version": "HTTP/1.1",
+    "http.useragent": "Mozilla/5.0 (X11; Linux x86_64; rv:109.0) Gecko/20100101 Firefox/115.0",
+    "logger.pid": 1234,
+    "http.response_length": 5120,
+    "duration": 12_345_678.0,
+    "request_time_seconds": "0.012345",
+}
+
+HYPERCORN_EXTRA: dict[str, Any] = {
+    "http.status_code": 200,
+    "http.method": "GET",
+    "http.referer": "https://www.example.com/",
+    "http.useragent": "Mozilla/5.0 (X11; Linux x86_64; rv:109.0) Gecko/20100101 Firefox/115.0",
+    "http.version": "1.1",
+    "http.url_details.scheme": "https",
+    "http.url_details.queryString": "page=2",
+    "http.url_details.path": "/api/v1/orders",
+    "duration": 12345,
+    "accept": "application/json",
+    "accept-encoding": "gzip, deflate, br",
+    "content-type": "application/json",
+    "cookie": "session=deadbeef",
+}
+
+EXTRAS: dict[str, dict[str, Any]] = {
+    "no_extra": {},
+    "small_extra": SMALL_EXTRA,
+    "large_extra": LARGE_EXTRA,
+    "gunicorn": GUNICORN_EXTRA,
+    "hypercorn": HYPERCORN_EXTRA,
+}
+
+
+def _boom() -> None:
+    raise ValueError("boom")
+
+
+def make_record(extra: dict[str, Any] | None = None, *, exc: bool = False, name: str = "bench") -> logging.LogRecord:
+    exc_info = None
+    if exc:
+        try:
+            _boom()
+        except ValueError:
+            exc_info = sys.exc_info()
+    record = logging.LogRecord(name, logging.INFO, __file__, 42, "Processed order %s", ("A-1234",), exc_info)
+    record.__dict__.update(extra or {})
+    return record
+
+
+def bench_fresh_record(benchmark: BenchmarkFixture, fn: Callable[[logging.LogRecord], Any], **record_kwargs: Any) -> None:
+    """Benchmark `fn` on a fresh record for each call, since formatters and filters mutate records."""
+    benchmark.pedantic(fn, setup=lambda: ((make_record(**record_kwargs),), {}), rounds=ROUNDS, warmup_rounds=100)
+
+
+@pytest.fixture(params=list(EXTRAS))
+def extra(request: pytest.FixtureRequest) -> dict[str, Any]:
+    return EXTRAS[request.param]
+
+
+@pytest.fixture
+def devnull_stderr(monkeypatch: pytest.MonkeyPatch) -> Generator[None, None, None]:
+    """Send whatever Loggia's handler writes to /dev/null, and reset the root logger and loguru afterwards."""
+    with open(os.devnull, "w") as devnull:  # noqa: PTH123
+        monkeypatch.setattr(sys, "stderr", devnull)
+        yield
+        for handler in logging.root.handlers[:]:
+            logging.root.removeHandler(handler)
+        try:
+            import loguru
+
+            from loggia._internal.loguru_stuff import _unblock_loguru_reconfiguration
+        except ImportError:
+            return
+        _unblock_loguru_reconfiguration()
+        loguru.logger.remove()
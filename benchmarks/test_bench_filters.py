@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from benchmarks.conftest import SMALL_EXTRA, bench_fresh_record
+from loggia.filters.extra_allow import ExtraAllow
+from loggia.filters.filter_rules import FilterRules
+from loggia.presets.datadog_normalisation import DatadogNormalisation
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+
+def test_datadog_normalisation(benchmark: BenchmarkFixture, extra: dict[str, Any]):
+    bench_fresh_record(benchmark, DatadogNormalisation().filter, extra=extra)
+
+
+def test_datadog_normalisation_exception(benchmark: BenchmarkFixture):
+    bench_fresh_record(benchmark, DatadogNormalisation().filter, exc=True)
+
+
+def test_extra_allow(benchmark: BenchmarkFixture, extra: dict[str, Any]):
+    bench_fresh_record(benchmark, ExtraAllow(SMALL_EXTRA).filter, extra=extra)
+
+
+@pytest.mark.parametrize("rule_count", [1, 10, 100])
+def test_filter_rules(benchmark: BenchmarkFixture, rule_count: int):
+    rules = "; ".join(f'logger=lib{i}.* and level<WARNING -> drop; msg~"probe {i}" -> drop' for i in range(rule_count // 2 or 1))
+    bench_fresh_record(benchmark, FilterRules(rules).filter)
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from benchmarks.conftest import bench_fresh_record
+from loggia.stdlib_formatters.json_formatter import CustomJsonFormatter
+from loggia.stdlib_formatters.pretty_formatter import PrettyFormatter
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+
+def test_json_formatter(benchmark: BenchmarkFixture, extra: dict[str, Any]):
+    bench_fresh_record(benchmark, CustomJsonFormatter().format, extra=extra)
+
+
+def test_json_formatter_exception(benchmark: BenchmarkFixture):
+    bench_fresh_record(benchmark, CustomJsonFormatter().format, exc=True)
+
+
+def test_pretty_formatter(benchmark: BenchmarkFixture, extra: dict[str, Any]):
+    bench_fresh_record(benchmark, PrettyFormatter().format, extra=extra)
+
+
+def test_pretty_formatter_exception(benchmark: BenchmarkFixture):
+    bench_fresh_record(benchmark, PrettyFormatter().format, exc=True)
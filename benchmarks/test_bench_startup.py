@@ -0,0 +1,37 @@
+"""Startup benchmarks: what each worker pays to configure Loggia when it boots.
+
+Cold benchmarks run a fresh interpreter per round. Compare them with `test_interpreter_startup`,
+which is the part Loggia has no say in.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from typing import TYPE_CHECKING
+
+import pytest
+
+from loggia.conf import LoggerConfiguration
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+
+def _run_python(code: str) -> None:
+    subprocess.run([sys.executable, "-c", code], check=True)  # noqa: S603
+
+
+def test_interpreter_startup(benchmark: BenchmarkFixture):
+    benchmark.pedantic(_run_python, args=("pass",), rounds=20)
+
+
+@pytest.mark.parametrize("preset", ["prod", "dev"])
+def test_cold_initialize(benchmark: BenchmarkFixture, preset: str):
+    code = f"from loggia.logger import initialize; initialize(presets={preset!r})"
+    benchmark.pedantic(_run_python, args=(code,), rounds=20)
+
+
+@pytest.mark.parametrize("preset", ["prod", "dev"])
+def test_logger_configuration(benchmark: BenchmarkFixture, preset: str):
+    benchmark(LoggerConfiguration, presets=preset)
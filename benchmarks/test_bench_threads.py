@@ -0,0 +1,57 @@
+"""Contention benchmark: a fixed number of records logged through the prod preset by 1 to 64 threads.
+
+The total work is the same for every thread count, so on a free-threaded interpreter (such as
+`python3.13t`) the mean time should go down as threads are added, and on a standard interpreter
+it shows the cost of contention on the GIL and on the handler lock. Each result records whether
+the GIL was enabled in its `extra_info`.
+"""
+
+from __future__ import annotations
+
+import logging
+import sys
+import threading
+from typing import TYPE_CHECKING
+
+import pytest
+
+from benchmarks.conftest import SMALL_EXTRA
+from loggia.logger import initialize
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+pytestmark = pytest.mark.usefixtures("devnull_stderr")
+
+TOTAL_RECORDS = 6400
+
+
+def _gil_enabled() -> bool:
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return True if is_gil_enabled is None else bool(is_gil_enabled())
+
+
+@pytest.mark.parametrize("threads", [1, 2, 4, 8, 16, 32, 64])
+def test_threads_scaling(benchmark: BenchmarkFixture, threads: int):
+    initialize(presets=["prod"])
+    logger = logging.getLogger("bench")
+    per_thread = TOTAL_RECORDS // threads
+
+    def log_from_threads() -> None:
+        barrier = threading.Barrier(threads)
+
+        def log() -> None:
+            barrier.wait()
+            for i in range(per_thread):
+                logger.warning("Processed order %d", i, extra=SMALL_EXTRA)
+
+        workers = [threading.Thread(target=log) for _ in range(threads)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+    benchmark.group = f"threads (gil={'on' if _gil_enabled() else 'off'})"
+    benchmark.extra_info["gil_enabled"] = _gil_enabled()
+    benchmark.extra_info["records"] = per_thread * threads
+    benchmark.pedantic(log_from_threads, rounds=5, warmup_rounds=1)
@@ -0,0 +1,118 @@
+"""End-to-end benchmarks, through `initialize()` and a real handler writing to /dev/null.
+
+Presets without a slot are always applied, so benchmarking each preset of the `main`
+slot covers every built-in preset.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from benchmarks.conftest import SMALL_EXTRA
+from loggia.logger import initialize
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+pytestmark = pytest.mark.usefixtures("devnull_stderr")
+
+MAIN_PRESETS = ["prod", "dev"]
+
+
+@pytest.mark.parametrize("preset", MAIN_PRESETS)
+def test_log_call(benchmark: BenchmarkFixture, preset: str, extra: dict[str, Any]):
+    initialize(presets=[preset])
+    logger = logging.getLogger("bench")
+    benchmark(logger.warning, "Processed order %s", "A-1234", extra=extra)
+
+
+def test_log_call_plain_logger(benchmark: BenchmarkFixture):
+    """Prod loggers are plain `logging.Logger` instances, even with the pretty formatter imported."""
+    import loggia.stdlib_formatters.pretty_formatter  # noqa: F401
+
+    initialize(presets=["prod"])
+    logger = logging.getLogger("bench")
+    assert type(logger) is logging.Logger
+    assert logging.Logger._log.__module__ == "logging"
+    benchmark(logger.warning, "Processed order %s", "A-1234", extra=SMALL_EXTRA)
+
+
+@pytest.mark.parametrize("sub_caller", ["", "elsewhere:off", "bench:off"], ids=["stdlib", "fast", "off"])
+def test_log_call_caller(benchmark: BenchmarkFixture, sub_caller: str):
+    """Caller location found by `Logger.findCaller`, by Loggia's logger class, or not at all."""
+    initialize({"LOGGIA_SUB_CALLER": sub_caller} if sub_caller else {}, presets=["prod"])
+    logger = logging.getLogger("bench")
+    benchmark(logger.warning, "Processed order %s", "A-1234", extra=SMALL_EXTRA)
+
+
+@pytest.mark.parametrize("preset", MAIN_PRESETS)
+def test_log_call_lean_records(benchmark: BenchmarkFixture, preset: str):
+    """Compare with `test_log_call`: records skip the attributes no formatter reads."""
+    initialize({"LOGGIA_LEAN_RECORDS": "true"}, presets=[preset])
+    logger = logging.getLogger("bench")
+    benchmark(logger.warning, "Processed order %s", "A-1234", extra=SMALL_EXTRA)
+
+
+@pytest.mark.parametrize("preset", MAIN_PRESETS)
+def test_log_call_exception(benchmark: BenchmarkFixture, preset: str):
+    initialize(presets=[preset])
+    logger = logging.getLogger("bench")
+
+    def log_exception() -> None:
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("Failed to process order %s", "A-1234")
+
+    benchmark(log_exception)
+
+
+@pytest.mark.parametrize("preset", MAIN_PRESETS)
+def test_disabled_level_call(benchmark: BenchmarkFixture, preset: str):
+    initialize({"LOGGIA_LEVEL": "WARNING"}, presets=[preset])
+    logger = logging.getLogger("bench")
+    benchmark(logger.debug, "Processed order %s", "A-1234", extra=SMALL_EXTRA)
+
+
+@pytest.mark.parametrize("preset", MAIN_PRESETS)
+def test_disabled_level_call_stripped(benchmark: BenchmarkFixture, preset: str):
+    initialize({"LOGGIA_LEVEL": "WARNING", "LOGGIA_STRIP_BELOW": "INFO"}, presets=[preset])
+    logger = logging.getLogger("bench")
+    benchmark(logger.debug, "Processed order %s", "A-1234", extra=SMALL_EXTRA)
+
+
+def test_bare_function_call(benchmark: BenchmarkFixture):
+    """The floor for `test_disabled_level_call_stripped`."""
+
+    def noop(*_args: Any, **_kwargs: Any) -> None:
+        return None
+
+    benchmark(noop, "Processed order %s", "A-1234", extra=SMALL_EXTRA)
+
+
+@pytest.mark.parametrize("setting", ["LOGGIA_FILTER_RULES", "LOGGIA_PRE_FILTER_RULES"])
+def test_rejected_call(benchmark: BenchmarkFixture, setting: str):
+    """A call dropped by a filter, or rejected before its record is created."""
+    initialize({setting: "logger=bench -> drop"}, presets=["prod"])
+    logger = logging.getLogger("bench")
+    benchmark(logger.warning, "Processed order %s", "A-1234", extra=SMALL_EXTRA)
+
+
+def test_loguru_sink(benchmark: BenchmarkFixture):
+    loguru = pytest.importorskip("loguru")
+    from loggia._internal.loguru_stuff import _loguru_to_std_sink
+
+    initialize({"LOGGIA_CAPTURE_LOGURU": "true"})
+    messages: list[Any] = []
+    loguru.logger.add(messages.append)
+    loguru.logger.bind(**SMALL_EXTRA).warning("Processed order {}", "A-1234")
+    benchmark(_loguru_to_std_sink, messages[-1])
+
+
+def test_loguru_end_to_end(benchmark: BenchmarkFixture):
+    loguru = pytest.importorskip("loguru")
+    initialize({"LOGGIA_CAPTURE_LOGURU": "true"})
+    benchmark(loguru.logger.bind(**SMALL_EXTRA).warning, "Processed order {}", "A-1234")
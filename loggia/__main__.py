@@ -0,0 +1,44 @@
+"""Command line tools: `python -m loggia compile`."""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from typing import TYPE_CHECKING
+
+from loggia._internal.compiled import COMPILED_CONFIG_ENV, compile_configuration, configuration_key
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m loggia", description="Loggia command line tools.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    compile_parser = commands.add_parser(
+        "compile",
+        help="resolve the configuration of this environment ahead of time",
+        description="Resolve the presets and LOGGIA_* environment variables into a file that initialize() loads at startup.",
+    )
+    compile_parser.add_argument(
+        "-o",
+        "--output",
+        default=os.environ.get(COMPILED_CONFIG_ENV),
+        help="path of the compiled configuration (default: $LOGGIA_COMPILED_CONFIG)",
+    )
+    args = parser.parse_args(argv)
+
+    if not args.output:
+        parser.error("compile: pass --output or set LOGGIA_COMPILED_CONFIG")
+
+    try:
+        compile_configuration(args.output)
+    except ValueError as e:
+        parser.exit(1, f"{parser.prog}: error: {e}\n")
+    print(f"Compiled the logging configuration to {args.output} (key {configuration_key()[:12]})")  # noqa: T201
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
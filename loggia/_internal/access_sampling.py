@@ -0,0 +1,145 @@
+"""Declarative sampling rules for the gunicorn and hypercorn access logs.
+
+Rules use the syntax described in `loggia._internal.rules`, with these fields:
+
+- `status`: the HTTP status code, compared as a number. `status=4xx` matches a class of statuses.
+- `duration`: the request duration, in seconds unless suffixed with `ms`.
+- `path`: the request path, without query string. `=` is an exact match, or a prefix
+  match if the value ends with `*`. `~` searches for a regular expression.
+
+Actions are `keep`, `drop`, or a sampling rate such as `0.01` or `1%`. The first
+matching rule decides, and requests matching no rule are kept:
+
+    status>=400 -> keep; duration>500ms -> keep; path=/healthz -> drop; status=2xx -> 1%
+
+Rules are evaluated by the access loggers before any extra dict is built, or any
+header decoded.
+"""
+
+from __future__ import annotations
+
+import operator
+import random
+import re
+from typing import Callable
+
+from loggia._internal.rules import Condition, RuleSyntaxError, parse_rules
+
+_Predicate = Callable[[int, float, str], bool]
+
+_NUMERIC_OPS: dict[str, Callable[[float, float], bool]] = {
+    "=": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+_STATUS_CLASS_RE = re.compile(r"^([1-5])xx$", re.IGNORECASE)
+
+_sampler: AccessLogSampler | None = None
+
+
+def _parse_duration(value: str) -> float:
+    if value.endswith("ms"):
+        return float(value[:-2]) / 1000
+    if value.endswith("s"):
+        return float(value[:-1])
+    return float(value)
+
+
+def _parse_rate(action: str) -> float:
+    if action == "keep":
+        return 1.0
+    if action == "drop":
+        return 0.0
+    try:
+        rate = float(action[:-1]) / 100 if action.endswith("%") else float(action)
+    except ValueError:
+        raise RuleSyntaxError(f"Unknown access log sampling action: {action!r}") from None
+    if not 0.0 <= rate <= 1.0:
+        raise RuleSyntaxError(f"Access log sampling rate out of [0, 1] bounds: {action!r}")
+    return rate
+
+
+def _compile_status(cond: Condition) -> _Predicate:
+    status_class = _STATUS_CLASS_RE.match(cond.value)
+    if status_class and cond.op in ("=", "!="):
+        hundreds = int(status_class[1])
+        if cond.op == "=":
+            return lambda status, _duration, _path: status // 100 == hundreds
+        return lambda status, _duration, _path: status // 100 != hundreds
+    if cond.op not in _NUMERIC_OPS:
+        raise RuleSyntaxError(f"Unsupported operator for status: {cond.op!r}")
+    op, value = _NUMERIC_OPS[cond.op], int(cond.value)
+    return lambda status, _duration, _path: op(status, value)
+
+
+def _compile_duration(cond: Condition) -> _Predicate:
+    if cond.op not in _NUMERIC_OPS:
+        raise RuleSyntaxError(f"Unsupported operator for duration: {cond.op!r}")
+    op, value = _NUMERIC_OPS[cond.op], _parse_duration(cond.value)
+    return lambda _status, duration, _path: op(duration, value)
+
+
+def _compile_path(cond: Condition) -> _Predicate:
+    value = cond.value
+    if cond.op == "~":
+        search = re.compile(value).search
+        return lambda _status, _duration, path: search(path) is not None
+    if cond.op in ("=", "!=") and value.endswith("*"):
+        prefix = value[:-1]
+        if cond.op == "=":
+            return lambda _status, _duration, path: path.startswith(prefix)
+        return lambda _status, _duration, path: not path.startswith(prefix)
+    if cond.op == "=":
+        return lambda _status, _duration, path: path == value
+    if cond.op == "!=":
+        return lambda _status, _duration, path: path != value
+    raise RuleSyntaxError(f"Unsupported operator for path: {cond.op!r}")
+
+
+_COMPILERS: dict[str, Callable[[Condition], _Predicate]] = {
+    "status": _compile_status,
+    "duration": _compile_duration,
+    "path": _compile_path,
+}
+
+
+def _compile_conditions(conditions: tuple[Condition, ...]) -> _Predicate:
+    predicates = []
+    for cond in conditions:
+        if cond.field not in _COMPILERS:
+            raise RuleSyntaxError(f"Unknown access log field {cond.field!r}, expected one of {', '.join(_COMPILERS)}")
+        predicates.append(_COMPILERS[cond.field](cond))
+    if not predicates:
+        return lambda _status, _duration, _path: True
+    if len(predicates) == 1:
+        return predicates[0]
+    return lambda status, duration, path: all(p(status, duration, path) for p in predicates)
+
+
+class AccessLogSampler:
+    """Access log sampling rules, compiled once."""
+
+    def __init__(self, rules: str):
+        self.rules = rules
+        self._compiled = [(_compile_conditions(rule.conditions), _parse_rate(rule.action)) for rule in parse_rules(rules)]
+
+    def keep(self, status: int, duration: float, path: str) -> bool:
+        """Whether an access log line should be emitted, `duration` being in seconds."""
+        for predicate, rate in self._compiled:
+            if predicate(status, duration, path):
+                return rate >= 1.0 or (rate > 0.0 and random.random() < rate)  # noqa: S311
+        return True
+
+
+def install_access_sampler(rules: str | None) -> None:
+    """Make the access loggers use these sampling rules, or none at all."""
+    global _sampler  # noqa: PLW0603 # pylint: disable=global-statement
+    _sampler = AccessLogSampler(rules) if rules else None
+
+
+def get_access_sampler() -> AccessLogSampler | None:
+    return _sampler
@@ -0,0 +1,115 @@
+"""Monitor asyncio event loops for lag and slow callbacks, and log their uncaught exceptions.
+
+Nothing is patched until the monitor is installed, so that it costs nothing per loop iteration
+while it is off. Once installed:
+
+- every callback run by an asyncio loop is timed, and the callbacks running for longer than
+  the slow callback threshold are logged on the `loggia.asyncio` logger;
+- a heartbeat is scheduled every lag threshold on each running loop, and heartbeats running later
+  than the lag threshold are logged on the `loggia.asyncio` logger;
+- loops without a custom exception handler log their uncaught exceptions on the `asyncio` logger,
+  as structured records.
+
+Loops that do not derive from asyncio's own implementation, like uvloop's, are not monitored.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+import weakref
+from typing import Any
+
+_original_handle_run = asyncio.Handle._run
+_original_run_forever = asyncio.BaseEventLoop.run_forever
+
+_installed = False
+_slow_callback = 0.1
+_lag_threshold = 0.1
+_heartbeats: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.TimerHandle] = weakref.WeakKeyDictionary()
+
+
+def _describe_callback(handle: asyncio.Handle) -> dict[str, Any]:
+    callback = handle._callback  # type: ignore[attr-defined]
+    task = getattr(callback, "__self__", None)
+    if isinstance(task, asyncio.Task):
+        coro = task.get_coro()
+        return {"asyncio.task": task.get_name(), "asyncio.callback": getattr(coro, "__qualname__", repr(coro))}
+    return {"asyncio.callback": getattr(callback, "__qualname__", repr(callback))}
+
+
+def _timed_handle_run(self: asyncio.Handle) -> None:
+    start = time.perf_counter()
+    _original_handle_run(self)
+    duration = time.perf_counter() - start
+    if duration >= _slow_callback:
+        extra = _describe_callback(self)
+        extra["asyncio.duration_ms"] = round(duration * 1000, 1)
+        logging.getLogger("loggia.asyncio").warning("Slow asyncio callback", extra=extra)
+
+
+def _heartbeat(loop: asyncio.AbstractEventLoop, expected: float) -> None:
+    lag = loop.time() - expected
+    if lag >= _lag_threshold:
+        logging.getLogger("loggia.asyncio").warning("asyncio event loop lag", extra={"asyncio.lag_ms": round(lag * 1000, 1)})
+    _schedule_heartbeat(loop)
+
+
+def _schedule_heartbeat(loop: asyncio.AbstractEventLoop) -> None:
+    previous = _heartbeats.pop(loop, None)
+    if previous is not None:
+        previous.cancel()
+    if _installed and _lag_threshold > 0:
+        when = loop.time() + _lag_threshold
+        _heartbeats[loop] = loop.call_at(when, _heartbeat, loop, when)
+
+
+def _exception_handler(loop: asyncio.AbstractEventLoop, context: dict[str, Any]) -> None:
+    if not _installed:
+        loop.default_exception_handler(context)
+        return
+    extra = {f"asyncio.{key}": repr(value) for key, value in context.items() if key not in ("message", "exception", "source_traceback")}
+    message = context.get("message") or "Unhandled exception in event loop"
+    logging.getLogger("asyncio").error(message, exc_info=context.get("exception"), extra=extra)
+
+
+def _watch_loop(loop: asyncio.AbstractEventLoop) -> None:
+    if loop.get_exception_handler() is None:
+        loop.set_exception_handler(_exception_handler)
+    _schedule_heartbeat(loop)
+
+
+def _monitored_run_forever(self: asyncio.BaseEventLoop) -> None:
+    _watch_loop(self)
+    try:
+        _original_run_forever(self)
+    finally:
+        heartbeat = _heartbeats.pop(self, None)
+        if heartbeat is not None:
+            heartbeat.cancel()
+
+
+def install_asyncio_monitor(enabled: bool, slow_callback: float = 0.1, lag_threshold: float = 0.1) -> None:  # noqa: FBT001
+    """Install the asyncio loop monitor with these thresholds (in seconds), or uninstall it.
+
+    Loops started afterwards are monitored, as well as the loop running in the current thread, if any.
+    A threshold of 0 disables the corresponding check.
+    """
+    global _installed, _slow_callback, _lag_threshold  # noqa: PLW0603 # pylint: disable=global-statement
+    _installed = enabled
+    _slow_callback = slow_callback
+    _lag_threshold = lag_threshold
+
+    timed = enabled and slow_callback > 0
+    asyncio.Handle._run = _timed_handle_run if timed else _original_handle_run  # type: ignore[method-assign]
+    asyncio.BaseEventLoop.run_forever = _monitored_run_forever if enabled else _original_run_forever  # type: ignore[method-assign]
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    if enabled:
+        _watch_loop(loop)
+    else:
+        _schedule_heartbeat(loop)
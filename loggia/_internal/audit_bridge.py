@@ -0,0 +1,109 @@
+"""Bridge from the audit subsystem ([sys.addaudithook][]) to standard logging.
+
+Audit hooks cannot be removed, and audit events such as `open`, `import` or
+`socket.connect` fire extremely often. A single permanent hook is added to the
+interpreter, the first time the bridge is installed. It only costs a global lookup
+and a set lookup for events outside the allowlist. Installing the bridge again
+swaps the allowlist and rate limits in place.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import logging
+    from collections.abc import Iterable
+
+_events: frozenset[str] = frozenset()
+_bridge: AuditBridge | None = None
+_hook_added = False
+
+
+class _EventWindow:
+    __slots__ = ("count", "dropped", "start")
+
+    def __init__(self) -> None:
+        self.start = 0.0
+        self.count = 0
+        self.dropped = 0
+
+
+class AuditBridge:
+    """Logs allowlisted audit events, with a per-event rate limit.
+
+    At most `rate_limit` records are logged per event and per second, a rate limit of 0
+    meaning no limit. The first record of an event logged after some were dropped carries
+    the count in `audit.dropped`.
+
+    A thread-local reentrancy guard drops audit events raised while logging an audit event,
+    i.e. the `open` or `socket.connect` caused by a handler's own I/O.
+    """
+
+    def __init__(self, logger: logging.Logger, events: Iterable[str], rate_limit: float = 0):
+        self.logger = logger
+        self.events = frozenset(events)
+        self.rate_limit = rate_limit
+        self._guard = threading.local()
+        self._lock = threading.Lock()
+        self._windows = {event: _EventWindow() for event in self.events}
+
+    def handle(self, event: str, args: tuple[Any, ...]) -> None:
+        guard = self._guard
+        if event not in self.events or getattr(guard, "active", False):
+            return
+        guard.active = True
+        try:
+            dropped = self._admit(event)
+            if dropped < 0:
+                return
+            extra: dict[str, Any] = {"audit.event": event, "audit.args": [repr(arg) for arg in args]}
+            if dropped:
+                extra["audit.dropped"] = dropped
+            self.logger.info("Audit event %s", event, extra=extra)
+        finally:
+            guard.active = False
+
+    def _admit(self, event: str) -> int:
+        """Return how many events were dropped since the last admitted one, or -1 if this one is dropped."""
+        if self.rate_limit <= 0:
+            return 0
+        now = time.monotonic()
+        with self._lock:
+            window = self._windows[event]
+            dropped = 0
+            if now - window.start >= 1.0:
+                window.start = now
+                window.count = 0
+                dropped, window.dropped = window.dropped, 0
+            if window.count >= self.rate_limit:
+                window.dropped += 1
+                return -1
+            window.count += 1
+            return dropped
+
+
+def _audit_hook(event: str, args: tuple[Any, ...]) -> None:
+    if event not in _events:
+        return
+    if _bridge is not None:
+        _bridge.handle(event, args)
+
+
+def install_audit_bridge(logger: logging.Logger, events: Iterable[str], rate_limit: float = 0) -> AuditBridge:
+    """Log the given audit events through `logger`.
+
+    The allowlist is compiled once into a frozenset here, and the interpreter-wide hook
+    is only added on the first call.
+    """
+    global _events, _bridge, _hook_added  # noqa: PLW0603 # pylint: disable=global-statement
+    bridge = AuditBridge(logger, events, rate_limit)
+    _bridge = bridge
+    _events = bridge.events
+    if not _hook_added:
+        sys.addaudithook(_audit_hook)
+        _hook_added = True
+    return bridge
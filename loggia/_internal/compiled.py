@@ -0,0 +1,94 @@
+"""Ahead-of-time compiled configurations, for processes that start often.
+
+`python -m loggia compile` resolves the presets and `LOGGIA_*` environment variables into a
+[LoggerConfiguration][loggia.conf.LoggerConfiguration] once, and pickles it to a file. Processes
+started with `LOGGIA_COMPILED_CONFIG` pointing to that file load it in `initialize()` instead of
+discovering presets and parsing the environment again.
+
+The file starts with a key hashing all the inputs of the configuration: Loggia's version, Python's
+version and the `LOGGIA_*` environment variables. A file whose key does not match the current
+process is ignored with a warning, and the configuration is resolved as usual.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pickle
+import sys
+from typing import TYPE_CHECKING
+
+from loggia._internal.bootstrap_logger import bootstrap_logger
+from loggia.conf import LoggerConfiguration
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+try:
+    from loggia._version import __version__
+except ImportError:  # pragma: no cover
+    __version__ = "unknown"
+
+COMPILED_CONFIG_ENV = "LOGGIA_COMPILED_CONFIG"
+_FORMAT_VERSION = 1
+
+
+def configuration_key(environ: Mapping[str, str] | None = None) -> str:
+    """Hash the inputs of a configuration resolved from `environ` (by default, the environment)."""
+    environ = os.environ if environ is None else environ
+    inputs = {
+        "format": _FORMAT_VERSION,
+        "loggia": __version__,
+        "python": sys.version,
+        "env": sorted((k, v) for k, v in environ.items() if k.startswith("LOGGIA_") and k != COMPILED_CONFIG_ENV),
+    }
+    return hashlib.sha256(json.dumps(inputs).encode()).hexdigest()
+
+
+def compile_configuration(path: str, conf: LoggerConfiguration | None = None) -> LoggerConfiguration:
+    """Write `conf` (by default, the configuration of the current environment) to `path`.
+
+    The file is replaced atomically, so that processes starting meanwhile read either version.
+    """
+    if conf is None:
+        conf = LoggerConfiguration()
+    try:
+        payload = pickle.dumps(conf, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, AttributeError, TypeError) as e:
+        raise ValueError(
+            f"This configuration cannot be compiled, it holds an object that cannot be pickled (lambdas, closures...): {e}"
+        ) from e
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:  # noqa: PTH123
+            f.write(configuration_key().encode() + b"\n" + payload)
+        os.replace(tmp_path, path)  # noqa: PTH105
+    except BaseException:
+        try:
+            os.unlink(tmp_path)  # noqa: PTH108
+        except FileNotFoundError:
+            pass
+        raise
+    return conf
+
+
+def load_compiled_configuration() -> LoggerConfiguration | None:
+    """Return the configuration compiled at `LOGGIA_COMPILED_CONFIG`, or None if it is unset, unreadable or stale."""
+    path = os.environ.get(COMPILED_CONFIG_ENV)
+    if not path:
+        return None
+    try:
+        with open(path, "rb") as f:  # noqa: PTH123
+            stale = f.readline().rstrip(b"\n").decode() != configuration_key()
+            conf = None if stale else pickle.load(f)  # noqa: S301 - written by `python -m loggia compile`, trusted like the code
+    except Exception as e:  # noqa: BLE001
+        bootstrap_logger.warn(f"Ignoring unreadable compiled configuration {path}", e)
+        return None
+    if stale:
+        bootstrap_logger.warn(f"Ignoring stale compiled configuration {path}, run `python -m loggia compile` again")
+        return None
+    if not isinstance(conf, LoggerConfiguration):
+        bootstrap_logger.warn(f"Ignoring compiled configuration {path}, it does not hold a LoggerConfiguration")
+        return None
+    return conf
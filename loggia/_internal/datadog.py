@@ -0,0 +1,29 @@
+"""Lazy access to `ddtrace`, which is only imported when `DD_TRACE_ENABLED` is set."""
+
+from __future__ import annotations
+
+import os
+from functools import cache
+from typing import TYPE_CHECKING, cast
+
+from loggia._internal.bootstrap_logger import bootstrap_logger
+from loggia._internal.conf import is_truthy_string
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+
+@cache
+def get_ddtrace() -> ModuleType | None:
+    """Return the `ddtrace` module if `DD_TRACE_ENABLED` is set and it can be imported, None otherwise.
+
+    The environment is read, and `ddtrace` imported, on the first call only.
+    """
+    if not is_truthy_string(os.environ.get("DD_TRACE_ENABLED", "")):
+        return None
+    try:
+        import ddtrace
+    except ImportError:
+        bootstrap_logger.error("DD_TRACE_ENABLED environment variable is set but ddtrace package cannot be loaded")
+        return None
+    return cast("ModuleType", ddtrace)
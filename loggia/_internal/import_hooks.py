@@ -0,0 +1,65 @@
+"""Run code right after a module gets imported, to configure optional integrations without importing them."""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+from typing import TYPE_CHECKING, Any, Callable
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from importlib.machinery import ModuleSpec
+    from types import ModuleType
+
+
+class _PostImportFinder:
+    """A [sys.meta_path][] finder that wraps the loader of a single module, then uninstalls itself."""
+
+    def __init__(self, name: str, callback: Callable[[ModuleType], None]):
+        self.name = name
+        self.callback = callback
+
+    def find_spec(self, fullname: str, path: Sequence[str] | None, target: ModuleType | None = None) -> ModuleSpec | None:
+        if fullname != self.name:
+            return None
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec: ModuleSpec | None = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+        loader: Any = spec.loader
+        if loader is None or not hasattr(loader, "exec_module"):
+            return spec
+        exec_module = loader.exec_module
+
+        def _exec_module(module: ModuleType) -> None:
+            exec_module(module)
+            uninstall(self.name)
+            self.callback(module)
+
+        loader.exec_module = _exec_module
+        return spec
+
+
+def when_imported(name: str, callback: Callable[[ModuleType], None]) -> None:
+    """Call `callback` with the top-level module `name` right after its first import, or right now if it is already imported.
+
+    Registering a new callback for the same module replaces the previous one. Nothing is registered
+    for a module that is not installed: every import would otherwise go through the hook for nothing.
+    """
+    uninstall(name)
+    module = sys.modules.get(name)
+    if module is not None:
+        callback(module)
+        return
+    if importlib.util.find_spec(name) is None:
+        return
+    sys.meta_path.insert(0, _PostImportFinder(name, callback))
+
+
+def uninstall(name: str) -> None:
+    """Forget the callback registered for the module `name`, if any."""
+    sys.meta_path[:] = [f for f in sys.meta_path if not (isinstance(f, _PostImportFinder) and f.name == name)]
@@ -0,0 +1,186 @@
+"""Loggia's logger class, for what has to happen before a record is created.
+
+By the time filters run, Python already walked the stack in `findCaller` and allocated the
+`LogRecord`: a filter dropping a record does not save either. `LoggiaLogger` overrides
+`Logger._log`, the method every enabled logging call goes through, to reject records from
+their logger name, level and message template first.
+
+It also marks records logged with a `stacklevel`, whose location is not the logging call,
+so that the Dev preset's [PrettyFormatter][loggia.stdlib_formatters.pretty_formatter.PrettyFormatter]
+shows their file name.
+
+Caller locations are found without `Logger.findCaller`, which walks from its own frame and
+normalizes the file name of every frame: the caller is a known number of frames above
+`_log`, past the frames of the logging module itself. Location capture can be turned
+off for some loggers, whose records then have an unknown file, line and function.
+
+With `LOGGIA_METRICS_SUPPRESSED`, the logging calls rejected by the level of their logger are
+counted in [loggia.metrics][]. They never reach `_log`: they are counted in `isEnabledFor`,
+which is only overridden while counting.
+
+The class is only installed when one of its features is configured: plain loggers do not
+pay for an extra Python call. Installing it makes it the logger class for new loggers, and
+swaps the class of existing `logging.Logger` and `logging.RootLogger` instances. Loggers of
+other classes, set by third-party libraries, are left alone.
+"""
+
+from __future__ import annotations
+
+import logging
+import sys
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from types import FrameType
+
+    from loggia.filters.filter_rules import FilterRules
+    from loggia.metrics import LoggingMetrics
+
+_UNKNOWN_CALLER = ("(unknown file)", 0, "(unknown function)")
+_LOGGING_FILENAME = logging.Logger._log.__code__.co_filename
+
+_pre_filter: FilterRules | None = None
+_mark_stacklevel = False
+_caller_settings: dict[str, bool] = {}
+_caller_enabled: dict[str, bool] = {}
+_metrics: LoggingMetrics | None = None
+
+
+def _find_caller(stacklevel: int) -> tuple[str, int, str]:
+    # 0 is this function, 1 is LoggiaLogger._log, 2 is what called it: usually Logger.info and the like
+    f: FrameType | None = sys._getframe(2)
+    while True:
+        while f is not None and f.f_code.co_filename == _LOGGING_FILENAME:
+            f = f.f_back
+        if stacklevel <= 1 or f is None:
+            break
+        f = f.f_back
+        stacklevel -= 1
+    if f is None:
+        return _UNKNOWN_CALLER
+    code = f.f_code
+    return code.co_filename, f.f_lineno, code.co_name
+
+
+def _counting_is_enabled_for(self: logging.Logger, level: int) -> bool:
+    enabled = logging.Logger.isEnabledFor(self, level)
+    if not enabled and _metrics is not None:
+        _metrics.count_suppressed(self.name, level)
+    return enabled
+
+
+def _is_caller_enabled(name: str) -> bool:
+    enabled = _caller_enabled.get(name)
+    if enabled is None:
+        # Like levels, settings apply to a logger and its children
+        candidate = name
+        while candidate not in _caller_settings and "." in candidate:
+            candidate = candidate.rpartition(".")[0]
+        enabled = _caller_settings.get(candidate, _caller_settings.get("", True))
+        _caller_enabled[name] = enabled
+    return enabled
+
+
+class LoggiaLogger(logging.Logger):
+    def _log(  # noqa: PLR0913, PLR0917
+        self,
+        level: int,
+        msg: object,
+        args: Any,
+        exc_info: Any = None,
+        extra: Mapping[str, object] | None = None,
+        stack_info: bool = False,  # noqa: FBT001, FBT002
+        stacklevel: int = 1,
+    ) -> None:
+        if _pre_filter is not None and not _pre_filter.keep(self.name, level, msg):
+            return
+        if _mark_stacklevel and stacklevel != 1:
+            # Never mutate the caller's extra dict, which may be shared with other threads
+            extra = {**(extra or {}), "_fmt_with_filename": True}
+
+        sinfo = None
+        if logging._srcfile is None or (_caller_settings and not _is_caller_enabled(self.name)):
+            fn, lno, func = _UNKNOWN_CALLER
+        elif stack_info:
+            # One more frame to skip in findCaller: this one
+            fn, lno, func, sinfo = self.findCaller(stack_info, stacklevel + 1)
+        else:
+            fn, lno, func = _find_caller(stacklevel)
+
+        if exc_info:
+            if isinstance(exc_info, BaseException):
+                exc_info = (type(exc_info), exc_info, exc_info.__traceback__)
+            elif not isinstance(exc_info, tuple):
+                exc_info = sys.exc_info()
+        record = self.makeRecord(self.name, level, fn, lno, msg, args, exc_info, func, extra, sinfo)
+        self.handle(record)
+
+
+class LoggiaRootLogger(LoggiaLogger, logging.RootLogger):
+    pass
+
+
+_SWAPS: dict[type[logging.Logger], type[logging.Logger]] = {logging.Logger: LoggiaLogger, logging.RootLogger: LoggiaRootLogger}
+_UNSWAPS = {v: k for k, v in _SWAPS.items()}
+
+
+def _swap_classes(swaps: dict[type[logging.Logger], type[logging.Logger]]) -> None:
+    loggers = [logging.root, *(logger for logger in list(logging.root.manager.loggerDict.values()) if isinstance(logger, logging.Logger))]
+    for logger in loggers:
+        if type(logger) in swaps:
+            logger.__class__ = swaps[type(logger)]
+
+
+def install() -> None:
+    """Make LoggiaLogger the class of new and existing plain loggers."""
+    if logging.getLoggerClass() is logging.Logger:
+        logging.setLoggerClass(LoggiaLogger)
+    _swap_classes(_SWAPS)
+
+
+def uninstall() -> None:
+    """Turn loggers back into plain loggers."""
+    if logging.getLoggerClass() is LoggiaLogger:
+        logging.setLoggerClass(logging.Logger)
+    _swap_classes(_UNSWAPS)
+
+
+def configure(
+    pre_filter_rules: str | None,
+    *,
+    mark_stacklevel: bool = False,
+    callers: Mapping[str, bool] | None = None,
+    count_suppressed: bool = False,
+) -> None:
+    """Configure LoggiaLogger's features, and install or uninstall it as needed.
+
+    Records matching `pre_filter_rules` are rejected before they are created. With `mark_stacklevel`,
+    records logged with a `stacklevel` carry a `_fmt_with_filename` attribute. `callers` maps logger
+    names to whether their records, and those of their children, capture their caller's location.
+    With `count_suppressed`, the calls rejected by the level of their logger are counted in [loggia.metrics][].
+    """
+    global _pre_filter, _mark_stacklevel, _caller_settings, _caller_enabled, _metrics  # noqa: PLW0603 # pylint: disable=global-statement
+    if pre_filter_rules:
+        from loggia.filters.filter_rules import FilterRules
+
+        _pre_filter = FilterRules(pre_filter_rules)
+    else:
+        _pre_filter = None
+    _mark_stacklevel = mark_stacklevel
+    _caller_settings = dict(callers or {})
+    _caller_enabled = {}
+    if count_suppressed:
+        from loggia.metrics import metrics
+
+        _metrics = metrics
+        LoggiaLogger.isEnabledFor = _counting_is_enabled_for  # type: ignore[method-assign]
+    else:
+        _metrics = None
+        if "isEnabledFor" in vars(LoggiaLogger):
+            # Back to the inherited method, so that loggers that do not count do not pay for it
+            del LoggiaLogger.isEnabledFor
+    if _pre_filter is not None or _mark_stacklevel or _caller_settings or count_suppressed:
+        install()
+    else:
+        uninstall()
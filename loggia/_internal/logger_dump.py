@@ -0,0 +1,122 @@
+"""Dump the live logger tree on a signal.
+
+The dump is written straight to the standard error file descriptor, without going through
+logging: the signal handler runs on the main thread, possibly while it holds a handler's
+lock or is in the middle of a write to `sys.stderr`.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import signal
+import sys
+import threading
+from typing import TYPE_CHECKING, Any
+
+from loggia.metrics import metrics
+
+if TYPE_CHECKING:
+    from types import FrameType
+
+_installed_signal: int | None = None
+_previous_handler: Any = None
+
+
+def parse_signal(value: str | int) -> int:
+    """Turn `SIGUSR1`, `USR1`, `usr1` or `10` into a signal number."""
+    if isinstance(value, int) or value.isdigit():
+        return signal.Signals(int(value)).value
+    name = value.strip().upper()
+    if not name.startswith("SIG"):
+        name = f"SIG{name}"
+    try:
+        return signal.Signals[name].value
+    except KeyError:
+        raise ValueError(f"Unknown signal: {value!r}") from None
+
+
+def _filter_name(filter_: Any) -> str:
+    filter_ = getattr(filter_, "wrapped", filter_)
+    if isinstance(filter_, type):
+        return filter_.__name__
+    return getattr(filter_, "__name__", None) or type(filter_).__name__
+
+
+def _describe_handler(handler: logging.Handler) -> str:
+    desc = f"{type(handler).__name__}(level={logging.getLevelName(handler.level)}"
+    if handler.formatter is not None:
+        desc += f", formatter={type(handler.formatter).__name__}"
+    if handler.filters:
+        desc += f", filters=[{', '.join(_filter_name(f) for f in handler.filters)}]"
+    return desc + ")"
+
+
+def _describe_logger(logger: logging.Logger, counts: dict[str, dict[str, dict[str, int]]]) -> str:
+    name = "root" if logger is logging.root else logger.name
+    depth = 0 if logger is logging.root else logger.name.count(".") + 1
+    parts = [
+        f"{'  ' * depth}{name}",
+        f"level={logging.getLevelName(logger.level)}",
+        f"effective={logging.getLevelName(logger.getEffectiveLevel())}",
+        f"propagate={logger.propagate}",
+    ]
+    if logger.disabled:
+        parts.append("disabled=True")
+    if logger.handlers:
+        parts.append(f"handlers=[{', '.join(_describe_handler(h) for h in logger.handlers)}]")
+    if logger.filters:
+        parts.append(f"filters=[{', '.join(_filter_name(f) for f in logger.filters)}]")
+    levels = counts.get(logger.name)
+    if levels:
+        records = sum(c["records"] for c in levels.values())
+        dropped = sum(c["dropped"] for c in levels.values())
+        parts.append(f"records={records} dropped={dropped}")
+        if metrics.suppressed:
+            parts.append(f"suppressed={sum(c['suppressed'] for c in levels.values())}")
+    return " ".join(parts)
+
+
+def format_logger_tree() -> str:
+    """Describe every logger known to the logging manager, with its handlers, filters and activity.
+
+    Activity counts are only available when [loggia.metrics][] are enabled. The calls rejected by the
+    level of each logger are only counted with `LOGGIA_METRICS_SUPPRESSED`.
+    """
+    counts = metrics.snapshot(timeout=0.1) if metrics.enabled else {}
+    loggers: list[logging.Logger] = [logging.root]
+    # Copy: the logger dict may be mutated by another thread while we iterate
+    logger_dict = dict(logging.Logger.manager.loggerDict)
+    for name in sorted(logger_dict, key=lambda name: name.split(".")):
+        logger = logger_dict[name]
+        if isinstance(logger, logging.Logger):
+            loggers.append(logger)
+    header = f"Logger tree of process {os.getpid()} (metrics {'enabled' if metrics.enabled else 'disabled'}):"
+    return "\n".join([header, *(_describe_logger(logger, counts) for logger in loggers)]) + "\n"
+
+
+def dump_logger_tree(fd: int | None = None) -> None:
+    """Write the logger tree to a file descriptor, standard error by default."""
+    if fd is None:
+        fd = sys.__stderr__.fileno() if sys.__stderr__ is not None else 2
+    data = format_logger_tree().encode("utf-8", errors="replace")
+    while data:
+        written = os.write(fd, data)
+        data = data[written:]
+
+
+def _on_signal(_signum: int, _frame: FrameType | None) -> None:
+    dump_logger_tree()
+
+
+def install_dump_signal(signum: int | None) -> None:
+    """Dump the logger tree when receiving `signum`, or restore the previous signal handler when None."""
+    global _installed_signal, _previous_handler  # noqa: PLW0603 # pylint: disable=global-statement
+    if threading.current_thread() is not threading.main_thread():
+        return
+    if _installed_signal is not None and _installed_signal != signum:
+        signal.signal(_installed_signal, _previous_handler)
+        _installed_signal = _previous_handler = None
+    if signum is not None and _installed_signal is None:
+        _previous_handler = signal.signal(signum, _on_signal)
+        _installed_signal = signum
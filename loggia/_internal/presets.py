@@ -1,12 +1,11 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from pathlib import Path
-from typing import TYPE_CHECKING, Callable, TypeVar
+from typing import TYPE_CHECKING, Callable, NamedTuple, TypeVar, Union
 
 from loggia._internal.bootstrap_logger import bootstrap_logger as logger
 from loggia.base_preset import BasePreset
-from loggia.utils.loaderutils import import_all_files, import_fqn
+from loggia.utils.loaderutils import import_fqn
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
@@ -19,11 +18,41 @@ _PresetRequirementAcceptor = Callable[[set[type[BasePreset]]], bool]
 _PRESET_REQUIREMENT_ACCEPTORS: dict[type[BasePreset], _PresetRequirementAcceptor] = {}
 
 
+class _BuiltinPreset(NamedTuple):
+    """What Presets needs to know about a built-in preset before importing it."""
+
+    fqn: str
+    slots: tuple[str, ...] = ()
+    opt_in: bool = False
+
+
+# Built-in presets by preference key. Their modules are only imported once selected.
+# Keep this in sync with the loggia.presets package, tests check that it is.
+_BUILTIN_PRESETS: dict[str, _BuiltinPreset] = {
+    "asyncio_monitor": _BuiltinPreset("loggia.presets.asyncio_monitor.AsyncioMonitor", opt_in=True),
+    "datadog_normalisation": _BuiltinPreset("loggia.presets.datadog_normalisation.DatadogNormalisation", slots=("normalization",)),
+    "dev": _BuiltinPreset("loggia.presets.dev.Dev", slots=("main",)),
+    "gc_monitor": _BuiltinPreset("loggia.presets.gc_monitor.GcMonitor", opt_in=True),
+    "gunicorn": _BuiltinPreset("loggia.presets.gunicorn.Gunicorn"),
+    "hypercorn": _BuiltinPreset("loggia.presets.hypercorn.Hypercorn"),
+    "null_preset": _BuiltinPreset("loggia.presets.null_preset.NullPreset"),
+    "prod": _BuiltinPreset("loggia.presets.prod.Prod", slots=("main",)),
+}
+
+# Built-in presets can also be named by their lowercased class name
+_BUILTIN_PRESET_ALIASES: dict[str, str] = {
+    **{builtin.fqn.rsplit(".", 1)[-1].lower(): key for key, builtin in _BUILTIN_PRESETS.items()},
+    **{key: key for key in _BUILTIN_PRESETS},
+}
+
+_PresetCandidate = Union[type[BasePreset], _BuiltinPreset]
+
+
 def _constantly_true(_available_presets: set[type[BasePreset]]) -> bool:
     return True
 
 
-def _make_preset_requirement_acceptor(preset: type[BasePreset]) -> None:
+def _make_preset_requirement_acceptor(preset: type[BasePreset]) -> _PresetRequirementAcceptor:
     requirements = preset.required_presets()
 
     def _requirements_acceptor(available_presets: set[type[BasePreset]]) -> bool:
@@ -36,22 +65,23 @@ def _make_preset_requirement_acceptor(preset: type[BasePreset]) -> None:
         return False
 
     if len(requirements) == 0:
-        _PRESET_REQUIREMENT_ACCEPTORS[preset] = _constantly_true
-    else:
-        _PRESET_REQUIREMENT_ACCEPTORS[preset] = _requirements_acceptor
+        return _constantly_true
+    return _requirements_acceptor
 
 
 def _meets_requirements(preset: type[BasePreset], available_presets: set[type[BasePreset]]) -> bool:
-    if preset not in _PRESET_REQUIREMENT_ACCEPTORS:
-        _make_preset_requirement_acceptor(preset)
-    return _PRESET_REQUIREMENT_ACCEPTORS[preset](available_presets)
+    acceptor = _PRESET_REQUIREMENT_ACCEPTORS.get(preset)
+    if acceptor is None:
+        # Threads racing here build equivalent acceptors: the first one stored wins, without a lock
+        acceptor = _PRESET_REQUIREMENT_ACCEPTORS.setdefault(preset, _make_preset_requirement_acceptor(preset))
+    return acceptor(available_presets)
 
 
 class Presets:
     """Internal utilities to manage a herd of preset types.
 
     Notably in scope:
-    - Dynamic loading/importing of presets by package path or FQN
+    - Lazy importing of built-in presets, and dynamic loading of presets by FQN
     - Slots resolution
     - deal with LOGIA_PRESETS
     """
@@ -62,58 +92,63 @@ class Presets:
     def __init__(self, preset_preferences: Iterable[str] | None = None):
         # We default to production presets.
         self.preset_preferences = {e.lower() for e in preset_preferences} if preset_preferences else {"prod"}
-        builtin_presets = [] if self._skip_builtins else self._load_builtins()
-        builtin_preset_names = {preset.__name__.lower() for preset in builtin_presets}
+        # Built-in presets named by class name are preferred by preference key
+        self.preset_preferences |= {_BUILTIN_PRESET_ALIASES[e] for e in self.preset_preferences if e in _BUILTIN_PRESET_ALIASES}
 
-        self.unslotted_presets: list[type[BasePreset]] = []
-        self.slotted_presets: dict[str, list[type[BasePreset]]] = defaultdict(list)
+        # Candidates by preference key, with their slots
+        self.candidates: dict[str, tuple[tuple[str, ...], _PresetCandidate]] = {}
 
-        # Index all built-in presets by their slots if possible
-        # This allows us to discover the built-in slots
-        for preset in builtin_presets:
-            self._register_preset(preset)
+        # Register built-in presets without importing them: this also discovers the built-in slots
+        if not self._skip_builtins:
+            for key, builtin in _BUILTIN_PRESETS.items():
+                # Opt-in presets only apply when explicitely requested
+                if not builtin.opt_in or key in self.preset_preferences:
+                    self.candidates[key] = (builtin.slots, builtin)
 
         # Dynamically load non-builtin presets
         for prepre in preset_preferences or []:
-            if prepre not in builtin_preset_names:
+            if prepre.lower() not in _BUILTIN_PRESET_ALIASES:
                 if "." not in prepre:
                     logger.error(f"Preset preference {prepre} matches no builtin and is not a fully qualified name")
                 else:
                     try:
-                        preset = self._load_preset_fqn(prepre)
-                        self._register_preset(preset)
+                        preset: type[BasePreset] = self._load_preset_fqn(prepre)
+                        self.candidates[preset.preference_key()] = (tuple(preset.slots()), preset)
                         self.preset_preferences.add(preset.preference_key())
                     except ImportError as e:
                         logger.error(f"Preset preference {prepre} matches no builtin and cannot be imported either: {e}")
 
         # Narrow down presets in the same slot
         selected_slotted_presets = self._select_slotted_presets()
+        unslotted_presets = [key for key, (slots, _) in self.candidates.items() if not slots]
 
         # Further narrow down presets by removing the ones with missing dependencies
-        available_presets = set(self.unslotted_presets + list(selected_slotted_presets.values()))
+        available_presets = {self._import_candidate(key) for key in [*unslotted_presets, *selected_slotted_presets.values()]}
         self._trim_presets(available_presets)
 
         # Expose the result as a set of preset types
         self.available_presets = available_presets
 
-    def _register_preset(self, preset: type[BasePreset]) -> None:
-        slots = preset.slots()
-        if len(slots) == 0:
-            self.unslotted_presets.append(preset)
-        else:
+    def _import_candidate(self, key: str) -> type[BasePreset]:
+        _, candidate = self.candidates[key]
+        if isinstance(candidate, _BuiltinPreset):
+            return self._load_preset_fqn(candidate.fqn)
+        return candidate
+
+    def _select_slotted_presets(self) -> dict[str, str]:
+        """Make sure only one preset is applied for a given slot, and return the preference key of each slot's preset."""
+        slotted_presets: dict[str, list[str]] = defaultdict(list)
+        for key, (slots, _) in self.candidates.items():
             for slot in slots:
-                self.slotted_presets[slot].append(preset)
-
-    def _select_slotted_presets(self) -> dict[str, type[BasePreset]]:
-        """Make sure only one preset is applied for a given slot."""
-        selected_slotted_presets: dict[str, type[BasePreset]] = {}
-        for slot, presets in self.slotted_presets.items():
-            if len(presets) == 1:
-                selected_slotted_presets[slot] = presets[0]
+                slotted_presets[slot].append(key)
+
+        selected_slotted_presets: dict[str, str] = {}
+        for slot, keys in slotted_presets.items():
+            if len(keys) == 1:
+                selected_slotted_presets[slot] = keys[0]
                 continue
 
-            indexed_presets = {preset.preference_key(): preset for preset in presets}
-            indexed_preset_keys = set(indexed_presets.keys())
+            indexed_preset_keys = set(keys)
             solutions = indexed_preset_keys.intersection(self.preset_preferences)
 
             if len(solutions) == 0:
@@ -135,7 +170,7 @@ class Presets:
                 )
             else:
                 solution = solutions.pop()
-            selected_slotted_presets[slot] = indexed_presets[solution]
+            selected_slotted_presets[slot] = solution
         return selected_slotted_presets
 
     def _trim_presets(self, available_presets: set[type[BasePreset]]) -> None:
@@ -154,17 +189,6 @@ class Presets:
                 available_presets.remove(preset)
             deleted_something = len(to_delete) > 0
 
-    def _load_builtins(self) -> list[type[BasePreset]]:
-        base_dir = (Path(__file__).parent / "../..").resolve()
-        all_preset_modules = import_all_files("loggia/presets", base_dir=base_dir)
-        results: list[type[BasePreset]] = []
-        for mod in all_preset_modules:
-            for thing_name in dir(mod):
-                thing = getattr(mod, thing_name)
-                if isinstance(thing, type) and issubclass(thing, BasePreset) and thing is not BasePreset:
-                    results.append(thing)
-        return results
-
     def _load_preset_fqn(self, fqn: str) -> type[_PresetT_co]:  # pyright: ignore[reportInvalidTypeVarUse]
         # XXX(dugab): We may be able to type that in 3.12 with Generic Functions
         return import_fqn(fqn, ensure_subclass_of=BasePreset)  # type: ignore[arg-type] # pyright: ignore[reportGeneralTypeIssues]
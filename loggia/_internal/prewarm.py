@@ -0,0 +1,72 @@
+"""Run synthetic records through the configured handlers at startup, so that one-time costs do not land on a live request.
+
+The first record with a traceback, with extra attributes or through a given formatter pays for lazy
+imports, regular expression compilation and `linecache` loads. Warming up filters and formats a
+record of each kind with every handler, but writes nothing: handlers do not handle nor emit the
+records, so that their side effects, like Loggia's metrics, are left untouched.
+
+Only the filters known to hold no state are run. Others, like
+[ExceptionDedup][loggia.filters.exception_dedup.ExceptionDedup] or a rate limit, would count
+the synthetic records as real ones, and are skipped.
+"""
+
+from __future__ import annotations
+
+import logging
+import sys
+import time
+from typing import TYPE_CHECKING, Any
+
+from loggia._internal.bootstrap_logger import bootstrap_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+_STATELESS_FILTERS = frozenset({"logging.Filter", "loggia.filters.extra_allow.ExtraAllow", "loggia.filters.filter_rules.FilterRules"})
+
+
+def _is_stateless(filter_: Any) -> bool:
+    cls = type(filter_)
+    return f"{cls.__module__}.{cls.__qualname__}" in _STATELESS_FILTERS
+
+
+def _raise() -> None:
+    raise ValueError("Loggia warm-up")
+
+
+def _records() -> list[logging.LogRecord]:
+    logger = logging.getLogger("loggia.prewarm")
+    try:
+        _raise()
+    except ValueError:
+        exc_info = sys.exc_info()
+    extra = {"prewarm.str": "value", "prewarm.int": 1, "prewarm.float": 1.5, "prewarm.list": [1, "2"], "prewarm.dict": {"a": None}}
+    return [
+        logger.makeRecord(logger.name, logging.INFO, __file__, 0, "Loggia warm-up %s", ("record",), None),
+        logger.makeRecord(logger.name, logging.WARNING, __file__, 0, "Loggia warm-up", (), None, extra=extra),
+        logger.makeRecord(logger.name, logging.ERROR, __file__, 0, "Loggia warm-up", (), exc_info),
+    ]
+
+
+def _prewarm_handler(handler: logging.Handler) -> None:
+    # Unwrapped from stage timings, so that the warm-up is not timed either
+    filters: list[Any] = [filter_ for filter_ in (getattr(f, "wrapped", f) for f in handler.filters) if _is_stateless(filter_)]
+    try:
+        for record in _records():
+            if all(filter_.filter(record) for filter_ in filters):
+                handler.format(record)
+    except Exception as e:  # noqa: BLE001
+        bootstrap_logger.warn(f"Warming up the handler {handler!r} failed", e)
+
+
+def prewarm(loggers: Iterable[logging.Logger]) -> float:
+    """Filter and format a plain record, a record with extras and a record with an exception with each handler of `loggers`.
+
+    Returns the time it took, in seconds.
+    """
+    start = time.perf_counter()
+    handlers = list(dict.fromkeys(handler for logger in loggers for handler in logger.handlers))
+    for handler in handlers:
+        _prewarm_handler(handler)
+    return time.perf_counter() - start
@@ -0,0 +1,86 @@
+"""Skip computing the record attributes that no formatter or filter reads ("lean records").
+
+Every `LogRecord` gets `thread` and `threadName`, `process`, `processName` and, from Python
+3.12, `taskName`, unless the `logging.logThreads`, `logging.logProcesses`,
+`logging.logMultiprocessing` and `logging.logAsyncioTasks` flags are unset. They cost
+calls to `threading.current_thread()`, `os.getpid()`, a `sys.modules` lookup and
+`asyncio.current_task()` per record.
+
+Formatters and filters tell which standard record attributes they read with a
+`record_fields()` method. The fields of a plain [logging.Formatter][] are read from its
+format string. Flags are unset when none of the formatters and filters of the existing
+loggers and handlers read their attributes. When any of them is not known, or is a handler
+other than a [logging.StreamHandler][], every flag is left alone.
+
+Flags are evaluated in `initialize()`: handlers and filters added afterwards are not taken into account.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+_FLAGS = {
+    "logThreads": ("thread", "threadName"),
+    "logProcesses": ("process",),
+    "logMultiprocessing": ("processName",),
+    "logAsyncioTasks": ("taskName",),
+}
+
+_RECORD_ATTRS = frozenset(logging.makeLogRecord({}).__dict__) | {"asctime", "message"}
+
+# Flag values from before Loggia unset them, to restore
+_saved: dict[str, bool] = {}
+
+
+def record_fields(obj: object) -> frozenset[str] | None:
+    """The standard record attributes a formatter or filter reads, or None when unknown."""
+    method = getattr(obj, "record_fields", None)
+    if method is not None:
+        return frozenset(method())
+    if type(obj) is logging.Formatter:
+        fmt = obj._fmt or ""
+        return frozenset(field for field in _RECORD_ATTRS if field in fmt)
+    if type(obj) is logging.Filter:
+        return frozenset({"name"})
+    return None
+
+
+def _consumers() -> Iterator[object]:
+    loggers = [logging.root, *(logger for logger in list(logging.root.manager.loggerDict.values()) if isinstance(logger, logging.Logger))]
+    handlers = dict.fromkeys(handler for logger in loggers for handler in logger.handlers)
+    for logger in loggers:
+        yield from logger.filters
+    for handler in handlers:
+        if not isinstance(handler, (logging.StreamHandler, logging.NullHandler)):
+            yield handler
+        yield from handler.filters
+        yield handler.formatter or logging._defaultFormatter  # type: ignore[attr-defined]
+
+
+def consumed_fields() -> frozenset[str] | None:
+    """The standard record attributes read by the formatters and filters of all loggers and handlers, or None when unknown."""
+    fields: set[str] = set()
+    for consumer in _consumers():
+        consumer_fields = record_fields(consumer)
+        if consumer_fields is None:
+            return None
+        fields |= consumer_fields
+    return frozenset(fields)
+
+
+def configure(*, enabled: bool) -> None:
+    """Unset the flags of the record attributes nobody reads, or restore them all."""
+    for flag, value in _saved.items():
+        setattr(logging, flag, value)
+    _saved.clear()
+    fields = consumed_fields() if enabled else None
+    if fields is None:
+        return
+    for flag, flag_fields in _FLAGS.items():
+        if hasattr(logging, flag) and fields.isdisjoint(flag_fields):
+            _saved[flag] = getattr(logging, flag)
+            setattr(logging, flag, False)
@@ -0,0 +1,117 @@
+r"""A tiny declarative rule language, shared by Loggia's rule-based settings.
+
+Rules are separated by semicolons, and read as `conditions -> action`:
+
+    status>=400 -> keep; path=/healthz -> drop; duration>0.5 and status<300 -> keep; * -> 0.01
+
+- Conditions are joined by `and`, and are made of a field, an operator
+  (`=`, `!=`, `<`, `<=`, `>`, `>=` or `~` for regular expressions) and a value.
+- Values may be double-quoted to contain spaces, semicolons or operators. Inside quotes,
+  `\"` and `\\` stand for a quote and a backslash, and other backslashes are kept as is,
+  so that regular expressions like `"^/api/v\d+"` can be quoted unchanged.
+- `*` is a condition that always matches.
+
+This module only parses: the meaning of fields, values and actions is up to the caller.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import NamedTuple
+
+_TOKEN_RE = re.compile(
+    r"""\s*(?:
+        (?P<string>"(?:[^"\\]|\\.)*")
+      | (?P<arrow>->)
+      | (?P<op><=|>=|!=|=|<|>|~)
+      | (?P<semicolon>;)
+      | (?P<word>(?:(?!->)[^\s"<>=!~;])+)
+    )""",
+    re.VERBOSE,
+)
+
+
+class Condition(NamedTuple):
+    field: str
+    op: str
+    value: str
+
+
+class Rule(NamedTuple):
+    conditions: tuple[Condition, ...]
+    action: str
+
+    @property
+    def is_catch_all(self) -> bool:
+        return not self.conditions
+
+
+class RuleSyntaxError(ValueError):
+    pass
+
+
+def _tokenize(text: str) -> list[tuple[str, str]]:
+    tokens: list[tuple[str, str]] = []
+    pos = 0
+    text = text.rstrip()
+    while pos < len(text):
+        m = _TOKEN_RE.match(text, pos)
+        if m is None or m.end() == pos:
+            raise RuleSyntaxError(f"Unexpected character at position {pos} in rules: {text!r}")
+        kind = m.lastgroup
+        assert kind is not None  # noqa: S101
+        value = m.group(kind)
+        if kind == "string":
+            value = re.sub(r'\\(["\\])', r"\1", value[1:-1])
+        tokens.append((kind, value))
+        pos = m.end()
+    return tokens
+
+
+def _parse_rule(tokens: list[tuple[str, str]], text: str) -> Rule:
+    if ("arrow", "->") not in tokens:
+        raise RuleSyntaxError(f"Missing '->' in rule: {text!r}")
+    arrow = tokens.index(("arrow", "->"))
+    lhs, rhs = tokens[:arrow], tokens[arrow + 1 :]
+    if len(rhs) != 1 or rhs[0][0] not in ("word", "string"):
+        raise RuleSyntaxError(f"Expected a single action after '->' in rule: {text!r}")
+    action = rhs[0][1]
+
+    if lhs == [("word", "*")]:
+        return Rule((), action)
+
+    conditions: list[Condition] = []
+    idx = 0
+    while idx < len(lhs):
+        chunk = lhs[idx : idx + 3]
+        if len(chunk) != 3 or chunk[0][0] != "word" or chunk[1][0] != "op" or chunk[2][0] not in ("word", "string"):  # noqa: PLR2004
+            raise RuleSyntaxError(f"Expected 'field operator value' conditions in rule: {text!r}")
+        conditions.append(Condition(chunk[0][1], chunk[1][1], chunk[2][1]))
+        idx += 3
+        if idx < len(lhs):
+            if lhs[idx] != ("word", "and"):
+                raise RuleSyntaxError(f"Expected 'and' between conditions in rule: {text!r}")
+            idx += 1
+            if idx == len(lhs):
+                raise RuleSyntaxError(f"Dangling 'and' in rule: {text!r}")
+    if not conditions:
+        raise RuleSyntaxError(f"Missing condition in rule: {text!r}")
+    return Rule(tuple(conditions), action)
+
+
+def parse_rules(text: str) -> list[Rule]:
+    """Parse a semicolon separated list of rules.
+
+    Raises:
+        RuleSyntaxError: If the rules are malformed.
+    """
+    rules: list[Rule] = []
+    current: list[tuple[str, str]] = []
+    for token in [*_tokenize(text), ("semicolon", ";")]:
+        if token[0] != "semicolon":
+            current.append(token)
+            continue
+        if current:
+            rules.append(_parse_rule(current, text))
+        current = []
+    return rules
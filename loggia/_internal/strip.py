@@ -0,0 +1,76 @@
+"""Replace the logging methods of disabled levels by no-op functions ("strip below level").
+
+A disabled `logger.debug(...)` call still pays for a method call into the logging module and
+`isEnabledFor`. With `LOGGIA_STRIP_BELOW=INFO`, the methods below `INFO` (`debug`) of every logger
+for which their level is disabled are shadowed by an instance attribute pointing to a no-op
+function, that returns right away.
+
+Stripping depends on effective levels, so it is evaluated again when Loggia changes levels:
+in `initialize()` and through [loggia.reconfigure][]. Levels changed directly with
+[logging.Logger.setLevel][] are only taken into account at the next evaluation.
+Loggers created afterwards are stripped as they are created.
+
+Arguments are still evaluated by the caller: a no-op does not save building the `extra` dict.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+_METHODS = (
+    ("debug", logging.DEBUG),
+    ("info", logging.INFO),
+    ("warning", logging.WARNING),
+    ("warn", logging.WARNING),
+    ("error", logging.ERROR),
+    ("exception", logging.ERROR),
+    ("critical", logging.CRITICAL),
+    ("fatal", logging.CRITICAL),
+)
+
+_threshold: int | None = None
+_manager_get_logger: Any = None
+
+
+def _noop(*_args: Any, **_kwargs: Any) -> None:
+    return None
+
+
+def _strip(logger: logging.Logger) -> None:
+    for name, level in _METHODS:
+        if _threshold is not None and level < _threshold and not logger.isEnabledFor(level):
+            setattr(logger, name, _noop)
+        elif logger.__dict__.get(name) is _noop:
+            delattr(logger, name)
+
+
+def _get_logger(name: str) -> logging.Logger:
+    is_new = name not in logging.root.manager.loggerDict or isinstance(logging.root.manager.loggerDict[name], logging.PlaceHolder)
+    logger: logging.Logger = _manager_get_logger(name)
+    if is_new:
+        _strip(logger)
+    return logger
+
+
+def refresh() -> None:
+    """Strip or restore the logging methods of all loggers, after a change of levels."""
+    if _threshold is None and _manager_get_logger is None:
+        return
+    loggers = [logging.root, *(logger for logger in list(logging.root.manager.loggerDict.values()) if isinstance(logger, logging.Logger))]
+    for logger in loggers:
+        _strip(logger)
+
+
+def configure(threshold: int | None) -> None:
+    """Strip the logging methods below `threshold` of the loggers for which they are disabled, or restore them all when None."""
+    global _threshold, _manager_get_logger  # noqa: PLW0603 # pylint: disable=global-statement
+    manager = logging.root.manager
+    _threshold = threshold
+    if threshold is not None and _manager_get_logger is None:
+        _manager_get_logger = manager.getLogger
+        manager.getLogger = _get_logger  # type: ignore[method-assign]
+    refresh()
+    if threshold is None and _manager_get_logger is not None:
+        manager.__dict__.pop("getLogger", None)
+        _manager_get_logger = None
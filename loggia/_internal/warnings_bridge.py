@@ -0,0 +1,121 @@
+"""Loggia's own bridge from the warnings module to standard logging.
+
+Unlike [logging.captureWarnings][], warnings are not rendered with
+[warnings.formatwarning][]: they become structured records, and repeats of
+a given (category, location) are coalesced into periodic summaries.
+"""
+
+from __future__ import annotations
+
+import atexit
+import threading
+import time
+import warnings
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import logging
+    from typing import TextIO
+
+_WarningKey = tuple[type[Warning], str, int]
+
+
+class _Location:
+    __slots__ = ("repeats",)
+
+    def __init__(self) -> None:
+        self.repeats = 0
+
+
+class WarningsBridge:
+    """A replacement for [warnings.showwarning][] that logs coalesced, structured warnings.
+
+    The first warning seen for a given (category, filename, lineno) is logged right away.
+    Repeats are only counted, and logged as a summary record carrying `warning.count`
+    on the first warning past each summary interval, when a location is evicted from
+    the bounded registry, and at exit.
+    """
+
+    def __init__(self, logger: logging.Logger, summary_interval: float = 60.0, max_entries: int = 256):
+        self.logger = logger
+        self.summary_interval = summary_interval
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._locations: OrderedDict[_WarningKey, _Location] = OrderedDict()
+        self._next_summary = time.monotonic() + summary_interval
+        self._original_showwarning = warnings.showwarning
+
+    def install(self) -> None:
+        warnings.showwarning = self.showwarning
+        atexit.register(self.flush)
+
+    def uninstall(self) -> None:
+        if warnings.showwarning == self.showwarning:
+            warnings.showwarning = self._original_showwarning
+        atexit.unregister(self.flush)
+        self.flush()
+
+    def showwarning(  # noqa: PLR0913
+        self,
+        message: Warning | str,
+        category: type[Warning],
+        filename: str,
+        lineno: int,
+        file: TextIO | None = None,
+        line: str | None = None,
+    ) -> None:
+        if file is not None:
+            # Explicit destinations are honored, like logging.captureWarnings does
+            self._original_showwarning(message, category, filename, lineno, file, line)
+            return
+
+        key = (category, filename, lineno)
+        evicted: tuple[_WarningKey, int] | None = None
+        with self._lock:
+            location = self._locations.get(key)
+            if location is None:
+                self._locations[key] = _Location()
+                if len(self._locations) > self.max_entries:
+                    evicted_key, evicted_location = self._locations.popitem(last=False)
+                    evicted = (evicted_key, evicted_location.repeats)
+            else:
+                location.repeats += 1
+                self._locations.move_to_end(key)
+            summary_due = time.monotonic() >= self._next_summary
+
+        if location is None:
+            self.logger.warning("%s: %s", category.__name__, message, extra=self._extra(key))
+        if evicted is not None and evicted[1] > 0:
+            self._log_summary(*evicted)
+        if summary_due:
+            self.flush()
+
+    def flush(self) -> None:
+        """Log a summary record for every location that repeated since the last summary."""
+        with self._lock:
+            self._next_summary = time.monotonic() + self.summary_interval
+            summaries = [(key, location.repeats) for key, location in self._locations.items() if location.repeats > 0]
+            for location in self._locations.values():
+                location.repeats = 0
+        for key, repeats in summaries:
+            self._log_summary(key, repeats)
+
+    def _log_summary(self, key: _WarningKey, repeats: int) -> None:
+        self.logger.warning(
+            "%s repeated %d times (%s:%d)",
+            key[0].__name__,
+            repeats,
+            key[1],
+            key[2],
+            extra={**self._extra(key), "warning.count": repeats},
+        )
+
+    @staticmethod
+    def _extra(key: _WarningKey) -> dict[str, Any]:
+        category, filename, lineno = key
+        return {
+            "warning.category": f"{category.__module__}.{category.__qualname__}",
+            "warning.filename": filename,
+            "warning.lineno": lineno,
+        }
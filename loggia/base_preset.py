@@ -32,6 +32,15 @@ class BasePreset(ABC):
         """
         return []
 
+    @classmethod
+    def opt_in(cls) -> bool:
+        """Override the opt_in method to make a built-in preset apply only when requested.
+
+        Built-in presets normally apply unless another preset wins their slot. Opt-in presets
+        only apply when their name or preference key is listed in `LOGGIA_PRESETS`.
+        """
+        return False
+
     @classmethod
     def required_presets(cls) -> list[str | list[str]]:
         """Provides a mechanism for preset->preset dependencies.
@@ -0,0 +1,141 @@
+"""Benchmark the effective logging configuration of this environment.
+
+Run `python -m loggia.bench` with the same environment as your application (`LOGGIA_PRESETS`,
+`LOGGIA_LEVEL`, ...), for instance inside its container image. It builds the exact
+[LoggerConfiguration][loggia.conf.LoggerConfiguration] the application would get, emits synthetic
+records through it into a null sink, and reports:
+
+- records per second, over all enabled scenarios
+- nanoseconds per call, by level and number of extra attributes
+- the median and 99th percentile of each pipeline stage, and the worst filter or formatter stage
+
+Records per second and per-call figures are measured on the configuration as given. Stage
+timings are measured in a second pass (see [loggia.timings][]), on the same configuration with
+stage timings enabled: their instrumentation changes the handler, filters and record factory, and
+would otherwise inflate the per-call figures.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import sys
+import time
+from typing import TYPE_CHECKING, Any
+
+import loggia.timings
+from loggia.conf import LoggerConfiguration
+from loggia.logger import initialize
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+LEVELS = (logging.DEBUG, logging.INFO, logging.WARNING, logging.ERROR)
+EXTRA_SIZES = (0, 5, 20)
+
+
+class _NullStream:
+    """A stream that drops everything written to it."""
+
+    def write(self, s: str) -> int:
+        return len(s)
+
+    def flush(self) -> None:
+        pass
+
+
+def _silence_handlers(logger_names: Sequence[str]) -> None:
+    null_stream = _NullStream()
+    for name in ("", *logger_names):
+        for handler in logging.getLogger(name).handlers:
+            if isinstance(handler, logging.StreamHandler):
+                handler.setStream(null_stream)
+
+
+def _initialize(*, stage_timings: bool = False) -> None:
+    conf = LoggerConfiguration()
+    if stage_timings:
+        conf.set_stage_timings(enabled=True)
+    initialize(conf)
+    _silence_handlers(list(conf._dictconfig.get("loggers", {})))
+
+
+def _run_scenarios(logger: logging.Logger, records: int) -> list[dict[str, Any]]:
+    results = []
+    for level in LEVELS:
+        for extra_size in EXTRA_SIZES:
+            extra = {f"bench_{i}": i for i in range(extra_size)}
+            start = time.perf_counter_ns()
+            for i in range(records):
+                logger.log(level, "Synthetic record %d", i, extra=extra)
+            elapsed = time.perf_counter_ns() - start
+            results.append(
+                {
+                    "level": logging.getLevelName(level),
+                    "extras": extra_size,
+                    "enabled": logger.isEnabledFor(level),
+                    "ns_per_call": elapsed // records,
+                    "elapsed_ns": elapsed,
+                },
+            )
+    return results
+
+
+def run(records: int = 10_000, logger_name: str = "loggia.bench") -> dict[str, Any]:
+    """Benchmark the configuration from the current environment, and return a report."""
+    logger = logging.getLogger(logger_name)
+
+    _initialize()
+    scenarios = _run_scenarios(logger, records)
+
+    _initialize(stage_timings=True)
+    loggia.timings.reset()
+    _run_scenarios(logger, max(records // 10, 1))
+    loggia.timings.configure(enabled=False)
+    stages = loggia.timings.percentiles()
+
+    enabled = [s for s in scenarios if s["enabled"]]
+    elapsed = sum(s["elapsed_ns"] for s in enabled)
+    worst = max(
+        (stage for stage in stages if stage.startswith(("filter:", "format:"))),
+        key=lambda stage: stages[stage]["p50_ns"],
+        default=None,
+    )
+    return {
+        "records_per_second": round(len(enabled) * records * 1e9 / elapsed) if elapsed else None,
+        "scenarios": scenarios,
+        "stages": stages,
+        "worst_stage": worst,
+    }
+
+
+def format_report(report: dict[str, Any]) -> str:
+    """Render a report returned by [run][loggia.bench.run] as plain text tables."""
+    lines = [f"Records per second: {report['records_per_second']}", "", f"{'level':<10}{'extras':>8}{'ns/call':>12}"]
+    for scenario in report["scenarios"]:
+        suffix = "" if scenario["enabled"] else "  (disabled)"
+        lines.append(f"{scenario['level']:<10}{scenario['extras']:>8}{scenario['ns_per_call']:>12}{suffix}")
+    lines += ["", f"{'stage':<40}{'p50 ns':>10}{'p99 ns':>10}"]
+    lines += [f"{stage:<40}{stats['p50_ns']:>10}{stats['p99_ns']:>10}" for stage, stats in sorted(report["stages"].items())]
+    if report["worst_stage"]:
+        lines += ["", f"Worst filter or formatter stage: {report['worst_stage']}"]
+    return "\n".join(lines)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m loggia.bench", description="Benchmark the effective logging configuration of this environment."
+    )
+    parser.add_argument("--records", type=int, default=10_000, help="records per scenario (default: %(default)s)")
+    parser.add_argument("--logger", default="loggia.bench", help="name of the logger to emit through (default: %(default)s)")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    report = run(records=args.records, logger_name=args.logger)
+    print(json.dumps(report, indent=2) if args.json else format_report(report))  # noqa: T201
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,171 @@
+"""Call-site log volume profiler, to find out which lines of code drive your log bill.
+
+When enabled, Loggia's handler attributes each written record, and its formatted size,
+to its call site: `pathname:lineno` and the message template. The top call sites by
+bytes and by record count are kept in two [space-saving sketches][loggia.callsites.SpaceSaving],
+so memory stays bounded no matter how many call sites log.
+
+The profiler can be switched on and off on a running process with [enable][loggia.callsites.enable]
+and [disable][loggia.callsites.disable], as long as Loggia's handler is in use (see `LOGGIA_METRICS`,
+`LOGGIA_STAGE_TIMINGS` or `LOGGIA_CALLSITE_PROFILER`).
+"""
+
+from __future__ import annotations
+
+import heapq
+import logging
+import threading
+import time
+from typing import Any, NamedTuple
+
+CallSite = tuple[str, int, str]
+
+
+class HeavyHitter(NamedTuple):
+    """A call site and its estimated weight. The true weight is between `weight - error` and `weight`."""
+
+    pathname: str
+    lineno: int
+    template: str
+    weight: int
+    error: int
+
+
+class SpaceSaving:
+    """The space-saving heavy-hitters sketch, with weighted increments.
+
+    Tracks at most `capacity` keys. When a new key comes in and the sketch is full, the key
+    with the smallest weight is evicted and the new key inherits its weight as an error bound.
+    Any key whose true weight exceeds `total / capacity` is guaranteed to be tracked.
+
+    Keys are kept in a min-heap of their weights, which is only brought up to date on
+    eviction: weights only grow, so a stale heap entry underestimates its key's weight.
+    Increments are O(1), and evictions O(log capacity) amortized.
+    """
+
+    def __init__(self, capacity: int):
+        if capacity < 1:
+            raise ValueError(f"Space-saving capacity must be positive, got {capacity}")
+        self.capacity = capacity
+        self.total = 0
+        self._entries: dict[CallSite, list[int]] = {}
+        self._heap: list[tuple[int, CallSite]] = []
+
+    def add(self, key: CallSite, weight: int = 1) -> None:
+        self.total += weight
+        entry = self._entries.get(key)
+        if entry is not None:
+            entry[0] += weight
+            return
+        if len(self._entries) < self.capacity:
+            self._entries[key] = [weight, 0]
+            heapq.heappush(self._heap, (weight, key))
+            return
+        floor, evicted = self._heap[0]
+        while floor != self._entries[evicted][0]:
+            heapq.heapreplace(self._heap, (self._entries[evicted][0], evicted))
+            floor, evicted = self._heap[0]
+        del self._entries[evicted]
+        self._entries[key] = [floor + weight, floor]
+        heapq.heapreplace(self._heap, (floor + weight, key))
+
+    def top(self, n: int) -> list[HeavyHitter]:
+        ranked = sorted(self._entries.items(), key=lambda item: item[1][0], reverse=True)[:n]
+        return [HeavyHitter(*key, weight, error) for key, (weight, error) in ranked]
+
+    def clear(self) -> None:
+        self.total = 0
+        self._entries.clear()
+        self._heap.clear()
+
+
+SUMMARY_LOGGER = "loggia.callsites"
+
+
+class CallSiteProfiler:
+    """Two space-saving sketches of call sites, by bytes and by record count.
+
+    The records of the summary logger, `loggia.callsites`, are not profiled.
+    """
+
+    enabled: bool = False
+    window: float = 0.0
+
+    def __init__(self, capacity: int = 128):
+        self._lock = threading.Lock()
+        self.by_bytes = SpaceSaving(capacity)
+        self.by_count = SpaceSaving(capacity)
+        self._window_end = 0.0
+
+    def observe(self, record: logging.LogRecord, size: int) -> None:
+        if record.name == SUMMARY_LOGGER:
+            return
+        template = record.msg if isinstance(record.msg, str) else type(record.msg).__name__
+        key = (record.pathname, record.lineno, template)
+        extra = None
+        with self._lock:
+            self.by_bytes.add(key, size)
+            self.by_count.add(key)
+            # Only the thread ending the window logs its summary
+            if self.window > 0 and time.monotonic() >= self._window_end:
+                extra = self._end_window(10)
+        if extra is not None:
+            logging.getLogger(SUMMARY_LOGGER).info("Top log call sites", extra=extra)
+
+    def top(self, n: int = 10, by: str = "bytes") -> list[HeavyHitter]:
+        if by not in ("bytes", "count"):
+            raise ValueError(f"Expected by='bytes' or by='count', got {by!r}")
+        sketch = self.by_bytes if by == "bytes" else self.by_count
+        with self._lock:
+            return sketch.top(n)
+
+    def reset(self, capacity: int | None = None) -> None:
+        with self._lock:
+            if capacity is not None:
+                self.by_bytes = SpaceSaving(capacity)
+                self.by_count = SpaceSaving(capacity)
+            self._start_window()
+
+    def _start_window(self) -> None:
+        self.by_bytes.clear()
+        self.by_count.clear()
+        self._window_end = time.monotonic() + self.window
+
+    def _end_window(self, n: int) -> dict[str, Any]:
+        extra: dict[str, Any] = {
+            "loggia.callsites.by_bytes": [hit._asdict() for hit in self.by_bytes.top(n)],
+            "loggia.callsites.by_count": [hit._asdict() for hit in self.by_count.top(n)],
+        }
+        self._start_window()
+        return extra
+
+    def log_summary(self, n: int = 10) -> None:
+        """Log the top call sites of the current window on the `loggia.callsites` logger, then start a new window."""
+        with self._lock:
+            extra = self._end_window(n)
+        logging.getLogger(SUMMARY_LOGGER).info("Top log call sites", extra=extra)
+
+
+profiler = CallSiteProfiler()
+"""The process-wide call-site profiler."""
+
+
+def enable(capacity: int = 128, window: float = 0.0) -> None:
+    """Start profiling call sites, keeping track of at most `capacity` call sites per sketch.
+
+    With a `window` (in seconds), the top call sites are logged on the `loggia.callsites`
+    logger at the end of each window, and a new window starts. Safe to call on a running process.
+    """
+    profiler.window = window
+    profiler.reset(capacity)
+    profiler.enabled = True
+
+
+def disable() -> None:
+    """Stop profiling call sites. The results of the current window are kept until the next [enable][loggia.callsites.enable]."""
+    profiler.enabled = False
+
+
+def top(n: int = 10, by: str = "bytes") -> list[HeavyHitter]:
+    """Return the `n` heaviest call sites of the current window, `by` bytes or record count."""
+    return profiler.top(n, by)
@@ -5,20 +5,22 @@ import logging.config
 import os
 from copy import deepcopy
 from enum import Enum
-from typing import TYPE_CHECKING, Callable, Literal, cast
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Literal, cast
 
 import loggia._internal.env_parsers as ep
 from loggia._internal.conf import EnvironmentLoader, is_falsy_string, is_truthy_string
 from loggia._internal.presets import Presets
 from loggia.constants import BASE_DICTCONFIG
-from loggia.types import SupportsFilter, UserDefinedObject
 from loggia.utils.dictutils import get_in
 from loggia.utils.strutils import clean_log_level
 
 if TYPE_CHECKING:
     from json import JSONEncoder
 
-    from loggia.types import UserDefinedFilter
+    from loggia.filters.exception_dedup import ExceptionDedup
+    from loggia.filters.filter_rules import FilterRules
+    from loggia.types import SupportsFilter, UserDefinedFilter, UserDefinedObject
 
 
 class FlexibleFlag(Enum):
@@ -39,6 +41,28 @@ class FlexibleFlag(Enum):
         raise ValueError(f"Can't cast '{anything}' to either ENABLED, DISABLED or AUTO")
 
 
+def _filter_from_proto(filter_: SupportsFilter) -> SupportsFilter:
+    return filter_
+
+
+def _filter_from_callable(typename: str, filter_: Callable[[logging.LogRecord], bool]) -> SupportsFilter:
+    t = type(typename, (), {})
+    t.filter = filter_  # type:ignore[attr-defined]
+    return cast("SupportsFilter", t)
+
+
+def _filter_fqn(filter_spec: dict[str, Any]) -> str:
+    """The fully qualified name of the class or function behind a dictconfig filter."""
+    ctor: Any = filter_spec["()"]
+    if isinstance(ctor, str):
+        return ctor
+    if isinstance(ctor, partial):
+        ctor = ctor.args[-1]
+    if not hasattr(ctor, "__qualname__"):
+        ctor = type(ctor)
+    return f"{ctor.__module__}.{ctor.__qualname__}"
+
+
 env = EnvironmentLoader()
 
 
@@ -50,8 +74,39 @@ class LoggerConfiguration:
     setup_unraisablehook: bool = False
     setup_threading_excepthook: bool = False
     capture_warnings: bool = False
+    warnings_summary_interval: float = 60.0
+    audit_events: frozenset[str] = frozenset()
+    audit_rate_limit: float = 10.0
+    access_log_sampling: str | None = None
+    metrics_enabled: bool = False
+    metrics_summary_interval: float = 0.0
+    metrics_suppressed: bool = False
+    stage_timings_enabled: bool = False
+    callsite_profiler_enabled: bool = False
+    callsite_profiler_window: float = 0.0
+    dump_signal: int | None = None
+    asyncio_monitor: bool = False
+    asyncio_slow_callback: float = 0.1
+    asyncio_lag_threshold: float = 0.1
+    gc_monitor_enabled: bool = False
+    gc_threshold: float = 0.01
+    gc_summary_interval: float = 60.0
+    reconfigure_file: str | None = None
+    reconfigure_interval: float = 5.0
+    reconfigure_signal: int | None = None
+    control_socket: str | None = None
+    prewarm: bool = False
+    strip_below: int | None = None
+    pre_filter_rules: str | None = None
+    filename_on_modified_stack: bool = False
+    logger_callers: tuple[tuple[str, bool], ...] = ()
+    lean_records: bool = False
     capture_loguru: FlexibleFlag = FlexibleFlag.AUTO
     disallow_loguru_reconfig: bool = False
+    _exception_dedup: ExceptionDedup | None = None
+    _filter_rules: FilterRules | None = None
+    # (logger name or None for all loggers and handlers, fully qualified filter name)
+    _disabled_filters: tuple[tuple[str | None, str], ...] = ()
 
     def __init__(self, *, settings: dict[str, str] | None = None, presets: str | list[str] | None = None):
         # XXX Well put docstring!
@@ -80,6 +135,9 @@ class LoggerConfiguration:
         # Environment variables overrides defaults, presets and constructor params
         env.apply_env(self)
 
+        # Settings applied after LOGGIA_DISABLED_FILTERS may have added filters it disables
+        self._remove_disabled_filters()
+
         # Whatever you do to LoggerConfiguration after it's initialized has the
         # last word. Enjoy.
 
@@ -123,6 +181,20 @@ class LoggerConfiguration:
         self._enforce_logger(logger_name)
         self._dictconfig["loggers"][logger_name]["propagate"] = is_truthy_string(does_propagate)
 
+    @env.register("LOGGIA_SUB_CALLER", parser=ep.comma_colon)
+    def set_logger_caller(self, logger_name: str, enabled: bool | str) -> None:
+        """Enable or disable the capture of the caller's location for a specific logger and its children.
+
+        Records of loggers with caller capture disabled have an unknown `pathname`, `lineno`
+        and `funcName`, and skip the stack walk that finds them. Use the empty string as
+        logger name for all loggers. For instance, `LOGGIA_SUB_CALLER=app.hot:off`.
+
+        Setting this turns plain loggers into Loggia's own logger class, which also finds the
+        caller of other loggers faster.
+        """
+        flag = enabled if isinstance(enabled, bool) else not is_falsy_string(enabled)
+        self.logger_callers = (*self.logger_callers, (logger_name, flag))
+
     def _add_filter_to_config(self, path: list[str], filter_: UserDefinedFilter) -> None:
         target_object = get_in(self._dictconfig, path, None)
         if target_object is None:
@@ -140,16 +212,9 @@ class LoggerConfiguration:
         else:
             typename = f"CallableWrapper<{filter_.__class__.__module__}.{filter_.__class__.__name__}:{id(filter_)}>"
 
-        def ctor_proto() -> SupportsFilter:
-            return cast(SupportsFilter, filter_)
-
-        def ctor_callable() -> SupportsFilter:
-            t = type(typename, (), {})
-            t.filter = filter_  # type:ignore[attr-defined]
-            return cast(SupportsFilter, t)
-
-        ctor = ctor_callable if callable(filter_) else ctor_proto
-        ctor.__name__ = typename
+        # Partials of module-level functions rather than closures, so that configurations can be pickled
+        ctor = partial(_filter_from_callable, typename, filter_) if callable(filter_) else partial(_filter_from_proto, filter_)
+        ctor.__name__ = typename  # type: ignore[attr-defined]
         return {"()": ctor}
 
     # XXX deprecate this, rename to add_logger_filter(...) which is more accurate/appropriate naming
@@ -168,14 +233,47 @@ class LoggerConfiguration:
         self._enforce_logger(logger_name)
         self._add_filter_to_config(["loggers", logger_name], self._nice_filter_to_dictconfig_filter(filter_))
 
-    # LOGGIA_SKIP_FILTERS=pkg.spkg.MonFilter,mylogname:toto.pkg.TaFilter
     @env.register("LOGGIA_DISABLED_FILTERS", parser=ep.comma_colon)
-    def remove_log_filter(self, logger_name: str, filter_fqn: str) -> None:
-        raise NotImplementedError
+    def remove_log_filter(self, logger_name: str, filter_fqn: str | None = None) -> None:
+        """Remove the filters of a given class or function, by fully qualified name.
+
+        Filters are removed from the given logger only, or from all loggers and handlers
+        when no logger name is given. Use the empty string as logger name for the root logger:
+
+            LOGGIA_DISABLED_FILTERS=pkg.spkg.MonFilter,mylogname:toto.pkg.TaFilter
+
+        Filters added by the other settings of the configuration are removed too, whatever
+        order they are applied in.
+        """
+        if filter_fqn is None:
+            self._disabled_filters = (*self._disabled_filters, (None, logger_name))
+        else:
+            self._disabled_filters = (*self._disabled_filters, (logger_name, filter_fqn))
+        self._remove_disabled_filters()
+
+    def _remove_disabled_filters(self) -> None:
+        filters: dict[str, Any] = self._dictconfig.get("filters", {})
+        for logger_name, filter_fqn in self._disabled_filters:
+            targets: list[dict[str, Any]]
+            if logger_name is None:
+                targets = [*self._dictconfig.get("loggers", {}).values(), *self._dictconfig.get("handlers", {}).values()]  # type: ignore[list-item]
+            else:
+                targets = [self._dictconfig.get("loggers", {}).get(logger_name, {})]  # type: ignore[list-item]
+            for target in targets:
+                if "filters" in target:
+                    target["filters"] = [filter_id for filter_id in target["filters"] if _filter_fqn(filters[filter_id]) != filter_fqn]
 
     def add_default_handler_filter(self, filter_: SupportsFilter | Callable[[logging.LogRecord], bool]) -> None:
         self._add_filter_to_config(["handlers", "default"], self._nice_filter_to_dictconfig_filter(filter_))
 
+    def set_filename_on_modified_stack(self, *, enabled: bool) -> None:
+        """Mark records logged with a `stacklevel`, so that the pretty formatter shows their file name.
+
+        Their location is not the logging call, which makes the file name worth showing.
+        The Dev preset enables this, which turns plain loggers into Loggia's own logger class.
+        """
+        self.filename_on_modified_stack = enabled
+
     @env.register("LOGGIA_FORMATTER")
     def set_default_formatter(self, formatter: UserDefinedObject[logging.Formatter]) -> None:
         """Sets the default formatter."""
@@ -197,8 +295,8 @@ class LoggerConfiguration:
     def set_loguru_capture(self, enabled: FlexibleFlag | bool | str) -> None:
         """Explicitely disable Loggia-Loguru interop.
 
-        When set to AUTO, Loggia will attempt to configure Loguru if possible,
-        and be silent if it's not possible.
+        When set to AUTO, Loggia will configure Loguru when the application imports it,
+        and be silent if it never does. Loggia does not import Loguru itself.
 
         When set to ENABLED, Loggia will attempt to configure Loguru, and will
         produce an error if it is not importable.
@@ -249,10 +347,354 @@ class LoggerConfiguration:
     def set_capture_warnings(self, enabled: bool | str) -> None:
         """Explicitely enable the capture of warnings.
 
-        When set to true, Loggia will attempt to log warnings.
+        When set to true, Loggia will log warnings as structured records, with
+        `warning.category`, `warning.filename` and `warning.lineno` attributes.
+        Repeats of a warning from the same location are coalesced into periodic
+        summaries, see [set_warnings_summary_interval][loggia.conf.LoggerConfiguration.set_warnings_summary_interval].
         """
         self.capture_warnings = is_truthy_string(enabled)
 
+    @env.register("LOGGIA_WARNINGS_SUMMARY_INTERVAL")
+    def set_warnings_summary_interval(self, seconds: float | str) -> None:
+        """Set the minimum interval (in seconds) between two summaries of repeated warnings.
+
+        Only relevant when capturing warnings.
+        """
+        self.warnings_summary_interval = float(seconds)
+
+    @env.register("LOGGIA_AUDIT_EVENTS")
+    def set_audit_events(self, events: str | list[str] | set[str]) -> None:
+        """Log the given audit events, as raised by [sys.audit][].
+
+        Accepts a comma separated string or a collection of event names, e.g. `"socket.connect,subprocess.Popen"`.
+        Only exact event names are supported. Audit hooks cannot be removed: once
+        installed, the bridge remains for the lifetime of the interpreter, but an empty
+        allowlist makes it inert.
+        """
+        if isinstance(events, str):
+            events = [event.strip() for event in events.split(",")]
+        self.audit_events = frozenset(event for event in events if event)
+
+    @env.register("LOGGIA_AUDIT_RATE_LIMIT")
+    def set_audit_rate_limit(self, per_second: float | str) -> None:
+        """Set the maximum number of records logged per second for each audit event.
+
+        Use 0 to disable rate limiting.
+        """
+        self.audit_rate_limit = float(per_second)
+
+    @env.register("LOGGIA_ACCESS_SAMPLING")
+    def set_access_log_sampling(self, rules: str | None) -> None:
+        """Set sampling rules for the gunicorn and hypercorn access logs.
+
+        Rules are evaluated in order, the first matching rule decides, and requests matching
+        no rule are kept. For instance, to keep errors and slow requests, drop health checks,
+        and only keep 1% of the remaining successful requests:
+
+            status>=400 -> keep; duration>500ms -> keep; path=/healthz -> drop; status=2xx -> 1%
+
+        Available fields are `status`, `duration` and `path`. Rules only apply to
+        [GunicornLogger][loggia.structlog_utils.gunicorn_logger.GunicornLogger] and
+        [HypercornLogger][loggia.structlog_utils.hypercorn_logger.HypercornLogger], and only
+        to access logs that are not already disabled by their logger's level.
+
+        Raises:
+            ValueError: If the rules are malformed.
+        """
+        if rules:
+            from loggia._internal.access_sampling import AccessLogSampler
+
+            AccessLogSampler(rules)  # Fail early on malformed rules
+        self.access_log_sampling = rules or None
+
+    @env.register("LOGGIA_EXCEPTION_DEDUP_WINDOW")
+    def set_exception_dedup_window(self, seconds: float | str) -> None:
+        """Ship the stack trace of a given exception at most once per time window (in seconds).
+
+        Exceptions are fingerprinted by type and frame code locations. Repeated
+        occurrences within the window are logged without their stack trace, and
+        carry `error.fingerprint` and `error.count` instead.
+        A window of 0 disables deduplication.
+        """
+        from loggia.filters.exception_dedup import ExceptionDedup
+
+        window = float(seconds)
+        if self._exception_dedup is None:
+            self._exception_dedup = ExceptionDedup(window=window)
+            self.add_default_handler_filter(self._exception_dedup)
+        else:
+            self._exception_dedup.window = window
+
+    @env.register("LOGGIA_FILTER_RULES")
+    def set_filter_rules(self, rules: str | None) -> None:
+        """Keep or drop records according to declarative rules, set on the default handler.
+
+        Rules are evaluated in order, the first matching rule decides, and records matching
+        no rule are kept. For instance, to drop the chatter of botocore and health checks:
+
+            logger=botocore.* and level<WARNING -> drop; msg~"healthcheck" -> drop
+
+        Available fields are `logger`, `level` and `msg`. See `loggia.filters.filter_rules`
+        for their operators. Rules are compiled once: filtering a record costs about the same
+        whatever the number of rules.
+
+        Raises:
+            ValueError: If the rules are malformed.
+        """
+        from loggia.filters.filter_rules import FilterRules
+
+        if self._filter_rules is None:
+            if rules:
+                self._filter_rules = FilterRules(rules)
+                self.add_default_handler_filter(self._filter_rules)
+        else:
+            self._filter_rules.set_rules(rules or "")
+
+    @env.register("LOGGIA_PRE_FILTER_RULES")
+    def set_pre_filter_rules(self, rules: str | None) -> None:
+        """Drop logging calls according to declarative rules, before their record is created.
+
+        Rules use the syntax of [set_filter_rules][loggia.conf.LoggerConfiguration.set_filter_rules],
+        but `msg` conditions are matched against the message template, like `"Processed order %s"`.
+        Rejected calls skip the stack walk to find the caller, the creation of the record,
+        and every filter and handler:
+
+            logger=botocore.* and level<WARNING -> drop; msg="Cache hit for %s" -> drop
+
+        Rules apply to plain [logging.Logger][] instances, whose class is then replaced by Loggia's own.
+
+        Raises:
+            ValueError: If the rules are malformed.
+        """
+        if rules:
+            from loggia.filters.filter_rules import FilterRules
+
+            FilterRules(rules)  # Fail early on malformed rules
+        self.pre_filter_rules = rules or None
+
+    @env.register("LOGGIA_METRICS")
+    def set_metrics(self, enabled: bool | str) -> None:
+        """Explicitly enable or disable logging metrics.
+
+        When set to true, Loggia's default handler counts records and bytes written per logger
+        and level, records dropped by filters and formatting errors. Metrics are read through
+        [loggia.metrics.snapshot][].
+        """
+        self.metrics_enabled = is_truthy_string(enabled)
+        if self.metrics_enabled:
+            self._use_loggia_handler()
+
+    @env.register("LOGGIA_METRICS_SUMMARY_INTERVAL")
+    def set_metrics_summary_interval(self, seconds: float | str) -> None:
+        """Emit a summary record of logging metrics every so often (in seconds).
+
+        The summary is logged by the `loggia.metrics` logger. Use 0 to disable summaries.
+        Only relevant when metrics are enabled.
+        """
+        self.metrics_summary_interval = float(seconds)
+
+    @env.register("LOGGIA_METRICS_SUPPRESSED")
+    def set_metrics_suppressed(self, enabled: bool | str) -> None:
+        """Also count the logging calls rejected by the level of their logger, as the `suppressed` metric.
+
+        These calls never create a record: they are counted by Loggia's logger class, which adds
+        a Python call to every logging call. Useful to find chatty loggers hidden behind their level.
+        Only relevant when metrics are enabled.
+        """
+        self.metrics_suppressed = is_truthy_string(enabled)
+
+    @env.register("LOGGIA_STAGE_TIMINGS")
+    def set_stage_timings(self, enabled: bool | str) -> None:
+        """Explicitly enable or disable the timing of each stage of the logging pipeline.
+
+        When set to true, record creation, filters, formatting and writes are timed into
+        histograms, read through [loggia.timings.percentiles][]. This is a diagnostic mode,
+        with a measurable overhead.
+        """
+        self.stage_timings_enabled = is_truthy_string(enabled)
+        if self.stage_timings_enabled:
+            self._use_loggia_handler()
+
+    @env.register("LOGGIA_CALLSITE_PROFILER")
+    def set_callsite_profiler(self, enabled: bool | str) -> None:
+        """Explicitly enable or disable the call-site log volume profiler at startup.
+
+        When set to true, records and bytes written are attributed to their call sites, and
+        the heaviest call sites are read through [loggia.callsites.top][]. The profiler can also
+        be switched on a running process with [loggia.callsites.enable][].
+        """
+        self.callsite_profiler_enabled = is_truthy_string(enabled)
+        if self.callsite_profiler_enabled:
+            self._use_loggia_handler()
+
+    @env.register("LOGGIA_CALLSITE_PROFILER_WINDOW")
+    def set_callsite_profiler_window(self, seconds: float | str) -> None:
+        """Log the top call sites every so often (in seconds), then start a new profiling window.
+
+        The top call sites are logged by the `loggia.callsites` logger. Use 0 to disable this.
+        Only relevant when the call-site profiler is enabled.
+        """
+        self.callsite_profiler_window = float(seconds)
+
+    @env.register("LOGGIA_DUMP_SIGNAL")
+    def set_dump_signal(self, sig: str | int | None) -> None:
+        """Dump the live logger tree to standard error when receiving a signal, e.g. `SIGUSR1`.
+
+        Each logger is listed with its level, effective level, propagation flag, handlers
+        and filters, and with its written and dropped records when [loggia.metrics][] are enabled.
+        A truthy value selects `SIGUSR1`. Mind servers that already use this signal, like
+        gunicorn, which reopens its log files on `SIGUSR1`.
+
+        Raises:
+            ValueError: If the signal is unknown.
+        """
+        from loggia._internal.logger_dump import parse_signal
+
+        if sig is None or (isinstance(sig, str) and (not sig or is_falsy_string(sig))):
+            self.dump_signal = None
+        elif isinstance(sig, str) and is_truthy_string(sig):
+            self.dump_signal = parse_signal("SIGUSR1")
+        else:
+            self.dump_signal = parse_signal(sig)
+
+    @env.register("LOGGIA_ASYNCIO_MONITOR")
+    def set_asyncio_monitor(self, enabled: bool | str) -> None:
+        """Explicitly enable or disable the asyncio event loop monitor.
+
+        When set to true, slow callbacks and event loop lag are logged by the `loggia.asyncio`
+        logger, and uncaught exceptions of loops without a custom exception handler are logged
+        by the `asyncio` logger, with the exception context as extra attributes.
+        See also the `asyncio_monitor` preset.
+        """
+        self.asyncio_monitor = is_truthy_string(enabled)
+
+    @env.register("LOGGIA_ASYNCIO_SLOW_CALLBACK")
+    def set_asyncio_slow_callback(self, seconds: float | str) -> None:
+        """Log asyncio callbacks running for longer than this (in seconds). Use 0 to disable this check.
+
+        Only relevant when the asyncio monitor is enabled.
+        """
+        self.asyncio_slow_callback = float(seconds)
+
+    @env.register("LOGGIA_ASYNCIO_LAG_THRESHOLD")
+    def set_asyncio_lag_threshold(self, seconds: float | str) -> None:
+        """Log when the asyncio event loop runs a heartbeat later than this (in seconds). Use 0 to disable this check.
+
+        The heartbeat is scheduled every so often, so this is also the resolution of lag measurements.
+        Only relevant when the asyncio monitor is enabled.
+        """
+        self.asyncio_lag_threshold = float(seconds)
+
+    @env.register("LOGGIA_GC_MONITOR")
+    def set_gc_monitor(self, enabled: bool | str) -> None:
+        """Explicitly enable or disable the garbage collection monitor.
+
+        When set to true, slow garbage collections and periodic summaries are logged by the
+        `loggia.gc` logger, see [loggia.gc_monitor][]. See also the `gc_monitor` preset.
+        """
+        self.gc_monitor_enabled = is_truthy_string(enabled)
+        if self.gc_monitor_enabled:
+            self._use_loggia_handler()
+
+    @env.register("LOGGIA_GC_THRESHOLD")
+    def set_gc_threshold(self, seconds: float | str) -> None:
+        """Log garbage collections taking longer than this (in seconds).
+
+        Only relevant when the garbage collection monitor is enabled.
+        """
+        self.gc_threshold = float(seconds)
+
+    @env.register("LOGGIA_GC_SUMMARY_INTERVAL")
+    def set_gc_summary_interval(self, seconds: float | str) -> None:
+        """Emit a summary record of garbage collections every so often (in seconds).
+
+        The summary is logged by the `loggia.gc` logger. Use 0 to disable summaries.
+        Only relevant when the garbage collection monitor is enabled.
+        """
+        self.gc_summary_interval = float(seconds)
+
+    @env.register("LOGGIA_RECONFIGURE_FILE")
+    def set_reconfigure_file(self, path: str | None) -> None:
+        """Lay the `LOGGIA_*` settings of a file over this configuration, and reapply them when the file changes.
+
+        The file holds one `NAME=value` setting per line. Only the levels, propagation and filters
+        of loggers and handlers are reapplied at runtime, see [loggia.reconfigure][].
+        """
+        self.reconfigure_file = path or None
+
+    @env.register("LOGGIA_RECONFIGURE_INTERVAL")
+    def set_reconfigure_interval(self, seconds: float | str) -> None:
+        """Check the reconfiguration file for changes every so often (in seconds). Use 0 to only reload it on a signal."""
+        self.reconfigure_interval = float(seconds)
+
+    @env.register("LOGGIA_RECONFIGURE_SIGNAL")
+    def set_reconfigure_signal(self, sig: str | int | None) -> None:
+        """Reapply the configuration and the reconfiguration file when receiving a signal, e.g. `SIGHUP`.
+
+        A truthy value selects `SIGHUP`. Mind servers that already use this signal, like
+        gunicorn, which reloads its workers on `SIGHUP`.
+
+        Raises:
+            ValueError: If the signal is unknown.
+        """
+        from loggia._internal.logger_dump import parse_signal
+
+        if sig is None or (isinstance(sig, str) and (not sig or is_falsy_string(sig))):
+            self.reconfigure_signal = None
+        elif isinstance(sig, str) and is_truthy_string(sig):
+            self.reconfigure_signal = parse_signal("SIGHUP")
+        else:
+            self.reconfigure_signal = parse_signal(sig)
+
+    @env.register("LOGGIA_CONTROL_SOCKET")
+    def set_control_socket(self, path: str | None) -> None:
+        """Accept reconfiguration commands on a Unix socket at this path, see [loggia.reconfigure][]."""
+        self.control_socket = path or None
+
+    @env.register("LOGGIA_PREWARM")
+    def set_prewarm(self, enabled: bool | str) -> None:
+        """Explicitly enable or disable warming up the handlers in `initialize()`.
+
+        When set to true, a plain record, a record with extras and a record with an exception
+        are filtered and formatted by every configured handler, without being written. Only
+        the filters known to hold no state are run. The first real records then skip one-time
+        costs like lazy imports and `linecache` loads.
+        The time it took is logged by the `loggia.prewarm` logger.
+        """
+        self.prewarm = is_truthy_string(enabled)
+
+    @env.register("LOGGIA_LEAN_RECORDS")
+    def set_lean_records(self, enabled: bool | str) -> None:
+        """Explicitly enable or disable skipping the record attributes that no formatter or filter reads.
+
+        When set to true, `initialize()` unsets `logging.logThreads`, `logging.logProcesses`,
+        `logging.logMultiprocessing` and `logging.logAsyncioTasks` when none of the configured
+        formatters and filters read the attributes they control. With the Prod preset, records
+        no longer look up their process id and name. Unknown formatters, filters or handlers
+        leave all flags alone. Handlers added after `initialize()` are not taken into account.
+        """
+        self.lean_records = is_truthy_string(enabled)
+
+    @env.register("LOGGIA_STRIP_BELOW")
+    def set_strip_below(self, level: int | str | None) -> None:
+        """Replace the logging methods below this level by no-ops, on the loggers for which they are disabled.
+
+        With `INFO`, a disabled `logger.debug(...)` call costs about as much as a bare function call.
+        Stripped methods are evaluated again when levels change through `initialize()` or
+        [loggia.reconfigure][], but not through [logging.Logger.setLevel][].
+        A falsy value disables stripping.
+        """
+        if level is None or (isinstance(level, str) and (not level or is_falsy_string(level))):
+            self.strip_below = None
+        else:
+            self.strip_below = logging._checkLevel(clean_log_level(level))  # type: ignore[attr-defined]
+
+    def _use_loggia_handler(self) -> None:
+        assert "handlers" in self._dictconfig  # noqa: S101
+        default_handler = self._dictconfig["handlers"]["default"]
+        if default_handler.get("class") == "logging.StreamHandler":
+            default_handler["class"] = "loggia.stdlib_handlers.stream_handler.LoggiaStreamHandler"
+
     def _enforce_logger(self, logger_name: str) -> None:
         assert "loggers" in self._dictconfig  # noqa: S101
         if logger_name not in self._dictconfig["loggers"]:
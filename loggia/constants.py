@@ -7,7 +7,7 @@ from typing import Final
 FORMAT_FIELDS = ["asctime", "levelname", "name", "lineno", "message", "filename"]
 """Fields use in the formatter"""
 
-SAFE_HEADER_ATTRIBUTES: Final[list[str]] = [
+SAFE_HEADER_ATTRIBUTES: Final[tuple[str, ...]] = (
     "accept",
     "accept-encoding",
     "accept-language",
@@ -17,7 +17,6 @@ SAFE_HEADER_ATTRIBUTES: Final[list[str]] = [
     "connection",
     "content-length",
     "content-encoding",
-    "content-length",
     "content-type",
     "content-language",
     "content-range",
@@ -25,8 +24,8 @@ SAFE_HEADER_ATTRIBUTES: Final[list[str]] = [
     "cookie",
     "etag",
     "pragma",
-]
-"""Headers that can be safely logged."""
+)
+"""Headers that can be safely logged. Immutable, as it is shared by all threads."""
 
 HYPERCORN_ATTRIBUTES_MAP: Final[dict[str, str]] = {
     "s": "http.status_code",
@@ -107,7 +106,7 @@ has the lowest precedence over any kind of configuration in Loggia.
 """
 
 
-TRUTHY_STRINGS = {"Y", "YES", "JA", "OUI", "1", "TRUE", "ENABLED", "ACTIVATED", "ARMED"}
+TRUTHY_STRINGS = {"Y", "YES", "JA", "OUI", "1", "TRUE", "ON", "ENABLED", "ACTIVATED", "ARMED"}
 
 
-FALSY_STRINGS = {"N", "NO", "NEIN", "NON", "0", "FALSE", "DISABLED", "DEACTIVATED", "DISARMED", "BY CHTULU, NO!"}
+FALSY_STRINGS = {"N", "NO", "NEIN", "NON", "0", "FALSE", "OFF", "DISABLED", "DEACTIVATED", "DISARMED", "BY CHTULU, NO!"}
@@ -0,0 +1,120 @@
+"""Exception fingerprinting and stack trace deduplication."""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from logging import LogRecord
+    from types import CodeType, TracebackType
+
+_FingerprintKey = tuple[type, tuple[tuple["CodeType", int], ...]]
+
+
+def _fingerprint_key(exc_type: type[BaseException], tb: TracebackType | None) -> _FingerprintKey:
+    locations = []
+    while tb is not None:
+        locations.append((tb.tb_frame.f_code, tb.tb_lineno))
+        tb = tb.tb_next
+    return (exc_type, tuple(locations))
+
+
+def _fingerprint_digest(key: _FingerprintKey) -> str:
+    exc_type, locations = key
+    h = hashlib.blake2b(f"{exc_type.__module__}.{exc_type.__qualname__}".encode(), digest_size=8)
+    for code, lineno in locations:
+        h.update(f"\0{code.co_filename}:{code.co_name}:{lineno}".encode())
+    return h.hexdigest()
+
+
+def exception_fingerprint(exc_type: type[BaseException], tb: TracebackType | None) -> str:
+    """Fingerprint an exception by its type and the code locations of its frames.
+
+    The traceback is walked frame by frame: it is never formatted, and no source
+    file is read. The fingerprint is stable across processes.
+    """
+    return _fingerprint_digest(_fingerprint_key(exc_type, tb))
+
+
+class _Occurrences:
+    __slots__ = ("count", "fingerprint", "window_start")
+
+    def __init__(self, fingerprint: str, window_start: float):
+        self.fingerprint = fingerprint
+        self.window_start = window_start
+        self.count = 0
+
+
+class ExceptionDedup:
+    """A filter that ships the stack trace of a given exception once per time window.
+
+    Exceptions are fingerprinted by type and frame code locations. The first occurrence
+    of a fingerprint in a window goes through untouched, with an added `error.fingerprint`
+    attribute. Later occurrences in the same window have their `exc_info` stripped, and
+    only carry `error.fingerprint`, `error.count`, `error.kind` and `error.message`.
+
+    The registry of known fingerprints is bounded to `max_entries`, the least recently
+    seen fingerprints being evicted first.
+
+    NB: The record is mutated in place, which is visible to any handler processing it
+    after this filter.
+    """
+
+    def __init__(self, window: float = 60.0, max_entries: int = 1024):
+        self.window = window
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._occurrences: OrderedDict[_FingerprintKey, _Occurrences] = OrderedDict()
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Pickled with compiled configurations: the settings travel, the lock and registry do not.
+        return {"window": self.window, "max_entries": self.max_entries}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+        self._occurrences = OrderedDict()
+
+    def occurrence(self, exc_type: type[BaseException], tb: TracebackType | None) -> tuple[str, int]:
+        """Register an occurrence of an exception, and return its fingerprint and count in the current window."""
+        key = _fingerprint_key(exc_type, tb)
+        now = time.monotonic()
+        with self._lock:
+            occurrences = self._occurrences.get(key)
+            if occurrences is None:
+                occurrences = _Occurrences(_fingerprint_digest(key), now)
+                self._occurrences[key] = occurrences
+                if len(self._occurrences) > self.max_entries:
+                    self._occurrences.popitem(last=False)
+            else:
+                self._occurrences.move_to_end(key)
+                if now - occurrences.window_start >= self.window:
+                    occurrences.window_start = now
+                    occurrences.count = 0
+            occurrences.count += 1
+            return occurrences.fingerprint, occurrences.count
+
+    def record_fields(self) -> set[str]:
+        """The standard record attributes this filter reads."""
+        return {"exc_info"}
+
+    def filter(self, record: LogRecord) -> bool:
+        if self.window <= 0 or not isinstance(record.exc_info, tuple):
+            return True
+        exc_type, exc_value, exc_traceback = record.exc_info
+        if exc_type is None:
+            return True
+
+        fingerprint, count = self.occurrence(exc_type, exc_traceback)
+        setattr(record, "error.fingerprint", fingerprint)
+        if count > 1:
+            setattr(record, "error.count", count)
+            setattr(record, "error.kind", f"{exc_type.__module__}.{exc_type.__name__}")
+            setattr(record, "error.message", str(exc_value))
+            record.exc_info = None
+            record.exc_text = None
+        return True
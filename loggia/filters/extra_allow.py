@@ -14,6 +14,10 @@ class ExtraAllow:
     def __init__(self, allow_list: list[str] | set[str]):
         self.allow_list = set(allow_list)
 
+    def record_fields(self) -> set[str]:
+        """The standard record attributes this filter reads: none, it only reads extra attributes."""
+        return set()
+
     def filter(self, record: LogRecord) -> bool:
         to_remove = [k for k, _ in extra_fields(record) if k not in self.allow_list]
         for k in to_remove:
@@ -0,0 +1,224 @@
+"""Declarative filter rules, compiled once into a single filter.
+
+Rules use the syntax described in `loggia._internal.rules`, with these fields:
+
+- `logger`: the logger name. `=` is an exact match, a match of the logger and its
+  children if the value ends with `.*`, or a prefix match if it otherwise ends with `*`.
+  `~` searches for a regular expression.
+- `level`: the record level, compared with a level name or number.
+- `msg`: the formatted message. `=` is an exact match, `~` searches for a regular expression.
+
+Actions are `keep` or `drop`. The first matching rule decides, and records matching no rule are kept:
+
+    logger=botocore.* and level<WARNING -> drop; msg~"healthcheck" -> drop
+
+The `logger` and `level` conditions only depend on the logger name and level of a record:
+they are evaluated once per name and level, and their outcome is cached. What is left to
+do per record is a dict lookup and, when rules with `msg` conditions remain, a single
+search with a regular expression combining them. The cost of filtering a record does not
+grow with the number of rules, unless its message matches one of them.
+"""
+
+from __future__ import annotations
+
+import logging
+import operator
+import re
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple, Optional
+
+from loggia._internal.rules import Condition, RuleSyntaxError, parse_rules
+from loggia.utils.strutils import clean_log_level
+
+if TYPE_CHECKING:
+    from logging import LogRecord
+
+_Static = Callable[[str, int], bool]
+_Dynamic = Callable[[str], bool]
+_Search = Callable[[str], Optional["re.Match[str]"]]
+
+_NUMERIC_OPS: dict[str, Callable[[int, int], bool]] = {
+    "=": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+_ACTIONS = {"keep": True, "drop": False}
+
+
+class _CompiledRule(NamedTuple):
+    static: tuple[_Static, ...]
+    dynamic: tuple[_Dynamic, ...]
+    # A regular expression the message must match for the rule to match, if any
+    hint: str | None
+    keep: bool
+
+
+class _Outcome(NamedTuple):
+    keep: bool
+    pending: tuple[_CompiledRule, ...]
+    search: _Search | None
+
+
+def _compile_logger(cond: Condition) -> _Static:
+    value = cond.value
+    if cond.op == "~":
+        search = re.compile(value).search
+        return lambda name, _level: search(name) is not None
+    if cond.op not in ("=", "!="):
+        raise RuleSyntaxError(f"Unsupported operator for logger: {cond.op!r}")
+    match: Callable[[str], bool]
+    if value.endswith(".*"):
+        parent, prefix = value[:-2], value[:-1]
+        match = lambda name: name == parent or name.startswith(prefix)  # noqa: E731
+    elif value.endswith("*"):
+        prefix = value[:-1]
+        match = lambda name: name.startswith(prefix)  # noqa: E731
+    else:
+        match = lambda name: name == value  # noqa: E731
+    if cond.op == "=":
+        return lambda name, _level: match(name)
+    return lambda name, _level: not match(name)
+
+
+def _compile_level(cond: Condition) -> _Static:
+    if cond.op not in _NUMERIC_OPS:
+        raise RuleSyntaxError(f"Unsupported operator for level: {cond.op!r}")
+    try:
+        value: int = logging._checkLevel(clean_log_level(cond.value))  # type: ignore[attr-defined]
+    except ValueError:
+        raise RuleSyntaxError(f"Unknown level in filter rules: {cond.value!r}") from None
+    op = _NUMERIC_OPS[cond.op]
+    return lambda _name, level: op(level, value)
+
+
+def _compile_msg(cond: Condition) -> tuple[_Dynamic, str | None]:
+    value = cond.value
+    if cond.op == "~":
+        search = re.compile(value).search
+        return (lambda msg: search(msg) is not None), value
+    if cond.op == "=":
+        return (lambda msg: msg == value), rf"\A{re.escape(value)}\Z"
+    if cond.op == "!=":
+        return (lambda msg: msg != value), None
+    raise RuleSyntaxError(f"Unsupported operator for msg: {cond.op!r}")
+
+
+def _compile_rule(conditions: tuple[Condition, ...], action: str) -> _CompiledRule:
+    if action not in _ACTIONS:
+        raise RuleSyntaxError(f"Unknown filter action: {action!r}, expected keep or drop")
+    static: list[_Static] = []
+    dynamic: list[_Dynamic] = []
+    hint = None
+    for cond in conditions:
+        if cond.field == "logger":
+            static.append(_compile_logger(cond))
+        elif cond.field == "level":
+            static.append(_compile_level(cond))
+        elif cond.field == "msg":
+            predicate, pattern = _compile_msg(cond)
+            dynamic.append(predicate)
+            hint = hint or pattern
+        else:
+            raise RuleSyntaxError(f"Unknown filter field {cond.field!r}, expected one of logger, level, msg")
+    return _CompiledRule(tuple(static), tuple(dynamic), hint, _ACTIONS[action])
+
+
+# A numbered backreference or conditional, not escaped: joined patterns have their groups renumbered
+_NUMBERED_REFERENCE = re.compile(r"(?<!\\)(?:\\\\)*(?:\\[1-9]|\(\?\(\d)")
+
+
+@lru_cache(maxsize=256)
+def _combined_search(hints: tuple[str, ...]) -> _Search | None:
+    if any(_NUMBERED_REFERENCE.search(hint) for hint in hints):
+        return None
+    try:
+        return re.compile("|".join(f"(?:{hint})" for hint in hints)).search
+    except re.error:
+        # Some patterns, like those with global inline flags, do not combine
+        return None
+
+
+class FilterRules:
+    """A filter that keeps or drops records according to declarative rules, compiled once.
+
+    Outcomes are cached per logger name and level, up to `max_entries` of them.
+    """
+
+    def __init__(self, rules: str, max_entries: int = 4096):
+        self.max_entries = max_entries
+        self.set_rules(rules)
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Pickled with compiled configurations: the rules travel, and are compiled again
+        return {"rules": self.rules, "max_entries": self.max_entries}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.max_entries = state["max_entries"]
+        self.set_rules(state["rules"])
+
+    def set_rules(self, rules: str) -> None:
+        """Compile and use new rules.
+
+        Raises:
+            ValueError: If the rules are malformed.
+        """
+        self._rules = tuple(_compile_rule(rule.conditions, rule.action) for rule in parse_rules(rules))
+        self._outcomes: dict[tuple[str, int], _Outcome] = {}
+        self.rules = rules
+
+    def _outcome(self, name: str, level: int) -> _Outcome:
+        keep = True
+        pending: list[_CompiledRule] = []
+        for rule in self._rules:
+            if not all(predicate(name, level) for predicate in rule.static):
+                continue
+            if not rule.dynamic:
+                keep = rule.keep
+                break
+            pending.append(rule)
+        # Trailing rules with the same action as the fallback cannot change the outcome
+        while pending and pending[-1].keep == keep:
+            pending.pop()
+        hints = tuple(rule.hint for rule in pending if rule.hint is not None)
+        search = _combined_search(hints) if pending and len(hints) == len(pending) else None
+        outcome = _Outcome(keep, tuple(pending), search)
+        if len(self._outcomes) >= self.max_entries:
+            self._outcomes.clear()
+        self._outcomes[(name, level)] = outcome
+        return outcome
+
+    def record_fields(self) -> set[str]:
+        """The standard record attributes this filter reads."""
+        return {"name", "levelno", "msg", "args"}
+
+    def _keep_message(self, outcome: _Outcome, msg: str) -> bool:
+        if outcome.search is not None and outcome.search(msg) is None:
+            return outcome.keep
+        for rule in outcome.pending:
+            if all(predicate(msg) for predicate in rule.dynamic):
+                return rule.keep
+        return outcome.keep
+
+    def keep(self, name: str, level: int, msg: object) -> bool:
+        """Decide from a logger name, level and message template, before any record is created.
+
+        `msg` conditions are matched against the message template, not the formatted message.
+        """
+        outcome = self._outcomes.get((name, level))
+        if outcome is None:
+            outcome = self._outcome(name, level)
+        if not outcome.pending:
+            return outcome.keep
+        return self._keep_message(outcome, msg if isinstance(msg, str) else str(msg))
+
+    def filter(self, record: LogRecord) -> bool:
+        outcome = self._outcomes.get((record.name, record.levelno))
+        if outcome is None:
+            outcome = self._outcome(record.name, record.levelno)
+        if not outcome.pending:
+            return outcome.keep
+        return self._keep_message(outcome, record.getMessage())
@@ -0,0 +1,183 @@
+"""Garbage collection pauses and memory pressure reporting.
+
+When enabled with `LOGGIA_GC_MONITOR` or the opt-in `gc_monitor` preset, a [gc.callbacks][] callback
+times each collection. Collections longer than `LOGGIA_GC_THRESHOLD` are logged on the `loggia.gc`
+logger with their generation, duration, objects collected and the resident set size (RSS) of the
+process, and a summary of all collections is logged every `LOGGIA_GC_SUMMARY_INTERVAL` seconds.
+
+The callback never logs: it runs in the middle of whatever code triggered the collection, possibly
+logging itself. It only updates preallocated counters and queues slow collections. Loggia's handler
+logs them before the next record it writes, with the time of the collection as their time, so that
+they line up with the surrounding request logs. A background thread logs them, and the summaries,
+when nothing else is logged for a while.
+"""
+
+from __future__ import annotations
+
+import gc
+import logging
+import os
+import threading
+import time
+from collections import deque
+from typing import Any
+
+_GENERATIONS = 3
+
+try:
+    _PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+except (AttributeError, ValueError, OSError):
+    _PAGE_SIZE = 0
+
+
+def rss_bytes() -> int | None:
+    """Return the resident set size of the current process, or None if it is unknown on this platform."""
+    if not _PAGE_SIZE:
+        return None
+    try:
+        with open("/proc/self/statm", "rb") as statm:  # noqa: PTH123
+            return int(statm.read().split()[1]) * _PAGE_SIZE
+    except (OSError, IndexError, ValueError):
+        return None
+
+
+class GCMonitor:
+    """Times garbage collections from a [gc.callbacks][] callback, and logs them later."""
+
+    enabled: bool = False
+    summary_interval: float = 60.0
+    flush_interval: float = 1.0
+
+    def __init__(self, threshold: float = 0.01, max_pending: int = 256) -> None:
+        self.threshold = threshold
+        self._start_ns = 0
+        self._pending: deque[tuple[float, int, int, int, int]] = deque(maxlen=max_pending)
+        self._collections = [0] * _GENERATIONS
+        self._pause_ns = [0] * _GENERATIONS
+        self._max_pause_ns = [0] * _GENERATIONS
+        self._collected = [0] * _GENERATIONS
+        self._next_summary = 0.0
+        self._flush_lock = threading.Lock()
+
+    @property
+    def threshold(self) -> float:
+        """The duration (in seconds) above which a collection is logged."""
+        return self._threshold_ns / 1e9
+
+    @threshold.setter
+    def threshold(self, seconds: float) -> None:
+        self._threshold_ns = int(seconds * 1e9)
+
+    def callback(self, phase: str, info: dict[str, int]) -> None:
+        if phase == "start":
+            self._start_ns = time.perf_counter_ns()
+            return
+        duration_ns = time.perf_counter_ns() - self._start_ns
+        generation = info["generation"]
+        self._collections[generation] += 1
+        self._pause_ns[generation] += duration_ns
+        self._collected[generation] += info["collected"]
+        self._max_pause_ns[generation] = max(self._max_pause_ns[generation], duration_ns)
+        if duration_ns >= self._threshold_ns:
+            self._pending.append((time.time(), generation, duration_ns, info["collected"], info["uncollectable"]))
+
+    def flush(self) -> None:
+        """Log the pending slow collections and, when due, a summary. Called by Loggia's handler and the flusher thread."""
+        # Not blocking: the records logged below go through Loggia's handler too, and one flusher at a time is enough
+        if not self._flush_lock.acquire(blocking=False):
+            return
+        try:
+            self._flush()
+        finally:
+            self._flush_lock.release()
+
+    def _flush(self) -> None:
+        while self._pending:
+            try:
+                created, generation, duration_ns, collected, uncollectable = self._pending.popleft()
+            except IndexError:
+                break
+            extra = {
+                "gc.generation": generation,
+                "gc.duration_ms": round(duration_ns / 1e6, 3),
+                "gc.collected": collected,
+                "gc.uncollectable": uncollectable,
+                "gc.rss_bytes": rss_bytes(),
+            }
+            _log_at(created, logging.WARNING, "Slow garbage collection", extra)
+        if self.summary_interval > 0 and time.monotonic() >= self._next_summary:
+            self._next_summary = time.monotonic() + self.summary_interval
+            self.log_summary()
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the collections, pauses and objects collected per generation since the last summary."""
+        return {
+            "gc.collections": list(self._collections),
+            "gc.pause_ms": [round(ns / 1e6, 3) for ns in self._pause_ns],
+            "gc.max_pause_ms": [round(ns / 1e6, 3) for ns in self._max_pause_ns],
+            "gc.collected": list(self._collected),
+            "gc.garbage": len(gc.garbage),
+            "gc.rss_bytes": rss_bytes(),
+        }
+
+    def reset(self) -> None:
+        for counters in (self._collections, self._pause_ns, self._max_pause_ns, self._collected):
+            counters[:] = [0] * _GENERATIONS
+        self._pending.clear()
+
+    def log_summary(self) -> None:
+        extra = self.snapshot()
+        for counters in (self._collections, self._pause_ns, self._max_pause_ns, self._collected):
+            counters[:] = [0] * _GENERATIONS
+        logging.getLogger("loggia.gc").info("Garbage collection summary", extra=extra)
+
+
+def _log_at(created: float, level: int, msg: str, extra: dict[str, Any]) -> None:
+    logger = logging.getLogger("loggia.gc")
+    if not logger.isEnabledFor(level):
+        return
+    record = logger.makeRecord(logger.name, level, __file__, 0, msg, (), None, extra=extra)
+    record.created = created
+    record.msecs = (created - int(created)) * 1000
+    logger.handle(record)
+
+
+monitor = GCMonitor()
+"""The process-wide garbage collection monitor."""
+
+_stop: threading.Event | None = None
+
+
+def _flush_periodically(stop: threading.Event, interval: float) -> None:
+    # The gc callback cannot wake this thread: setting an event takes a lock the collecting thread may hold
+    while not stop.wait(interval):
+        monitor.flush()
+
+
+def configure(*, enabled: bool, threshold: float = 0.01, summary_interval: float = 60.0) -> None:
+    """Enable or disable the garbage collection monitor, with a slow collection `threshold` and summary interval (in seconds, 0 disables summaries)."""
+    global _stop  # noqa: PLW0603 # pylint: disable=global-statement
+    monitor.threshold = threshold
+    monitor.summary_interval = summary_interval
+    monitor._next_summary = time.monotonic() + summary_interval
+    monitor.enabled = enabled
+    if enabled and monitor.callback not in gc.callbacks:
+        gc.callbacks.append(monitor.callback)
+    elif not enabled and monitor.callback in gc.callbacks:
+        gc.callbacks.remove(monitor.callback)
+    if _stop is not None:
+        stop, _stop = _stop, None
+        stop.set()
+    if enabled:
+        _stop = threading.Event()
+        threading.Thread(target=_flush_periodically, args=(_stop, monitor.flush_interval), name="loggia-gc-monitor", daemon=True).start()
+
+
+def snapshot() -> dict[str, Any]:
+    """Return the garbage collection statistics since the last summary."""
+    return monitor.snapshot()
+
+
+def reset() -> None:
+    """Reset all statistics and drop the pending slow collections."""
+    monitor.reset()
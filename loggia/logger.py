@@ -4,17 +4,24 @@ from __future__ import annotations
 
 import logging
 import logging.config
+import os
 import sys
 import threading
+import warnings
 from collections.abc import Mapping
 from typing import TYPE_CHECKING
 
 from loggia._internal.bootstrap_logger import bootstrap_logger
+from loggia._internal.import_hooks import uninstall as uninstall_import_hook
+from loggia._internal.import_hooks import when_imported
 from loggia.conf import FlexibleFlag, LoggerConfiguration
 
 if TYPE_CHECKING:
     from types import TracebackType
 
+# The configuration last given to initialize(), for features imported afterwards
+_initialized_conf: LoggerConfiguration | None = None
+
 
 def _patch_to_add_level(level_number: int, level_name: str) -> None:
     """Add a new level to the standard logger.
@@ -32,6 +39,10 @@ def _bootstrap_config(
     conf: LoggerConfiguration | dict[str, str] | None = None,
     presets: str | list[str] | None = None,
 ) -> LoggerConfiguration:
+    if conf is None and presets is None and "LOGGIA_COMPILED_CONFIG" in os.environ:
+        from loggia._internal.compiled import load_compiled_configuration  # noqa: PLC0415
+
+        conf = load_compiled_configuration()
     if conf is None:
         conf = LoggerConfiguration(presets=presets)
     if isinstance(conf, Mapping):
@@ -43,6 +54,7 @@ def _bootstrap_config(
 
 def initialize(conf: LoggerConfiguration | dict[str, str] | None = None, presets: str | list[str] | None = None) -> None:
     """Initialize the logging system."""
+    global _initialized_conf  # noqa: PLW0603 # pylint: disable=global-statement
     conf = _bootstrap_config(conf, presets)
 
     if conf.setup_excepthook:
@@ -54,28 +66,147 @@ def initialize(conf: LoggerConfiguration | dict[str, str] | None = None, presets
     if conf.setup_threading_excepthook:
         _set_threading_excepthook(logging.getLogger())
 
-    # XXX asyncio bullshit?
-    # XXX audit subsystem bridge
-
-    if conf.capture_warnings:
-        # XXX test
-        logging.captureWarnings(capture=True)
-
-    if conf.capture_loguru in (FlexibleFlag.AUTO, FlexibleFlag.ENABLED):
-        try:
-            from loggia.loguru_sink import configure_loguru
-
-            _patch_to_add_level(5, "TRACE")
-            _patch_to_add_level(25, "SUCCESS")
-            configure_loguru(conf)
-        except ModuleNotFoundError as e:
-            if conf.capture_loguru == FlexibleFlag.ENABLED:
-                bootstrap_logger.error("Failed to configure loguru! Is is installed?", e)
+    # Optional features are only imported when enabled, or to reset them once they were imported
+    _set_asyncio_monitor(conf)
+    _set_access_sampler(conf)
+    _set_metrics(conf)
+    _set_gc_monitor(conf)
+    _set_dump_signal(conf)
+    _set_audit_bridge(conf)
+
+    if conf.capture_warnings or "loggia._internal.warnings_bridge" in sys.modules:
+        _set_showwarning(logging.getLogger("py.warnings"), conf)
+
+    if conf.capture_loguru == FlexibleFlag.ENABLED:
+        _capture_loguru(conf)
+    elif conf.capture_loguru == FlexibleFlag.AUTO:
+        # Importing loguru is not free: leave it to the application, and capture it then
+        when_imported("loguru", lambda _: _capture_loguru(conf))
+    else:
+        uninstall_import_hook("loguru")
 
     # XXX Check that logger levels exists
     # BIM BAM BADABEEM BADABOOM, LOGGIA MAGICA!
     logging.config.dictConfig(conf._dictconfig)
 
+    _set_logger_features(conf)
+    _prewarm(conf)
+    _set_stage_timings(conf)
+
+    _initialized_conf = conf
+    if conf.reconfigure_file or conf.reconfigure_signal is not None or conf.control_socket or "loggia.reconfigure" in sys.modules:
+        import loggia.reconfigure
+
+        loggia.reconfigure.install(conf)
+
+
+def _set_access_sampler(conf: LoggerConfiguration) -> None:
+    if conf.access_log_sampling or "loggia._internal.access_sampling" in sys.modules:
+        from loggia._internal.access_sampling import install_access_sampler
+
+        install_access_sampler(conf.access_log_sampling)
+
+
+def _set_metrics(conf: LoggerConfiguration) -> None:
+    if conf.metrics_enabled or "loggia.metrics" in sys.modules:
+        import loggia.metrics
+
+        loggia.metrics.configure(
+            enabled=conf.metrics_enabled, summary_interval=conf.metrics_summary_interval, suppressed=conf.metrics_suppressed
+        )
+    if conf.callsite_profiler_enabled or "loggia.callsites" in sys.modules:
+        import loggia.callsites
+
+        if conf.callsite_profiler_enabled:
+            loggia.callsites.enable(window=conf.callsite_profiler_window)
+        else:
+            loggia.callsites.disable()
+
+
+def _set_gc_monitor(conf: LoggerConfiguration) -> None:
+    if conf.gc_monitor_enabled or "loggia.gc_monitor" in sys.modules:
+        import loggia.gc_monitor
+
+        loggia.gc_monitor.configure(enabled=conf.gc_monitor_enabled, threshold=conf.gc_threshold, summary_interval=conf.gc_summary_interval)
+
+
+def _set_dump_signal(conf: LoggerConfiguration) -> None:
+    if conf.dump_signal is not None or "loggia._internal.logger_dump" in sys.modules:
+        from loggia._internal.logger_dump import install_dump_signal
+
+        install_dump_signal(conf.dump_signal)
+
+
+def _set_audit_bridge(conf: LoggerConfiguration) -> None:
+    # The audit hook cannot be removed: only update the bridge once it is installed
+    if conf.audit_events or "loggia._internal.audit_bridge" in sys.modules:
+        from loggia._internal import audit_bridge
+
+        if conf.audit_events or audit_bridge._bridge is not None:
+            audit_bridge.install_audit_bridge(logging.getLogger("loggia.audit"), conf.audit_events, conf.audit_rate_limit)
+
+
+def _set_logger_features(conf: LoggerConfiguration) -> None:
+    # Applied to the loggers dictConfig just configured
+    if conf.strip_below is not None or "loggia._internal.strip" in sys.modules:
+        from loggia._internal import strip
+
+        strip.configure(conf.strip_below)
+
+    if conf.lean_records or "loggia._internal.record_fields" in sys.modules:
+        from loggia._internal import record_fields
+
+        record_fields.configure(enabled=conf.lean_records)
+
+    count_suppressed = conf.metrics_enabled and conf.metrics_suppressed
+    if (
+        conf.pre_filter_rules
+        or conf.filename_on_modified_stack
+        or conf.logger_callers
+        or count_suppressed
+        or "loggia._internal.logger_class" in sys.modules
+    ):
+        from loggia._internal import logger_class
+
+        logger_class.configure(
+            conf.pre_filter_rules,
+            mark_stacklevel=conf.filename_on_modified_stack,
+            callers=dict(conf.logger_callers),
+            count_suppressed=count_suppressed,
+        )
+
+
+def _set_stage_timings(conf: LoggerConfiguration) -> None:
+    if conf.stage_timings_enabled or "loggia.timings" in sys.modules:
+        import loggia.timings
+
+        loggia.timings.configure(enabled=conf.stage_timings_enabled)
+        if conf.stage_timings_enabled:
+            loggers = [logging.getLogger(name) for name in conf._dictconfig.get("loggers", {})]
+            loggia.timings.instrument([logging.getLogger(), *loggers])
+
+
+def _prewarm(conf: LoggerConfiguration) -> None:
+    if not conf.prewarm:
+        return
+    from loggia._internal.prewarm import prewarm  # noqa: PLC0415
+
+    duration = prewarm(logging.getLogger(name) for name in conf._dictconfig.get("loggers", {}))
+    extra = {"prewarm.duration_ms": round(duration * 1000, 3)}
+    logging.getLogger("loggia.prewarm").info("Warmed up logging in %.1f ms", duration * 1000, extra=extra)
+
+
+def _capture_loguru(conf: LoggerConfiguration) -> None:
+    try:
+        from loggia.loguru_sink import configure_loguru
+
+        _patch_to_add_level(5, "TRACE")
+        _patch_to_add_level(25, "SUCCESS")
+        configure_loguru(conf)
+    except ModuleNotFoundError as e:
+        if conf.capture_loguru == FlexibleFlag.ENABLED:
+            bootstrap_logger.error("Failed to configure loguru! Is is installed?", e)
+
 
 def _set_excepthook(logger: logging.Logger) -> None:
     def _excepthook(exc_type: type[BaseException], exc_value: BaseException, exc_traceback: TracebackType | None) -> None:
@@ -100,3 +231,21 @@ def _set_threading_excepthook(logger: logging.Logger) -> None:
         logger.critical(msg, exc_info={args.exc_type, args.exc_value, args.exc_traceback})  # type:ignore[arg-type]
 
     threading.excepthook = _excepthook
+
+
+def _set_showwarning(logger: logging.Logger, conf: LoggerConfiguration) -> None:
+    from loggia._internal.warnings_bridge import WarningsBridge
+
+    previous_bridge = getattr(warnings.showwarning, "__self__", None)
+    if isinstance(previous_bridge, WarningsBridge):
+        previous_bridge.uninstall()
+    if conf.capture_warnings:
+        WarningsBridge(logger, summary_interval=conf.warnings_summary_interval).install()
+
+
+def _set_asyncio_monitor(conf: LoggerConfiguration) -> None:
+    # Importing asyncio is not free: only do it for applications that want the monitor
+    if conf.asyncio_monitor or "loggia._internal.asyncio_monitor" in sys.modules:
+        from loggia._internal.asyncio_monitor import install_asyncio_monitor
+
+        install_asyncio_monitor(conf.asyncio_monitor, conf.asyncio_slow_callback, conf.asyncio_lag_threshold)
@@ -0,0 +1,180 @@
+"""Lightweight logging metrics, to find out which loggers produce your log bill.
+
+When enabled with `LOGGIA_METRICS`, Loggia's handler counts, per logger and per level:
+
+- `records`: the number of records written
+- `bytes`: the number of characters written, terminator included. This is the number
+  of bytes for ASCII output, like the default JSON output.
+- `dropped`: the number of records dropped by the filters of Loggia's handler, which include
+  the filters Loggia adds itself. Records dropped by the filters of loggers are not counted.
+- `format_errors`: the number of records that failed to be formatted
+- `suppressed`: the number of logging calls rejected by the level of their logger, or because
+  it is disabled, before any record is created. Only counted with `LOGGIA_METRICS_SUPPRESSED`,
+  which makes Loggia's logger class count them in `isEnabledFor`.
+
+Counters are kept per thread, so that updating them never takes a lock, and are only
+aggregated when read through [snapshot][loggia.metrics.snapshot]. The counters of a thread
+are merged into shared totals when it ends.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import weakref
+
+_COUNTERS = ("records", "bytes", "dropped", "format_errors", "suppressed")
+_RECORDS, _BYTES, _DROPPED, _FORMAT_ERRORS, _SUPPRESSED = range(len(_COUNTERS))
+
+
+class _ThreadOwner:
+    """Lives as long as the thread locals holding it."""
+
+
+class LoggingMetrics:
+    """Per-thread counters, aggregated when read."""
+
+    enabled: bool = False
+    suppressed: bool = False
+    summary_interval: float = 0.0
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._all_counters: dict[int, dict[tuple[str, int], list[int]]] = {}
+        # Counters of the threads that ended
+        self._retired: dict[tuple[str, int], list[int]] = {}
+        self._next_summary = 0.0
+
+    def _counters(self) -> dict[tuple[str, int], list[int]]:
+        try:
+            return self._local.counters  # type: ignore[no-any-return]
+        except AttributeError:
+            counters: dict[tuple[str, int], list[int]] = {}
+            # Only referenced by this thread's locals: finalized when the thread ends
+            owner = _ThreadOwner()
+            weakref.finalize(owner, self._retire, counters)
+            self._local.counters = counters
+            self._local.owner = owner
+            with self._lock:
+                self._all_counters[id(counters)] = counters
+            return counters
+
+    def _retire(self, counters: dict[tuple[str, int], list[int]]) -> None:
+        with self._lock:
+            for key, row in counters.items():
+                retired = self._retired.setdefault(key, [0] * len(_COUNTERS))
+                for idx, value in enumerate(row):
+                    retired[idx] += value
+            del self._all_counters[id(counters)]
+
+    def _row(self, name: str, levelno: int) -> list[int]:
+        counters = self._counters()
+        key = (name, levelno)
+        row = counters.get(key)
+        if row is None:
+            row = counters[key] = [0] * len(_COUNTERS)
+        return row
+
+    def count_emitted(self, record: logging.LogRecord, size: int) -> None:
+        row = self._row(record.name, record.levelno)
+        row[_RECORDS] += 1
+        row[_BYTES] += size
+
+    def count_dropped(self, record: logging.LogRecord) -> None:
+        self._row(record.name, record.levelno)[_DROPPED] += 1
+
+    def count_format_error(self, record: logging.LogRecord) -> None:
+        self._row(record.name, record.levelno)[_FORMAT_ERRORS] += 1
+
+    def count_suppressed(self, name: str, levelno: int) -> None:
+        self._row(name, levelno)[_SUPPRESSED] += 1
+
+    def snapshot(self, timeout: float = -1) -> dict[str, dict[str, dict[str, int]]]:
+        """Aggregate all threads' counters, as `{logger_name: {level_name: {counter: value}}}`.
+
+        When the lock cannot be acquired within `timeout` seconds, counters are read without
+        it. This is for signal handlers, which may interrupt a thread holding the lock.
+        """
+        locked = self._lock.acquire(timeout=timeout)
+        try:
+            all_counters = [self._retired.copy(), *(counters.copy() for counters in list(self._all_counters.values()))]
+        finally:
+            if locked:
+                self._lock.release()
+        result: dict[str, dict[str, dict[str, int]]] = {}
+        for counters in all_counters:
+            for (name, levelno), row in counters.items():
+                level = result.setdefault(name, {}).setdefault(logging.getLevelName(levelno), dict.fromkeys(_COUNTERS, 0))
+                for idx, counter in enumerate(_COUNTERS):
+                    level[counter] += row[idx]
+        return result
+
+    def totals(self) -> dict[str, int]:
+        """Aggregate all counters for all threads, loggers and levels."""
+        return _totals(self.snapshot())
+
+    def reset(self) -> None:
+        with self._lock:
+            for counters in self._all_counters.values():
+                counters.clear()
+            self._retired.clear()
+
+    def summary_due(self) -> bool:
+        """Whether a periodic summary record should be emitted now. Resets the summary timer if so."""
+        if self.summary_interval <= 0:
+            return False
+        now = time.monotonic()
+        if now < self._next_summary:
+            return False
+        with self._lock:
+            if now < self._next_summary:
+                return False
+            self._next_summary = now + self.summary_interval
+        return True
+
+    def log_summary(self) -> None:
+        snapshot = self.snapshot()
+        extra = {"loggia.metrics": snapshot, "loggia.metrics.totals": _totals(snapshot)}
+        logging.getLogger("loggia.metrics").info("Logging metrics summary", extra=extra)
+
+
+def _totals(snapshot: dict[str, dict[str, dict[str, int]]]) -> dict[str, int]:
+    result = dict.fromkeys(_COUNTERS, 0)
+    for levels in snapshot.values():
+        for counters in levels.values():
+            for counter, value in counters.items():
+                result[counter] += value
+    return result
+
+
+metrics = LoggingMetrics()
+"""The process-wide metrics instance."""
+
+
+def configure(*, enabled: bool, summary_interval: float = 0.0, suppressed: bool = False) -> None:
+    """Enable or disable metrics collection, and set the periodic summary interval (in seconds, 0 disables it).
+
+    With `suppressed`, the logging calls rejected by the level of their logger are counted too,
+    as long as Loggia's logger class is configured to count them.
+    """
+    metrics.enabled = enabled
+    metrics.suppressed = enabled and suppressed
+    metrics.summary_interval = summary_interval
+    metrics._next_summary = time.monotonic() + summary_interval
+
+
+def snapshot() -> dict[str, dict[str, dict[str, int]]]:
+    """Return the current metrics, as `{logger_name: {level_name: {counter: value}}}`."""
+    return metrics.snapshot()
+
+
+def totals() -> dict[str, int]:
+    """Return the current metrics, summed over all loggers and levels."""
+    return metrics.totals()
+
+
+def reset() -> None:
+    """Reset all counters to zero."""
+    metrics.reset()
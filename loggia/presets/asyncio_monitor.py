@@ -0,0 +1,17 @@
+"""Monitor asyncio event loops: log slow callbacks, event loop lag and uncaught exceptions.
+
+This preset is opt-in: add `asyncio_monitor` to `LOGGIA_PRESETS`, e.g. `LOGGIA_PRESETS=prod,asyncio_monitor`.
+Thresholds are set with `LOGGIA_ASYNCIO_SLOW_CALLBACK` and `LOGGIA_ASYNCIO_LAG_THRESHOLD`.
+"""
+
+from loggia.base_preset import BasePreset
+from loggia.conf import LoggerConfiguration
+
+
+class AsyncioMonitor(BasePreset):
+    @classmethod
+    def opt_in(cls) -> bool:
+        return True
+
+    def apply(self, conf: LoggerConfiguration) -> None:
+        conf.set_asyncio_monitor(enabled=True)
@@ -2,13 +2,11 @@
 
 from __future__ import annotations
 
-import os
 import sys
 import traceback
-from typing import TYPE_CHECKING, Any, Final
+from typing import TYPE_CHECKING, Any
 
-from loggia._internal.bootstrap_logger import bootstrap_logger
-from loggia._internal.conf import is_truthy_string
+from loggia._internal.datadog import get_ddtrace
 from loggia.base_preset import BasePreset
 
 if sys.version_info >= (3, 10):
@@ -26,15 +24,6 @@ if TYPE_CHECKING:
 
 ExcInfo: TypeAlias = "tuple[type[BaseException], BaseException, None | TracebackType]"
 
-# XXX(GabDug): cleanup ddtrace import
-DD_TRACE_ENABLED: Final[bool | None] = is_truthy_string(os.environ.get("DD_TRACE_ENABLED", False))
-if DD_TRACE_ENABLED:
-    try:
-        import ddtrace
-    except ImportError:
-        bootstrap_logger.error("DD_TRACE_ENABLED environment variable is set but ddtrace package cannot be loaded")
-        ddtrace = None  # type: ignore[assignment]
-
 try:
     from loggia._version import __version__
 except ImportError:
@@ -58,6 +47,9 @@ def _figure_out_exc_info(v: Any) -> sys._OptExcInfo | ExcInfo:
 
 
 class DatadogNormalisation(BasePreset):
+    def __init__(self) -> None:
+        self.ddtrace = get_ddtrace()
+
     @classmethod
     def slots(cls) -> list[str]:
         return ["normalization"]
@@ -70,6 +62,10 @@ class DatadogNormalisation(BasePreset):
         # XXX: self.__something__ ?
         pass
 
+    def record_fields(self) -> set[str]:
+        """The standard record attributes this filter reads."""
+        return {"name", "threadName", "funcName", "levelname", "exc_info"}
+
     def filter(self, record: logging.LogRecord) -> bool:
         setattr(record, "logger.name", record.name)
         setattr(record, "logger.thread_name", record.threadName)
@@ -97,6 +93,7 @@ class DatadogNormalisation(BasePreset):
 
         # DDTrace compatibility
         # XXX: Check intersection with DDTrace standard logger support
+        ddtrace = self.ddtrace
         if ddtrace:
             span = ddtrace.tracer.current_span()
             trace_id, span_id = (span.trace_id, span.span_id) if span else (None, None)
@@ -19,13 +19,13 @@ class Dev(BasePreset):
 
     @env.register(parser=ep.single_boolean_string)
     def set_add_filename_to_logs_with_modified_stack(self, value: bool) -> None:  # noqa: FBT001
-        # XXX pass that to PrettyFormatter and make the implementation actually optional
         self.add_filename_to_logs_with_modified_stack = value
 
     def apply(self, conf: LoggerConfiguration) -> None:
         conf.set_general_level("DEBUG")
         conf.set_default_formatter({"()": PrettyFormatter})
         conf.set_loguru_reconfiguration_block(enabled=True)
+        conf.set_filename_on_modified_stack(enabled=self.add_filename_to_logs_with_modified_stack)
 
         debug_spammers = (
             "asyncio",
@@ -0,0 +1,17 @@
+"""Report garbage collection pauses and memory pressure.
+
+This preset is opt-in: add `gc_monitor` to `LOGGIA_PRESETS`, e.g. `LOGGIA_PRESETS=prod,gc_monitor`.
+Tune it with `LOGGIA_GC_THRESHOLD` and `LOGGIA_GC_SUMMARY_INTERVAL`.
+"""
+
+from loggia.base_preset import BasePreset
+from loggia.conf import LoggerConfiguration
+
+
+class GcMonitor(BasePreset):
+    @classmethod
+    def opt_in(cls) -> bool:
+        return True
+
+    def apply(self, conf: LoggerConfiguration) -> None:
+        conf.set_gc_monitor(enabled=True)
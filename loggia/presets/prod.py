@@ -14,13 +14,14 @@ if TYPE_CHECKING:
     from loggia.types import UserDefinedObject
 
 
-def _build_json_formatter() -> UserDefinedObject[logging.Formatter]:
+def custom_json_formatter_ctor() -> CustomJsonFormatter:
+    # A module-level function rather than a closure, so that compiled configurations can pickle it
     attr_allowlist = {"name", "levelname", "pathname", "lineno", "funcName"}
     attrs = [x for x in CustomJsonFormatter.RESERVED_ATTRS if x not in attr_allowlist]
+    return CustomJsonFormatter(json_indent=None, json_encoder=CustomJsonEncoder, reserved_attrs=attrs, timestamp=True)
 
-    def custom_json_formatter_ctor() -> CustomJsonFormatter:
-        return CustomJsonFormatter(json_indent=None, json_encoder=CustomJsonEncoder, reserved_attrs=attrs, timestamp=True)
 
+def _build_json_formatter() -> UserDefinedObject[logging.Formatter]:
     return {"()": custom_json_formatter_ctor}
 
 
@@ -0,0 +1,382 @@
+"""Change the levels, propagation and filters of live loggers, without tearing down their handlers.
+
+[logging.config.dictConfig][] closes and recreates every handler, which can lose buffered records,
+and holds the logging lock, stalling all threads, while it does. [apply][loggia.reconfigure.apply]
+instead diffs a new [LoggerConfiguration][loggia.conf.LoggerConfiguration] against the one in place,
+and only changes the levels, propagation flags and filters that differ. Handlers, formatters and the
+other settings applied by `initialize()` stay as they are.
+
+Reconfigurations can be triggered from outside the process:
+
+- `LOGGIA_RECONFIGURE_FILE` names a file of `LOGGIA_*` settings, one `NAME=value` per line, laid over
+  the configuration given to `initialize()`. It is applied at startup, then again whenever it
+  changes (checked every `LOGGIA_RECONFIGURE_INTERVAL` seconds) and on `LOGGIA_RECONFIGURE_SIGNAL`.
+- `LOGGIA_CONTROL_SOCKET` names a Unix socket accepting one command per connection:
+  `level <logger> <LEVEL> [<seconds>]` (`root` for the root logger), `reload` and `show`.
+
+For instance, to raise a logger to DEBUG for five minutes in a live container:
+
+```shell
+echo "level myapp.db DEBUG 300" | socat - UNIX-CONNECT:/tmp/loggia.sock
+```
+
+Changes are logged on the `loggia.reconfigure` logger.
+"""
+
+from __future__ import annotations
+
+import logging
+import logging.config
+import os
+import signal
+import stat
+import threading
+from copy import deepcopy
+from typing import TYPE_CHECKING, Any
+
+from loggia._internal import strip
+from loggia.timings import TimedFilter, timings
+from loggia.utils.strutils import clean_log_level
+
+if TYPE_CHECKING:
+    import socket
+    from types import FrameType
+
+    from loggia.conf import LoggerConfiguration
+
+_KINDS = ("loggers", "handlers")
+
+_lock = threading.RLock()
+_base: LoggerConfiguration | None = None
+_applied: dict[str, dict[str, dict[str, Any]]] = {}
+_filters: dict[tuple[str, str, str], Any] = {}
+_overrides: dict[str, threading.Timer] = {}
+
+_wakeup: threading.Event | None = None
+_server: socket.socket | None = None
+_installed_signal: int | None = None
+_previous_handler: Any = None
+
+
+def _level(level: str | int | None) -> int:
+    return logging.NOTSET if level is None else logging._checkLevel(clean_log_level(level))  # type: ignore[attr-defined]
+
+
+def _display(kind: str, name: str) -> str:
+    return f"{kind[:-1]} {name or 'root'}"
+
+
+def _sections(conf: LoggerConfiguration) -> dict[str, dict[str, dict[str, Any]]]:
+    return {
+        kind: {name: {**cfg, "filters": list(cfg.get("filters", []))} for name, cfg in conf._dictconfig.get(kind, {}).items()}  # type: ignore[attr-defined]
+        for kind in _KINDS
+    }
+
+
+def _target(kind: str, name: str) -> logging.Logger | logging.Handler | None:
+    if kind == "loggers":
+        return logging.getLogger(name)
+    handler: logging.Handler | None = logging._handlers.get(name)  # type: ignore[attr-defined]
+    return handler
+
+
+def _remove_filter(target: logging.Filterer, filter_: Any) -> None:
+    target.filters = [f for f in target.filters if f is not filter_ and not (isinstance(f, TimedFilter) and f.wrapped is filter_)]
+
+
+def track(conf: LoggerConfiguration) -> None:
+    """Remember `conf` as the configuration in place. Called by `initialize()` right after dictConfig."""
+    global _base, _applied  # noqa: PLW0603 # pylint: disable=global-statement
+    with _lock:
+        _base = conf
+        _applied = _sections(conf)
+        _filters.clear()
+        for kind, section in _applied.items():
+            for name, cfg in section.items():
+                target = _target(kind, name)
+                ids = cfg["filters"]
+                if target is not None and ids:
+                    # dictConfig appends the filters of each logger and handler in order
+                    _filters.update(((kind, name, filter_id), f) for filter_id, f in zip(ids, target.filters[-len(ids) :]))
+
+
+def apply(conf: LoggerConfiguration) -> list[str]:
+    """Apply the levels, propagation and filters of `conf` to the live loggers and handlers, and return the changes made.
+
+    Loggers configured before but not in `conf` get back the level `NOTSET`, propagation, and no filters.
+    Loggers with a level set for a limited time with [set_level][loggia.reconfigure.set_level] keep it until it expires.
+    """
+    global _applied  # noqa: PLW0603 # pylint: disable=global-statement
+    new = _sections(conf)
+    changes: list[str] = []
+    with _lock:
+        for kind in _KINDS:
+            old_section, new_section = _applied.get(kind, {}), new[kind]
+            names = old_section.keys() | new_section.keys() if kind == "loggers" else old_section.keys() & new_section.keys()
+            for name in sorted(names):
+                target = _target(kind, name)
+                if target is not None:
+                    changes += _apply_one(conf, (kind, name), target, old_section.get(name, {}), new_section.get(name, {}))
+        _applied = new
+        if changes:
+            strip.refresh()
+    logger = logging.getLogger("loggia.reconfigure")
+    for change in changes:
+        logger.info("Reconfigured %s", change)
+    return changes
+
+
+def _apply_one(
+    conf: LoggerConfiguration,
+    key: tuple[str, str],
+    target: logging.Logger | logging.Handler,
+    old: dict[str, Any],
+    new: dict[str, Any],
+) -> list[str]:
+    kind, name = key
+    changes = []
+    level = _level(new.get("level"))
+    if target.level != level and not (kind == "loggers" and name in _overrides):
+        changes.append(f"{_display(kind, name)} level: {logging.getLevelName(target.level)} -> {logging.getLevelName(level)}")
+        target.setLevel(level)
+
+    if isinstance(target, logging.Logger):
+        propagate = bool(new.get("propagate", True))
+        if target.propagate != propagate:
+            changes.append(f"{_display(kind, name)} propagate: {target.propagate} -> {propagate}")
+            target.propagate = propagate
+
+    old_ids, new_ids = old.get("filters", []), new.get("filters", [])
+    for filter_id in old_ids:
+        if filter_id not in new_ids:
+            filter_ = _filters.pop((kind, name, filter_id), None)
+            if filter_ is not None:
+                _remove_filter(target, filter_)
+                changes.append(f"{_display(kind, name)} filter removed: {filter_id}")
+    for filter_id in new_ids:
+        if filter_id not in old_ids:
+            spec = dict(conf._dictconfig["filters"][filter_id])
+            filter_ = logging.config.DictConfigurator({}).configure_filter(spec)
+            target.addFilter(TimedFilter(filter_) if timings.enabled else filter_)
+            _filters[kind, name, filter_id] = filter_
+            changes.append(f"{_display(kind, name)} filter added: {filter_id}")
+    return changes
+
+
+def set_level(name: str, level: str | int, duration: float | None = None) -> None:
+    """Set the level of the logger `name` (the empty string for the root logger), for `duration` seconds if given.
+
+    When the duration expires, the logger gets back the level of the configuration in place then.
+    Until it does, reconfigurations leave the level of this logger alone.
+    """
+    with _lock:
+        previous = _overrides.pop(name, None)
+        if previous is not None:
+            previous.cancel()
+        logging.getLogger(name).setLevel(_level(level))
+        strip.refresh()
+        if duration:
+            timer = threading.Timer(duration, _expire, (name,))
+            timer.daemon = True
+            _overrides[name] = timer
+            timer.start()
+
+
+def _expire(name: str) -> None:
+    with _lock:
+        if _overrides.get(name) is not threading.current_thread():
+            return
+        del _overrides[name]
+        level = _level(_applied.get("loggers", {}).get(name, {}).get("level"))
+        logging.getLogger(name).setLevel(level)
+        strip.refresh()
+    logging.getLogger("loggia.reconfigure").info(
+        "Reconfigured %s level: back to %s", _display("loggers", name), logging.getLevelName(level)
+    )
+
+
+def read_settings(path: str) -> dict[str, str]:
+    """Read the `NAME=value` settings of a reconfiguration file. Blank lines and lines starting with `#` are ignored."""
+    try:
+        with open(path, encoding="utf-8") as f:  # noqa: PTH123
+            lines = f.read().splitlines()
+    except FileNotFoundError:
+        return {}
+    settings = {}
+    for line in lines:
+        line = line.strip()  # noqa: PLW2901
+        if not line or line.startswith("#"):
+            continue
+        key, sep, value = line.partition("=")
+        if not sep:
+            raise ValueError(f"Invalid setting in {path}, expected NAME=value: {line!r}")
+        settings[key.strip()] = value.strip()
+    return settings
+
+
+def reload() -> list[str]:
+    """Apply the configuration given to `initialize()` with the settings of its reconfiguration file laid over it."""
+    from loggia.conf import env  # noqa: PLC0415
+
+    with _lock:
+        if _base is None:
+            return []
+        conf = deepcopy(_base)
+        if conf.reconfigure_file:
+            env.apply_env(conf, read_settings(conf.reconfigure_file))
+        return apply(conf)
+
+
+def _reload_logging_errors() -> None:
+    try:
+        reload()
+    except Exception:
+        logging.getLogger("loggia.reconfigure").exception("Reconfiguration failed")
+
+
+def _file_signature(path: str | None) -> tuple[int, int, int] | None:
+    # Modification times can be coarse: the size and inode catch quick edits and replacements
+    if not path:
+        return None
+    try:
+        st = os.stat(path)  # noqa: PTH116
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size, st.st_ino
+
+
+def _watch(wakeup: threading.Event, path: str | None, interval: float, last: tuple[int, int, int] | None) -> None:
+    while True:
+        woken = wakeup.wait(interval if path and interval > 0 else None)
+        wakeup.clear()
+        if wakeup is not _wakeup:
+            return  # Uninstalled
+        signature = _file_signature(path)
+        if woken or signature != last:
+            last = signature
+            _reload_logging_errors()
+
+
+def _on_signal(_signum: int, _frame: FrameType | None) -> None:
+    # Reconfiguring takes logging locks, possibly held by the interrupted code: the watcher thread does it
+    if _wakeup is not None:
+        _wakeup.set()
+
+
+def _install_signal(signum: int | None) -> None:
+    global _installed_signal, _previous_handler  # noqa: PLW0603 # pylint: disable=global-statement
+    if threading.current_thread() is not threading.main_thread():
+        return
+    if _installed_signal is not None and _installed_signal != signum:
+        signal.signal(_installed_signal, _previous_handler)
+        _installed_signal = _previous_handler = None
+    if signum is not None and _installed_signal is None:
+        _previous_handler = signal.signal(signum, _on_signal)
+        _installed_signal = signum
+
+
+def _command(line: str) -> str:
+    words = line.split()
+    try:
+        if words[:1] == ["level"] and len(words) in (3, 4):
+            name = "" if words[1] == "root" else words[1]
+            set_level(name, words[2], float(words[3]) if len(words) == 4 else None)  # noqa: PLR2004
+            logging.getLogger("loggia.reconfigure").info("Reconfigured %s level: %s", _display("loggers", name), " ".join(words[2:]))
+            return "ok\n"
+        if words == ["reload"]:
+            return "".join(f"{change}\n" for change in ["ok", *reload()])
+        if words == ["show"]:
+            from loggia._internal.logger_dump import format_logger_tree  # noqa: PLC0415
+
+            return format_logger_tree()
+    except ValueError as e:
+        return f"error: {e}\n"
+    except Exception as e:
+        # Settings can fail in many ways: keep serving the next commands
+        logging.getLogger("loggia.reconfigure").exception("Control socket command failed: %s", line.strip())
+        return f"error: {e}\n"
+    return "error: expected `level <logger> <LEVEL> [<seconds>]`, `reload` or `show`\n"
+
+
+def _serve(server: socket.socket) -> None:
+    while True:
+        try:
+            conn, _ = server.accept()
+        except OSError:
+            return  # Closed by uninstall()
+        with conn:
+            try:
+                conn.settimeout(5)
+                line = conn.makefile("r", encoding="utf-8").readline()
+                conn.sendall(_command(line).encode("utf-8"))
+            except OSError:
+                continue
+
+
+def _start_server(path: str) -> None:
+    global _server  # noqa: PLW0603 # pylint: disable=global-statement
+    import socket  # noqa: PLC0415
+
+    try:
+        if stat.S_ISSOCK(os.lstat(path).st_mode):
+            os.unlink(path)  # noqa: PTH108 - left behind by a previous process
+    except FileNotFoundError:
+        pass
+    _server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    umask = os.umask(0o177)
+    try:
+        _server.bind(path)
+    finally:
+        os.umask(umask)
+    _server.listen()
+    threading.Thread(target=_serve, args=(_server,), name="loggia-control-socket", daemon=True).start()
+
+
+def uninstall() -> None:
+    """Stop the file watcher and the control socket, cancel timed levels, and restore the previous signal handler.
+
+    Loggers keep the levels set with [set_level][loggia.reconfigure.set_level], and the next configuration applies to them.
+    """
+    global _wakeup, _server  # noqa: PLW0603 # pylint: disable=global-statement
+    with _lock:
+        for timer in _overrides.values():
+            timer.cancel()
+        _overrides.clear()
+    if _wakeup is not None:
+        wakeup, _wakeup = _wakeup, None
+        wakeup.set()
+    _install_signal(None)
+    if _server is not None:
+        path = _server.getsockname()
+        _server.close()
+        _server = None
+        if path and os.path.lexists(path):
+            os.unlink(path)  # noqa: PTH108
+
+
+def install(conf: LoggerConfiguration) -> None:
+    """Track `conf` as the configuration in place, and start the reconfiguration triggers it enables."""
+    global _wakeup  # noqa: PLW0603 # pylint: disable=global-statement
+    track(conf)
+    uninstall()
+    if conf.reconfigure_file or conf.reconfigure_signal is not None:
+        _wakeup = threading.Event()
+        # Signed before the first reload, so that any later change is picked up
+        args = (_wakeup, conf.reconfigure_file, conf.reconfigure_interval, _file_signature(conf.reconfigure_file))
+        threading.Thread(target=_watch, args=args, name="loggia-reconfigure", daemon=True).start()
+        _install_signal(conf.reconfigure_signal)
+    if conf.reconfigure_file:
+        _reload_logging_errors()
+    if conf.control_socket:
+        _start_server(conf.control_socket)
+
+
+def _track_initialized() -> None:
+    # initialize() only installs this module when it is enabled or already imported
+    from loggia.logger import _initialized_conf  # noqa: PLC0415
+
+    if _initialized_conf is not None:
+        track(_initialized_conf)
+
+
+_track_initialized()
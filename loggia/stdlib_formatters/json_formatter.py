@@ -1,29 +1,22 @@
 from __future__ import annotations
 
-import os
+import logging
 import re
+from functools import partial
 from socket import socket
-from typing import TYPE_CHECKING, Any, Final, Protocol, runtime_checkable
+from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 from uuid import UUID
 
 from pythonjsonlogger.jsonlogger import RESERVED_ATTRS, JsonEncoder, JsonFormatter
 
-from loggia._internal.bootstrap_logger import bootstrap_logger
-from loggia._internal.conf import is_truthy_string
+from loggia._internal.datadog import get_ddtrace
 from loggia.constants import SAFE_HEADER_ATTRIBUTES
 from loggia.utils.dictutils import del_if_possible, del_many_if_possible, mv_attr
 
 if TYPE_CHECKING:
-    import logging
+    from collections.abc import Callable
 
 GUNICORN_KEY_RE = re.compile("{([^}]+)}")
-DD_TRACE_ENABLED: Final[bool | None] = is_truthy_string(os.environ.get("DD_TRACE_ENABLED", False))
-if DD_TRACE_ENABLED:
-    try:
-        from ddtrace import tracer
-    except ImportError:
-        bootstrap_logger.error("DD_TRACE_ENABLED environment variable is set but ddtrace package cannot be loaded")
-        tracer = None  # type: ignore[assignment]
 
 
 @runtime_checkable
@@ -62,11 +55,22 @@ class CustomJsonFormatter(JsonFormatter):
 
     def __init__(self, *args: Any, **kwargs: Any):
         super().__init__(*args, **kwargs)  # type: ignore[no-untyped-call]
-        if DD_TRACE_ENABLED and tracer is not None:
-            self.process_ddtrace = _process_ddtrace
+        ddtrace = get_ddtrace()
+        self.process_ddtrace: Callable[[dict[str, Any]], None]
+        if ddtrace is not None:
+            self.process_ddtrace = partial(_process_ddtrace, ddtrace.tracer)
         else:
             self.process_ddtrace = lambda log_record: None
 
+    def record_fields(self) -> set[str]:
+        """The standard record attributes this formatter reads."""
+        emitted = set(logging.makeLogRecord({}).__dict__) - set(self.reserved_attrs)
+        return (
+            emitted
+            | set(self._required_fields)
+            | {"name", "levelname", "threadName", "funcName", "pathname", "lineno", "msg", "args", "exc_info", "created"}
+        )
+
     def add_fields(
         self,
         log_record: dict[str, Any],
@@ -114,10 +118,8 @@ class CustomJsonFormatter(JsonFormatter):
         mv_attr(log_record, "user_agent", "http.useragent")
         mv_attr(log_record, "server_protocol", "http.version")
 
-        header_attributes = SAFE_HEADER_ATTRIBUTES
         xtra_ks = [k for k in log_record if k.startswith(("x-", "sec-", "mm-"))]
-        header_attributes.extend(xtra_ks)
-        for header_attr in header_attributes:
+        for header_attr in (*SAFE_HEADER_ATTRIBUTES, *xtra_ks):
             mv_attr(log_record, header_attr, f"http.headers.{header_attr}")
 
         # Cleanup useless attributes
@@ -160,9 +162,7 @@ class CustomJsonFormatter(JsonFormatter):
             del log_record["exc_info"]
 
 
-def _process_ddtrace(log_record: dict[str, Any]) -> None:
-    if tracer is None:
-        return  # type: ignore[unreachable]
+def _process_ddtrace(tracer: Any, log_record: dict[str, Any]) -> None:
     span = tracer.current_span()
     trace_id, span_id = (span.trace_id, span.span_id) if span else (None, None)
 
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Literal
+from typing import Any
 
 from loggia.constants import FORMAT_FIELDS, PALETTES
 from loggia.utils.colorsutils import ansi_end, ansi_fg
@@ -9,21 +9,8 @@ from loggia.utils.logrecordutils import extra_fields, popattr
 
 # pylint: disable=consider-using-f-string
 
-std_log = logging.Logger._log
-
-
-def patched_log(*args: tuple[Any, ...], **kwargs: Any) -> Any:
-    if "stacklevel" in kwargs:
-        kwargs["stacklevel"] += 1
-        if "extra" not in kwargs:
-            kwargs["extra"] = {}
-        kwargs["extra"]["_fmt_with_filename"] = True
-    else:
-        kwargs["stacklevel"] = 2
-    return std_log(*args, **kwargs)  # type: ignore[arg-type]
-
-
-logging.Logger._log = patched_log  # type: ignore[method-assign]
+_ANSI_END = ansi_end()
+_ANSI_PALETTES: dict[int, tuple[str, ...]] = {level: tuple(ansi_fg(color) for color in palette) for level, palette in PALETTES.items()}
 
 
 class PrettyFormatter(logging.Formatter):
@@ -33,44 +20,32 @@ class PrettyFormatter(logging.Formatter):
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
-
-    # pylint: disable=protected-access
-    def _set_format(self, fmt: str, style: Literal["%", "$", "{"] = "%") -> None:
-        self._style = logging._STYLES[style][0](fmt)  # type: ignore[operator]  # type: ignore[reportGeneralTypeIssues] # Mysticism 🤔
+        # One style per palette and filename display, built once rather than for every record
+        self._styles: dict[tuple[int, bool], logging.PercentStyle] = {}
+        # The default style is never used to format, but tells logging.Formatter to compute asctime
+        self._style = self._level_style(logging.INFO, with_filename=False)
         self._fmt = self._style._fmt
 
-    def format(self, record: logging.LogRecord) -> str:
-        # Reference attributes: https://docs.python.org/3/library/logging.html#logrecord-attributes
-        with_filename = popattr(record, "_fmt_with_filename", default=False)
-        palette = PALETTES.get(record.levelno, PALETTES[logging.DEBUG])
-
-        pretty_extra = "\n  ".join(
-            f"{ansi_fg(palette[2])}{k}{ansi_end()}={ansi_fg(palette[3])}{v}" for k, v in extra_fields(record, FORMAT_FIELDS)
-        )
-
-        if pretty_extra:
-            # Sanitize extra so that they are not formatted by percent formatter
-            pretty_extra = f"\n  {pretty_extra}".replace("%", "%%")
+    def _level_style(self, palette_level: int, *, with_filename: bool) -> logging.PercentStyle:
+        style = self._styles.get((palette_level, with_filename))
+        if style is None:
+            colors = _ANSI_PALETTES[palette_level]
+            location = f"{colors[2]}%(name)s {colors[2]}%(filename)s:%(lineno)d " if with_filename else f"{colors[2]}%(name)s:%(lineno)d "
+            fmt = f"{colors[0]}%(asctime)s {colors[1]}%(levelname)-8s {location}{colors[3]}%(message)s"
+            style = self._styles.setdefault((palette_level, with_filename), logging.PercentStyle(fmt))
+        return style
 
-        if with_filename:
-            fmt = (
-                f"{ansi_fg(palette[0])}%(asctime)s "
-                f"{ansi_fg(palette[1])}%(levelname)-8s "
-                f"{ansi_fg(palette[2])}%(name)s "
-                f"{ansi_fg(palette[2])}%(filename)s:%(lineno)d "
-                f"{ansi_fg(palette[3])}%(message)s"
-                f"{pretty_extra}"
-                f"{ansi_end()}"
-            )
-        else:
-            fmt = (
-                f"{ansi_fg(palette[0])}%(asctime)s "
-                f"{ansi_fg(palette[1])}%(levelname)-8s "
-                f"{ansi_fg(palette[2])}%(name)s:%(lineno)d "
-                f"{ansi_fg(palette[3])}%(message)s"
-                f"{pretty_extra}"
-                f"{ansi_end()}"
-            )
+    def record_fields(self) -> set[str]:
+        """The standard record attributes this formatter reads."""
+        return {*FORMAT_FIELDS, "levelno", "msg", "args", "exc_info", "exc_text", "stack_info", "created", "msecs"}
 
-        self._set_format(fmt)
-        return super().format(record)
+    def formatMessage(self, record: logging.LogRecord) -> str:  # noqa: N802
+        # Reference attributes: https://docs.python.org/3/library/logging.html#logrecord-attributes
+        # The style is picked per record rather than set on the formatter, which may be shared by threads.
+        # Extras are appended after formatting, so they need no escaping from the percent style.
+        with_filename = popattr(record, "_fmt_with_filename", default=False)
+        palette_level = record.levelno if record.levelno in _ANSI_PALETTES else logging.DEBUG
+        colors = _ANSI_PALETTES[palette_level]
+        style = self._level_style(palette_level, with_filename=with_filename)
+        pretty_extra = "".join(f"\n  {colors[2]}{k}{_ANSI_END}={colors[3]}{v}" for k, v in extra_fields(record, FORMAT_FIELDS))
+        return f"{style.format(record)}{pretty_extra}{_ANSI_END}"
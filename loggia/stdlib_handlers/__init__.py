@@ -0,0 +1 @@
+"""Handlers for standard-lib logging."""
@@ -0,0 +1,70 @@
+"""Loggia's own stream handler."""
+
+from __future__ import annotations
+
+import logging
+import time
+
+from loggia.callsites import profiler
+from loggia.gc_monitor import monitor as gc_monitor
+from loggia.metrics import metrics
+from loggia.timings import timings
+
+
+class LoggiaStreamHandler(logging.StreamHandler):  # type: ignore[type-arg]
+    """A [logging.StreamHandler][] that feeds [loggia.metrics][], [loggia.timings][] and [loggia.callsites][].
+
+    It also writes the records queued by [loggia.gc_monitor][] before the record at hand.
+    When all of them are disabled, the only overhead over the standard handler is
+    four attribute lookups per record.
+    """
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        if gc_monitor.enabled:
+            gc_monitor.flush()
+        return super().handle(record)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        rv = super().filter(record)
+        if not rv and metrics.enabled:
+            metrics.count_dropped(record)
+        return rv
+
+    def emit(self, record: logging.LogRecord) -> None:
+        timed = timings.enabled
+        if timed:
+            start = time.perf_counter_ns()
+        try:
+            msg = self.format(record)
+        except RecursionError:
+            raise
+        except Exception:  # noqa: BLE001
+            if metrics.enabled:
+                metrics.count_format_error(record)
+            self.handleError(record)
+            return
+
+        if timed:
+            formatted = time.perf_counter_ns()
+            timings.observe(f"format:{type(self.formatter).__name__}", formatted - start)
+        try:
+            self.stream.write(msg + self.terminator)
+            self.flush()
+        except RecursionError:
+            raise
+        except Exception:  # noqa: BLE001
+            self.handleError(record)
+            return
+        if timed:
+            timings.observe("write", time.perf_counter_ns() - formatted)
+
+        if metrics.enabled or profiler.enabled:
+            self._count_emitted(record, len(msg) + len(self.terminator))
+
+    def _count_emitted(self, record: logging.LogRecord, size: int) -> None:
+        if profiler.enabled:
+            profiler.observe(record, size)
+        if metrics.enabled:
+            metrics.count_emitted(record, size)
+            if metrics.summary_due():
+                metrics.log_summary()
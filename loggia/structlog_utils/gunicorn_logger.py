@@ -4,6 +4,8 @@ import logging
 import os
 from typing import TYPE_CHECKING, Any
 
+from loggia._internal.access_sampling import get_access_sampler
+
 if TYPE_CHECKING:
     import datetime
 
@@ -12,6 +14,13 @@ if TYPE_CHECKING:
     from gunicorn.http.wsgi import Response
 
 
+def _status_code(status: str | int | None) -> int:
+    try:
+        return int(status)  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        return 0
+
+
 class GunicornLogger:
     """Custom Gunicorn logger class, using structlog.
 
@@ -31,11 +40,18 @@ class GunicornLogger:
         raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
 
     def access(self, resp: Response, _req: Request, environ: dict[str, str], request_time: datetime.timedelta) -> None:
+        if not self._access_logger.isEnabledFor(logging.INFO):
+            return
+
         status = resp.status
 
         if isinstance(status, str):
             status = status.split(None, 1)[0]
 
+        sampler = get_access_sampler()
+        if sampler is not None and not sampler.keep(_status_code(status), request_time.total_seconds(), environ.get("PATH_INFO", "")):
+            return
+
         duration_ns: float | int = request_time.total_seconds() * 1e9
         request_time_seconds = "%d.%06d" % (request_time.seconds, request_time.microseconds)
 
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING
 
 from hypercorn.logging import Logger
 
+from loggia._internal.access_sampling import get_access_sampler
 from loggia.constants import HYPERCORN_ATTRIBUTES_MAP, SAFE_HEADER_ATTRIBUTES
 
 if TYPE_CHECKING:
@@ -32,6 +33,13 @@ class HypercornLogger(Logger):
         self.access_log_format = cfg.access_log_format.replace("%(t)s ", "").lstrip("- ")
 
     async def access(self, request: WWWScope, response: ResponseSummary | None, request_time: float) -> None:
+        if not self.access_logger.isEnabledFor(logging.INFO):
+            return
+
+        sampler = get_access_sampler()
+        if sampler is not None and not sampler.keep(response["status"] if response else 0, request_time, request.get("path", "")):
+            return
+
         # XXX(dugab): Url vs URI?
         # XXX Check duration is in ns
         atoms: Mapping[str, float | int | str] = self.atoms(request, response, request_time)
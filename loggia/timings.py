@@ -0,0 +1,203 @@
+"""Opt-in latency histograms for each stage of the logging pipeline.
+
+When enabled with `LOGGIA_STAGE_TIMINGS`, Loggia measures with [time.perf_counter_ns][]:
+
+- `record`: the creation of log records by the record factory
+- `filter:<FilterClass>`: each filter of the configured loggers and handlers
+- `format:<FormatterClass>`: formatting, in Loggia's handler
+- `write`: writing and flushing the stream, in Loggia's handler
+
+Durations are recorded into fixed-bucket, per-thread histograms, with a 25% resolution.
+Percentiles are read through [percentiles][loggia.timings.percentiles].
+
+This is a diagnostic tool: each measurement costs a couple hundred nanoseconds.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import weakref
+from typing import TYPE_CHECKING, Any, Callable
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from loggia.types import SupportsFilter
+
+_SUB_BUCKETS = 4
+_BUCKETS = 160
+
+
+def _bucket_index(ns: int) -> int:
+    if ns < _SUB_BUCKETS:
+        return max(ns, 0)
+    bits = ns.bit_length()
+    idx = _SUB_BUCKETS * (bits - 2) + ((ns >> (bits - 3)) & (_SUB_BUCKETS - 1))
+    return min(idx, _BUCKETS - 1)
+
+
+def _bucket_upper_bound(idx: int) -> int:
+    if idx < _SUB_BUCKETS:
+        return idx
+    bits, sub = divmod(idx, _SUB_BUCKETS)
+    bits += 2
+    return ((_SUB_BUCKETS + sub + 1) << (bits - 3)) - 1
+
+
+class _ThreadOwner:
+    """Lives as long as the thread locals holding it."""
+
+
+class StageTimings:
+    """Per-thread, fixed-bucket histograms of durations in nanoseconds, keyed by stage name."""
+
+    enabled: bool = False
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._all_histograms: dict[int, dict[str, list[int]]] = {}
+        # Histograms of the threads that ended
+        self._retired: dict[str, list[int]] = {}
+
+    def _histograms(self) -> dict[str, list[int]]:
+        try:
+            return self._local.histograms  # type: ignore[no-any-return]
+        except AttributeError:
+            histograms: dict[str, list[int]] = {}
+            # Only referenced by this thread's locals: finalized when the thread ends
+            owner = _ThreadOwner()
+            weakref.finalize(owner, self._retire, histograms)
+            self._local.histograms = histograms
+            self._local.owner = owner
+            with self._lock:
+                self._all_histograms[id(histograms)] = histograms
+            return histograms
+
+    def _retire(self, histograms: dict[str, list[int]]) -> None:
+        with self._lock:
+            for stage, histogram in histograms.items():
+                retired = self._retired.setdefault(stage, [0] * _BUCKETS)
+                for idx, count in enumerate(histogram):
+                    retired[idx] += count
+            del self._all_histograms[id(histograms)]
+
+    def observe(self, stage: str, ns: int) -> None:
+        histograms = self._histograms()
+        histogram = histograms.get(stage)
+        if histogram is None:
+            histogram = histograms[stage] = [0] * _BUCKETS
+        histogram[_bucket_index(ns)] += 1
+
+    def histograms(self) -> dict[str, list[int]]:
+        """Aggregate all threads' histograms."""
+        with self._lock:
+            all_histograms = [self._retired.copy(), *(histograms.copy() for histograms in self._all_histograms.values())]
+        result: dict[str, list[int]] = {}
+        for histograms in all_histograms:
+            for stage, histogram in histograms.items():
+                total = result.setdefault(stage, [0] * _BUCKETS)
+                for idx, count in enumerate(histogram):
+                    total[idx] += count
+        return result
+
+    def percentiles(self, *quantiles: float) -> dict[str, dict[str, int]]:
+        quantiles = quantiles or (0.5, 0.99)
+        result: dict[str, dict[str, int]] = {}
+        for stage, histogram in self.histograms().items():
+            count = sum(histogram)
+            stage_result = {"count": count}
+            for q in quantiles:
+                stage_result[f"p{q * 100:g}_ns"] = _quantile(histogram, count, q)
+            result[stage] = stage_result
+        return result
+
+    def reset(self) -> None:
+        with self._lock:
+            for histograms in self._all_histograms.values():
+                histograms.clear()
+            self._retired.clear()
+
+
+def _quantile(histogram: list[int], count: int, q: float) -> int:
+    if count == 0:
+        return 0
+    rank = q * count
+    seen = 0
+    for idx, bucket_count in enumerate(histogram):
+        seen += bucket_count
+        if seen >= rank:
+            return _bucket_upper_bound(idx)
+    return _bucket_upper_bound(_BUCKETS - 1)
+
+
+timings = StageTimings()
+"""The process-wide stage timings instance."""
+
+
+class TimedFilter:
+    """Wraps a filter to time it under a `filter:<FilterClass>` stage."""
+
+    def __init__(self, wrapped: SupportsFilter | Callable[[logging.LogRecord], Any]):
+        self.wrapped = wrapped
+        self._filter = wrapped.filter if hasattr(wrapped, "filter") else wrapped
+        owner = getattr(self._filter, "__self__", None)
+        name = type(owner).__name__ if owner is not None else getattr(self._filter, "__name__", type(self._filter).__name__)
+        self.stage = f"filter:{name}"
+
+    def filter(self, record: logging.LogRecord) -> Any:
+        if not timings.enabled:
+            return self._filter(record)
+        start = time.perf_counter_ns()
+        try:
+            return self._filter(record)
+        finally:
+            timings.observe(self.stage, time.perf_counter_ns() - start)
+
+
+def _timed_record_factory(factory: Callable[..., logging.LogRecord]) -> Callable[..., logging.LogRecord]:
+    def record_factory(*args: Any, **kwargs: Any) -> logging.LogRecord:
+        if not timings.enabled:
+            return factory(*args, **kwargs)
+        start = time.perf_counter_ns()
+        record = factory(*args, **kwargs)
+        timings.observe("record", time.perf_counter_ns() - start)
+        return record
+
+    record_factory._loggia_timed = factory  # type: ignore[attr-defined]
+    return record_factory
+
+
+def _wrap_filters(filterer: logging.Filterer) -> None:
+    filterer.filters = [f if isinstance(f, TimedFilter) else TimedFilter(f) for f in filterer.filters]
+
+
+def instrument(loggers: Iterable[logging.Logger]) -> None:
+    """Time the record factory, and the filters of the given loggers and of their handlers."""
+    factory = logging.getLogRecordFactory()
+    if not hasattr(factory, "_loggia_timed"):
+        logging.setLogRecordFactory(_timed_record_factory(factory))
+    for logger in loggers:
+        _wrap_filters(logger)
+        for handler in logger.handlers:
+            _wrap_filters(handler)
+
+
+def configure(*, enabled: bool) -> None:
+    """Enable or disable stage timings."""
+    timings.enabled = enabled
+
+
+def percentiles(*quantiles: float) -> dict[str, dict[str, int]]:
+    """Return per-stage sample counts and percentiles, in nanoseconds.
+
+    Defaults to the median and 99th percentile, as `{stage: {"count": ..., "p50_ns": ..., "p99_ns": ...}}`.
+    """
+    return timings.percentiles(*quantiles)
+
+
+def reset() -> None:
+    """Reset all histograms."""
+    timings.reset()
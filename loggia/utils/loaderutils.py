@@ -4,12 +4,11 @@ import builtins
 import re
 from functools import cache
 from importlib import import_module
-from inspect import signature
-from pathlib import Path
 from typing import TYPE_CHECKING, Any, TypeVar, overload
 
 if TYPE_CHECKING:
     import sys
+    from pathlib import Path
     from types import ModuleType
 
     if sys.version_info < (3, 11):
@@ -86,6 +85,8 @@ def class_fqn_of(o: object) -> str:
 
 @cache
 def builtin_types() -> dict[str, type]:
+    from inspect import signature  # Slow to import, and seldom needed
+
     rex = re.compile(r"[a-z][a-z_]+")
     builtin_things = [getattr(builtins, x) for x in dir(builtins) if rex.match(str(x))]
     typish_things = [x for x in builtin_things if "class" in str(x)]
@@ -106,6 +107,8 @@ def resolve_type_string(ts: str) -> Any:
 
 
 def import_all_files(subtree: str, *, base_dir: Path | None = None) -> list[ModuleType]:
+    from pathlib import Path  # Slow to import, and seldom needed
+
     base_dir = base_dir or (Path(__file__).parent / "../..").resolve()
 
     target_dir = (base_dir / subtree).resolve()
@@ -66,6 +66,15 @@ def _reload_modules():
     if "loggia.auto" in sys.modules:
         del sys.modules["loggia.auto"]
 
+    for name in (
+        "loggia._internal.compiled",
+        "loggia._internal.prewarm",
+        "loggia._internal.logger_class",
+        "loggia._internal.record_fields",
+    ):
+        if name in sys.modules:
+            reload(sys.modules[name])
+
     if loguru:
         loggia.loguru_sink = reload(loggia.loguru_sink)
 
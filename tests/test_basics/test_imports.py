@@ -0,0 +1,88 @@
+"""Import budget: `import loggia.auto` only imports what the selected presets need."""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import subprocess
+import sys
+from typing import TYPE_CHECKING
+
+import pytest
+
+from loggia._internal.import_hooks import uninstall, when_imported
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from types import ModuleType
+
+# Modules newly imported by `import loggia.auto`, Loggia's own included. Keep some headroom for
+# dependency upgrades, and only raise these budgets for a good reason.
+IMPORT_BUDGETS = {"prod": 140, "dev": 115}
+
+# Loggia's optional features are only imported when enabled
+OPTIONAL_FEATURES = {"loggia.callsites", "loggia.gc_monitor", "loggia.metrics", "loggia.reconfigure", "loggia.timings"}
+NEVER_IMPORTED = {"asyncio", "ddtrace", "loguru", "pathlib", *OPTIONAL_FEATURES}
+NOT_IMPORTED_BY = {
+    "prod": {"loggia.presets.dev", "loggia.stdlib_formatters.pretty_formatter"},
+    "dev": {"pythonjsonlogger", "loggia.presets.prod", "inspect"},
+}
+
+_MODULES_IMPORTED_BY_AUTO = """
+import json, sys
+before = set(sys.modules)
+import loggia.auto
+print(json.dumps(sorted(set(sys.modules) - before)))
+"""
+
+
+def _run_python(code: str, **env: str) -> str:
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env)  # noqa: S603
+    return result.stdout + result.stderr
+
+
+@pytest.mark.parametrize("preset", ["prod", "dev"])
+def test_import_budget(preset: str):
+    imported = set(json.loads(_run_python(_MODULES_IMPORTED_BY_AUTO, LOGGIA_PRESETS=preset)))
+    assert imported & (NEVER_IMPORTED | NOT_IMPORTED_BY[preset]) == set()
+    assert len(imported) <= IMPORT_BUDGETS[preset], sorted(imported)
+
+
+def test_ddtrace_is_imported_on_demand():
+    output = _run_python("import sys, loggia.auto; print('ddtrace' in sys.modules)", DD_TRACE_ENABLED="true")
+    if importlib.util.find_spec("ddtrace") is None:
+        # Importing it is attempted, and fails gracefully
+        assert "ddtrace package cannot be loaded" in output
+    else:
+        assert "True" in output.splitlines()
+
+
+def test_loguru_is_captured_once_imported():
+    pytest.importorskip("loguru")
+    code = "import sys, loggia.auto; assert 'loguru' not in sys.modules; from loguru import logger; logger.warning('from loguru')"
+    record = json.loads(_run_python(code).strip().splitlines()[-1])
+    assert record["message"] == "from loguru"
+    assert record["status"] == "WARNING"
+
+
+def test_when_imported(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    (tmp_path / "loggia_hooked_module.py").write_text("VALUE = 42\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    seen: list[ModuleType] = []
+
+    when_imported("loggia_hooked_module", lambda module: seen.append(module.VALUE))
+    when_imported("loggia_hooked_module", seen.append)
+    assert seen == []
+    import loggia_hooked_module  # type: ignore[import-not-found]
+
+    assert seen == [loggia_hooked_module]
+    when_imported("loggia_hooked_module", seen.append)
+    assert seen == [loggia_hooked_module, loggia_hooked_module]
+    del sys.modules["loggia_hooked_module"]
+    uninstall("loggia_hooked_module")
+
+
+def test_when_imported_not_installed():
+    meta_path = list(sys.meta_path)
+    when_imported("loggia_not_installed_module", print)
+    assert sys.meta_path == meta_path
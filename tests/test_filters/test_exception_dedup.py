@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import logging
+import sys
+from typing import TYPE_CHECKING
+
+from loggia.conf import LoggerConfiguration
+from loggia.filters.exception_dedup import ExceptionDedup, exception_fingerprint
+from loggia.logger import initialize
+
+if TYPE_CHECKING:
+    from tests.conftest import JsonStderrCaptureFixture
+
+
+def _boom():
+    raise ValueError("boom")
+
+
+def _log_boom(logger: logging.Logger):
+    try:
+        _boom()
+    except ValueError:
+        logger.exception("failed")
+
+
+def _fingerprint_of(fn) -> str:
+    try:
+        fn()
+    except ValueError:
+        exc_type, _, tb = sys.exc_info()
+        return exception_fingerprint(exc_type, tb)  # type: ignore[arg-type]
+    raise AssertionError
+
+
+def _raise_here():
+    raise ValueError("boom")
+
+
+def test_fingerprint_is_stable_per_location():
+    assert _fingerprint_of(_boom) == _fingerprint_of(_boom)
+    assert _fingerprint_of(_boom) != _fingerprint_of(_raise_here)
+
+
+def test_repeated_stack_is_elided(capjson: JsonStderrCaptureFixture):
+    logging_config = LoggerConfiguration()
+    logging_config.set_exception_dedup_window(60)
+    initialize(logging_config)
+    logger = logging.getLogger("test")
+    for _ in range(3):
+        _log_boom(logger)
+
+    first, second, third = capjson.records
+    assert "error.stack" in first
+    assert "error.count" not in first
+    assert "error.stack" not in second
+    assert second["error.fingerprint"] == first["error.fingerprint"]
+    assert second["error.count"] == 2
+    assert third["error.count"] == 3
+    assert third["error.kind"] == "builtins.ValueError"
+    assert third["error.message"] == "boom"
+
+
+def test_window_expiry(mocker):
+    dedup = ExceptionDedup(window=10)
+    monotonic = mocker.patch("loggia.filters.exception_dedup.time.monotonic", return_value=100.0)
+    try:
+        _boom()
+    except ValueError:
+        exc_type, _, tb = sys.exc_info()
+    assert dedup.occurrence(exc_type, tb)[1] == 1  # type: ignore[arg-type]
+    assert dedup.occurrence(exc_type, tb)[1] == 2  # type: ignore[arg-type]
+    monotonic.return_value = 110.0
+    assert dedup.occurrence(exc_type, tb)[1] == 1  # type: ignore[arg-type]
+
+
+def test_bounded_registry():
+    dedup = ExceptionDedup(max_entries=2)
+    for exc_type in (ValueError, KeyError, TypeError):
+        dedup.occurrence(exc_type, None)
+    assert len(dedup._occurrences) == 2
+    assert dedup.occurrence(ValueError, None)[1] == 1
+
+
+def test_disabled_with_zero_window(capjson: JsonStderrCaptureFixture):
+    initialize({"LOGGIA_EXCEPTION_DEDUP_WINDOW": "0"})
+    logger = logging.getLogger("test")
+    for _ in range(2):
+        _log_boom(logger)
+    assert all("error.stack" in record for record in capjson.records)
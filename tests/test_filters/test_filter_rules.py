@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import logging
+import pickle
+from typing import TYPE_CHECKING
+
+import pytest
+
+from loggia.conf import LoggerConfiguration
+from loggia.filters.extra_allow import ExtraAllow
+from loggia.filters.filter_rules import FilterRules
+from loggia.logger import initialize
+
+if TYPE_CHECKING:
+    from tests.conftest import JsonStderrCaptureFixture
+
+
+def _record(name: str, level: int, msg: str) -> logging.LogRecord:
+    return logging.LogRecord(name, level, __file__, 0, msg, (), None)
+
+
+def test_rules():
+    rules = FilterRules('logger=botocore.* and level<WARNING -> drop; msg~"healthcheck" -> drop; logger=app* and msg=ping -> drop')
+    assert not rules.filter(_record("botocore", logging.DEBUG, "x"))
+    assert not rules.filter(_record("botocore.endpoint", logging.INFO, "x"))
+    assert rules.filter(_record("botocore.endpoint", logging.WARNING, "x"))
+    assert rules.filter(_record("botocorefake", logging.DEBUG, "x"))
+    assert not rules.filter(_record("api", logging.INFO, "GET /healthcheck 200"))
+    assert not rules.filter(_record("app.http", logging.INFO, "ping"))
+    assert rules.filter(_record("api", logging.INFO, "ping"))
+    assert rules.filter(_record("app.http", logging.INFO, "pong"))
+
+
+def test_first_matching_rule_decides():
+    rules = FilterRules("msg~important -> keep; level<=INFO -> drop")
+    assert rules.filter(_record("app", logging.INFO, "important stuff"))
+    assert not rules.filter(_record("app", logging.INFO, "stuff"))
+    assert rules.filter(_record("app", logging.WARNING, "stuff"))
+
+
+def test_uncombinable_patterns():
+    rules = FilterRules('msg~"(?i)^health" -> drop; msg~"ping" -> drop; msg!=pong and logger=app -> drop')
+    assert not rules.filter(_record("api", logging.INFO, "HEALTHCHECK"))
+    assert not rules.filter(_record("api", logging.INFO, "a ping"))
+    assert not rules.filter(_record("app", logging.INFO, "other"))
+    assert rules.filter(_record("app", logging.INFO, "pong"))
+
+    rules = FilterRules(r'msg~"(x)y" -> drop; msg~"(a)\\1" -> drop')
+    assert not rules.filter(_record("app", logging.INFO, "aa"))
+    assert rules.filter(_record("app", logging.INFO, "ab"))
+
+
+def test_quoted_regular_expressions():
+    rules = FilterRules(r'msg~"\d+ items" -> drop; msg~"^v1\.2 " -> drop; logger~"^app\.db$" and level<WARNING -> drop')
+    assert not rules.filter(_record("app", logging.INFO, "3 items"))
+    assert rules.filter(_record("app", logging.INFO, "d items"))
+    assert not rules.filter(_record("app", logging.INFO, "v1.2 released"))
+    assert rules.filter(_record("app", logging.INFO, "v1x2 released"))
+    assert not rules.filter(_record("app.db", logging.INFO, "query"))
+    assert rules.filter(_record("app_db", logging.INFO, "query"))
+
+
+@pytest.mark.parametrize("rules", ["color=red -> drop", "level<LOUD -> drop", "msg<3 -> drop", "* -> maybe"])
+def test_malformed_rules(rules: str):
+    with pytest.raises(ValueError):  # noqa: PT011
+        FilterRules(rules)
+
+
+def test_pickle():
+    rules = pickle.loads(pickle.dumps(FilterRules("level<INFO -> drop")))  # noqa: S301
+    assert not rules.filter(_record("app", logging.DEBUG, "x"))
+
+
+def test_env_filter_rules(capjson: JsonStderrCaptureFixture):
+    initialize({"LOGGIA_FILTER_RULES": "logger=noisy.* -> drop"})
+    logging.getLogger("noisy.child").warning("hidden")
+    logging.getLogger("quiet").warning("shown")
+    assert [record["message"] for record in capjson.records] == ["shown"]
+
+
+def test_disabled_filters():
+    conf = LoggerConfiguration(settings={"LOGGIA_FILTER_RULES": "* -> drop"})
+    conf.add_log_filter("app", ExtraAllow(["toto"]))
+    conf.add_log_filter("lib", ExtraAllow(["toto"]))
+    conf.remove_log_filter("app", "loggia.filters.extra_allow.ExtraAllow")
+    assert conf._dictconfig["loggers"]["app"]["filters"] == []
+    assert len(conf._dictconfig["loggers"]["lib"]["filters"]) == 1
+
+    conf.remove_log_filter("loggia.filters.extra_allow.ExtraAllow")
+    conf.remove_log_filter("loggia.filters.filter_rules.FilterRules")
+    assert conf._dictconfig["loggers"]["lib"]["filters"] == []
+    assert conf._dictconfig["handlers"]["default"]["filters"] == []
+
+
+def test_disabled_filters_from_settings():
+    conf = LoggerConfiguration(
+        settings={
+            "LOGGIA_DISABLED_FILTERS": "loggia.filters.exception_dedup.ExceptionDedup",
+            "LOGGIA_EXCEPTION_DEDUP_WINDOW": "60",
+            "LOGGIA_FILTER_RULES": "* -> drop",
+        },
+    )
+    filters = conf._dictconfig["filters"]
+    assert [filters[filter_id]["()"].args[-1] for filter_id in conf._dictconfig["handlers"]["default"]["filters"]] == [conf._filter_rules]
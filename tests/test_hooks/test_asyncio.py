@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+from loggia._internal.asyncio_monitor import install_asyncio_monitor
+from loggia.conf import LoggerConfiguration
+from loggia.logger import initialize
+
+if TYPE_CHECKING:
+    from tests.conftest import JsonStderrCaptureFixture
+
+
+@pytest.fixture(autouse=True)
+def _uninstall_monitor():
+    original_run = asyncio.Handle._run
+    yield
+    install_asyncio_monitor(enabled=False)
+    assert asyncio.Handle._run is original_run
+
+
+def _initialize_monitor(slow_callback: str, lag_threshold: str) -> None:
+    initialize(
+        {
+            "LOGGIA_ASYNCIO_MONITOR": "true",
+            "LOGGIA_ASYNCIO_SLOW_CALLBACK": slow_callback,
+            "LOGGIA_ASYNCIO_LAG_THRESHOLD": lag_threshold,
+        },
+    )
+
+
+async def _blocking_coroutine() -> None:
+    time.sleep(0.1)  # noqa: ASYNC251 # Blocking the loop is the point
+    await asyncio.sleep(0)
+
+
+def test_slow_callback(capjson: JsonStderrCaptureFixture):
+    _initialize_monitor(slow_callback="0.05", lag_threshold="0")
+    asyncio.run(_blocking_coroutine())
+
+    assert len(capjson.records) == 1
+    assert capjson.record["message"] == "Slow asyncio callback"
+    assert capjson.record["logger.name"] == "loggia.asyncio"
+    assert capjson.record["asyncio.callback"] == "_blocking_coroutine"
+    assert capjson.record["asyncio.duration_ms"] >= 100
+
+
+def test_loop_lag(capjson: JsonStderrCaptureFixture):
+    _initialize_monitor(slow_callback="0", lag_threshold="0.02")
+    asyncio.run(_blocking_coroutine())
+
+    assert len(capjson.records) == 1
+    assert capjson.record["message"] == "asyncio event loop lag"
+    assert capjson.record["asyncio.lag_ms"] >= 20
+
+
+def test_exception_handler(capjson: JsonStderrCaptureFixture):
+    _initialize_monitor(slow_callback="0", lag_threshold="0")
+
+    def failing_callback() -> None:
+        raise ValueError("boom")
+
+    async def main() -> None:
+        asyncio.get_running_loop().call_soon(failing_callback)
+        await asyncio.sleep(0.01)
+
+    asyncio.run(main())
+
+    assert len(capjson.records) == 1
+    assert capjson.record["logger.name"] == "asyncio"
+    assert capjson.record["message"].startswith("Exception in callback")
+    assert "failing_callback" in capjson.record["asyncio.handle"]
+    assert capjson.record["error.message"] == "ValueError: boom"
+
+
+def test_monitor_is_off_by_default(capjson: JsonStderrCaptureFixture):
+    initialize()
+    asyncio.run(_blocking_coroutine())
+
+    assert capjson.lines == []
+
+
+def test_asyncio_monitor_preset():
+    assert not LoggerConfiguration().asyncio_monitor
+    assert LoggerConfiguration(presets="prod,asyncio_monitor").asyncio_monitor
+    assert LoggerConfiguration(presets=["prod", "AsyncioMonitor"]).asyncio_monitor
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import logging
+import sys
+from typing import TYPE_CHECKING
+
+from loggia._internal import audit_bridge
+from loggia.conf import LoggerConfiguration
+from loggia.logger import initialize
+
+if TYPE_CHECKING:
+    from tests.conftest import JsonStderrCaptureFixture
+
+
+def _initialize_audit(events: str, rate_limit: float = 0) -> None:
+    conf = LoggerConfiguration()
+    conf.set_audit_events(events)
+    conf.set_audit_rate_limit(rate_limit)
+    initialize(conf)
+
+
+def test_allowlisted_events_are_logged(capjson: JsonStderrCaptureFixture):
+    _initialize_audit("loggia.test.audit")
+    sys.audit("loggia.test.audit", 42, "arg")
+    sys.audit("loggia.test.not_allowlisted", 42)
+
+    assert len(capjson.records) == 1
+    assert capjson.record["audit.event"] == "loggia.test.audit"
+    assert capjson.record["audit.args"] == ["42", "'arg'"]
+    assert capjson.record["logger.name"] == "loggia.audit"
+
+
+def test_rate_limit(capjson: JsonStderrCaptureFixture, mocker):
+    monotonic = mocker.patch("loggia._internal.audit_bridge.time.monotonic", return_value=100.0)
+    _initialize_audit("loggia.test.audit", rate_limit=2)
+    for _ in range(5):
+        sys.audit("loggia.test.audit")
+    monotonic.return_value = 101.0
+    sys.audit("loggia.test.audit")
+
+    assert len(capjson.records) == 3
+    assert "audit.dropped" not in capjson.records[1]
+    assert capjson.records[2]["audit.dropped"] == 3
+
+
+def test_reentrancy_guard(capjson: JsonStderrCaptureFixture):
+    _initialize_audit("loggia.test.audit")
+
+    class AuditingHandler(logging.Handler):
+        def emit(self, record: logging.LogRecord) -> None:
+            sys.audit("loggia.test.audit", "from handler")
+
+    handler = AuditingHandler()
+    logging.getLogger("loggia.audit").addHandler(handler)
+    try:
+        sys.audit("loggia.test.audit", "from test")
+    finally:
+        logging.getLogger("loggia.audit").removeHandler(handler)
+
+    assert len(capjson.records) == 1
+
+
+def test_reinitialize_swaps_allowlist(capjson: JsonStderrCaptureFixture):
+    _initialize_audit("loggia.test.audit")
+    initialize(LoggerConfiguration())
+    sys.audit("loggia.test.audit")
+
+    assert audit_bridge._events == frozenset()
+    assert capjson.lines == []
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import contextlib
+import logging
+import os
+import signal
+
+import pytest
+
+import loggia.metrics
+from loggia._internal.logger_dump import dump_logger_tree, format_logger_tree, install_dump_signal, parse_signal
+from loggia.conf import LoggerConfiguration
+from loggia.logger import initialize
+
+
+@pytest.fixture(autouse=True)
+def _restore_signal():
+    yield
+    install_dump_signal(None)
+    loggia.metrics.configure(enabled=False)
+    loggia.metrics.reset()
+
+
+@pytest.mark.parametrize("value", ["SIGUSR1", "USR1", "usr1", "true", signal.SIGUSR1.value])
+def test_dump_signal_conf(value: str | int):
+    conf = LoggerConfiguration()
+    conf.set_dump_signal(value)
+    assert conf.dump_signal == signal.SIGUSR1
+
+
+def test_dump_signal_conf_disabled():
+    conf = LoggerConfiguration(settings={"LOGGIA_DUMP_SIGNAL": "false"})
+    assert conf.dump_signal is None
+    with pytest.raises(ValueError, match="Unknown signal"):
+        parse_signal("SIGNOPE")
+
+
+def test_logger_tree():
+    conf = LoggerConfiguration(settings={"LOGGIA_METRICS": "true"})
+    conf.set_logger_level("test.dump.quiet", "ERROR")
+    initialize(conf)
+    logging.getLogger("test.dump.quiet").error("hello")
+    logging.getLogger("test.dump.quiet.child")
+
+    lines = format_logger_tree().splitlines()
+    assert lines[0].startswith(f"Logger tree of process {os.getpid()} (metrics enabled)")
+    assert lines[1].startswith("root level=INFO effective=INFO propagate=True handlers=[LoggiaStreamHandler(")
+    quiet = next(line for line in lines if line.lstrip().startswith("test.dump.quiet "))
+    child = next(line for line in lines if line.lstrip().startswith("test.dump.quiet.child "))
+    assert quiet.startswith("      test.dump.quiet level=ERROR")
+    assert quiet.endswith("records=1 dropped=0")
+    assert "level=NOTSET effective=ERROR" in child
+    assert lines.index(quiet) < lines.index(child)
+
+
+def test_logger_tree_suppressed():
+    conf = LoggerConfiguration(settings={"LOGGIA_METRICS": "true", "LOGGIA_METRICS_SUPPRESSED": "true"})
+    conf.set_logger_level("test.dump.chatty", "WARNING")
+    initialize(conf)
+    logger = logging.getLogger("test.dump.chatty")
+    for i in range(5):
+        logger.debug("hidden %d", i)
+    logger.info("hidden")
+    logger.warning("shown")
+
+    lines = format_logger_tree().splitlines()
+    chatty = next(line for line in lines if line.lstrip().startswith("test.dump.chatty "))
+    assert chatty.endswith("records=1 dropped=0 suppressed=6")
+    assert loggia.metrics.snapshot()["test.dump.chatty"]["DEBUG"]["suppressed"] == 5
+
+
+def test_dump_to_fd():
+    read_fd, write_fd = os.pipe()
+    try:
+        dump_logger_tree(write_fd)
+        os.close(write_fd)
+        with os.fdopen(read_fd) as f:
+            assert f.readline().startswith("Logger tree of process")
+    finally:
+        for fd in (read_fd, write_fd):
+            with contextlib.suppress(OSError):
+                os.close(fd)
+
+
+def test_dump_on_signal(capfd: pytest.CaptureFixture[str]):
+    previous = signal.getsignal(signal.SIGUSR1)
+    initialize({"LOGGIA_DUMP_SIGNAL": "SIGUSR1"})
+    signal.raise_signal(signal.SIGUSR1)
+    assert "Logger tree of process" in capfd.readouterr().err
+
+    install_dump_signal(None)
+    assert signal.getsignal(signal.SIGUSR1) == previous
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import warnings
+from typing import TYPE_CHECKING
+
+import pytest
+
+from loggia._internal.warnings_bridge import WarningsBridge
+from loggia.conf import LoggerConfiguration
+from loggia.logger import initialize
+
+if TYPE_CHECKING:
+    from tests.conftest import JsonStderrCaptureFixture
+
+
+@pytest.fixture(autouse=True)
+def _restore_showwarning():
+    showwarning = warnings.showwarning
+    yield
+    bridge = getattr(warnings.showwarning, "__self__", None)
+    if isinstance(bridge, WarningsBridge):
+        bridge.uninstall()
+    warnings.showwarning = showwarning
+
+
+def _deprecated():
+    warnings.warn("do not use", DeprecationWarning, stacklevel=1)
+
+
+def test_warnings_are_structured_and_coalesced(capjson: JsonStderrCaptureFixture):
+    conf = LoggerConfiguration()
+    conf.set_capture_warnings(enabled=True)
+    initialize(conf)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("always")
+        for _ in range(3):
+            _deprecated()
+        warnings.showwarning.__self__.flush()  # type: ignore[attr-defined]
+
+    first, summary = capjson.records
+    assert first["message"] == "DeprecationWarning: do not use"
+    assert first["warning.category"] == "builtins.DeprecationWarning"
+    assert first["warning.filename"] == __file__
+    assert isinstance(first["warning.lineno"], int)
+    assert summary["warning.count"] == 2
+    assert summary["warning.lineno"] == first["warning.lineno"]
+
+
+def test_warnings_summary_interval(capjson: JsonStderrCaptureFixture):
+    conf = LoggerConfiguration()
+    conf.set_capture_warnings(enabled=True)
+    conf.set_warnings_summary_interval(0)
+    initialize(conf)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("always")
+        for _ in range(3):
+            _deprecated()
+
+    assert len(capjson.records) == 3
+    assert "warning.count" not in capjson.records[0]
+    assert capjson.records[1]["warning.count"] == 1
+    assert capjson.records[2]["warning.count"] == 1
+
+
+def test_warnings_bounded_registry(capjson: JsonStderrCaptureFixture):
+    conf = LoggerConfiguration()
+    conf.set_capture_warnings(enabled=True)
+    initialize(conf)
+    bridge = warnings.showwarning.__self__  # type: ignore[attr-defined]
+    bridge.max_entries = 2
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("always")
+        for lineno in (1, 1, 2, 3):
+            warnings.warn_explicit("msg", UserWarning, "somefile.py", lineno)
+
+    assert len(bridge._locations) == 2
+    assert capjson.records[-1]["warning.count"] == 1
+    assert capjson.records[-1]["warning.lineno"] == 1
+
+
+def test_warnings_capture_disabled_by_initialize():
+    showwarning = warnings.showwarning
+    conf = LoggerConfiguration()
+    conf.set_capture_warnings(enabled=True)
+    initialize(conf)
+    assert isinstance(warnings.showwarning.__self__, WarningsBridge)  # type: ignore[attr-defined]
+
+    initialize(LoggerConfiguration())
+    assert warnings.showwarning is showwarning
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import datetime as dt
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+
+import pytest
+
+from loggia._internal.access_sampling import AccessLogSampler
+from loggia._internal.rules import RuleSyntaxError
+from loggia.conf import LoggerConfiguration
+from loggia.logger import initialize
+from loggia.structlog_utils.gunicorn_logger import GunicornLogger
+
+if TYPE_CHECKING:
+    from tests.conftest import JsonStderrCaptureFixture
+
+RULES = "status>=400 -> keep; duration>500ms -> keep; path=/healthz -> drop; path=/static/* -> drop; status=2xx -> 0"
+
+
+@pytest.mark.parametrize(
+    ("status", "duration", "path", "expected"),
+    [
+        (500, 0.01, "/healthz", True),
+        (404, 0.01, "/", True),
+        (200, 0.7, "/", True),
+        (200, 0.01, "/healthz", False),
+        (200, 0.01, "/static/app.js", False),
+        (200, 0.01, "/", False),
+        (302, 0.01, "/", True),
+    ],
+)
+def test_sampler_rules(status: int, duration: float, path: str, *, expected: bool):
+    assert AccessLogSampler(RULES).keep(status, duration, path) is expected
+
+
+def test_sampler_quoted_regex():
+    sampler = AccessLogSampler(r'path~"^/api/v\d+/" -> drop; path~"\.js$" -> drop; path="say \"hi\"" -> drop; * -> keep')
+    assert not sampler.keep(200, 0.01, "/api/v2/users")
+    assert sampler.keep(200, 0.01, "/api/vd/users")
+    assert not sampler.keep(200, 0.01, "/static/app.js")
+    assert sampler.keep(200, 0.01, "/static/appxjs")
+    assert not sampler.keep(200, 0.01, 'say "hi"')
+
+
+def test_sampler_rate(mocker):
+    sampler = AccessLogSampler("* -> 1%")
+    mocker.patch("loggia._internal.access_sampling.random.random", return_value=0.005)
+    assert sampler.keep(200, 0.0, "/")
+    mocker.patch("loggia._internal.access_sampling.random.random", return_value=0.5)
+    assert not sampler.keep(200, 0.0, "/")
+
+
+@pytest.mark.parametrize("rules", ["status>=400", "method=GET -> keep", "status>=400 -> sometimes", "* -> 200%", "path>/ -> keep"])
+def test_sampler_invalid_rules(rules: str):
+    with pytest.raises(RuleSyntaxError):
+        AccessLogSampler(rules)
+
+
+def _gunicorn_access(logger: GunicornLogger, status: str, path: str) -> None:
+    environ = {"RAW_URI": path, "PATH_INFO": path, "REQUEST_METHOD": "GET"}
+    logger.access(SimpleNamespace(status=status, sent=0), None, environ, dt.timedelta(milliseconds=5))  # type: ignore[arg-type]
+
+
+def test_gunicorn_access_sampling(capjson: JsonStderrCaptureFixture):
+    with_env = {"LOGGIA_ACCESS_SAMPLING": "path=/healthz -> drop"}
+    initialize(LoggerConfiguration(settings=with_env))
+    logger = GunicornLogger(cfg=None)  # type: ignore[arg-type]
+    _gunicorn_access(logger, "200 OK", "/healthz")
+    _gunicorn_access(logger, "200 OK", "/api")
+
+    assert len(capjson.records) == 1
+    assert capjson.record["http.url"] == "/api"
+    assert capjson.record["http.status_code"] == "200"
+
+
+def test_hypercorn_access_sampling(capjson: JsonStderrCaptureFixture):
+    pytest.importorskip("hypercorn")
+    import asyncio
+
+    from hypercorn.config import Config
+
+    from loggia.structlog_utils.hypercorn_logger import HypercornLogger
+
+    conf = LoggerConfiguration()
+    conf.set_logger_level("hypercorn.access", "INFO")
+    conf.set_access_log_sampling("status>=500 -> keep; * -> drop")
+    initialize(conf)
+    logger = HypercornLogger(Config())
+    for status in (200, 503):
+        request = {
+            "type": "http",
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": "/",
+            "query_string": b"",
+            "headers": [],
+        }
+        response = {"status": status, "headers": []}
+        asyncio.run(logger.access(request, response, 0.01))  # type: ignore[arg-type]
+
+    assert len(capjson.records) == 1
+    assert capjson.record["http.status_code"] == "503"
@@ -0,0 +1,99 @@
+"""Allocation budgets for the hot logging path.
+
+Each log call is budgeted by the peak of memory it allocates while running, and repeated calls
+by the bytes and the number of memory blocks they retain once done.
+Budgets are about twice what Loggia needs on CPython 3.11, to absorb differences between
+Python versions while still catching a change that doubles per-record allocations.
+"""
+
+from __future__ import annotations
+
+import gc
+import logging
+import os
+import sys
+import tracemalloc
+from typing import TYPE_CHECKING
+
+import pytest
+
+from loggia.logger import initialize
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator
+
+TEN_EXTRAS = {f"field_{i}": i for i in range(10)}
+HEADER_EXTRAS = {"x-request-id": "5f0c6a6e", "accept": "application/json"}
+
+
+@pytest.fixture
+def devnull_stderr(monkeypatch: pytest.MonkeyPatch) -> Generator[None, None, None]:
+    # Capture buffers grow with output, which would count as retained memory
+    with open(os.devnull, "w") as devnull:  # noqa: PTH123
+        monkeypatch.setattr(sys, "stderr", devnull)
+        yield
+
+
+def _peak_bytes(call: Callable[[], object], rounds: int = 20) -> int:
+    """Smallest peak of memory allocated during one call, over a few rounds."""
+    peaks = []
+    for _ in range(rounds):
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        call()
+        peaks.append(tracemalloc.get_traced_memory()[1] - current)
+    return min(peaks)
+
+
+def _snapshot() -> tracemalloc.Snapshot:
+    # Collect cyclic garbage first, and leave out the memory held by earlier snapshots
+    gc.collect()
+    return tracemalloc.take_snapshot().filter_traces([tracemalloc.Filter(inclusive=False, filename_pattern=tracemalloc.__file__)])
+
+
+def _retained(call: Callable[[], object], calls: int) -> tuple[int, int]:
+    """Bytes and memory blocks retained by `calls` calls."""
+    before = _snapshot()
+    for _ in range(calls):
+        call()
+    after = _snapshot()
+    stats = after.compare_to(before, "filename")
+    return sum(stat.size_diff for stat in stats if stat.size_diff > 0), sum(stat.count_diff for stat in stats if stat.count_diff > 0)
+
+
+def _measure(call: Callable[[], object]) -> tuple[int, int, int]:
+    """Return the peak bytes of one call, and the bytes and blocks retained by 4800 extra calls."""
+    for _ in range(50):
+        call()  # Warm up caches
+    tracemalloc.start()
+    try:
+        peak = _peak_bytes(call)
+        many_bytes, many_blocks = _retained(call, 5000)
+        few_bytes, few_blocks = _retained(call, 200)
+    finally:
+        tracemalloc.stop()
+    return peak, many_bytes - few_bytes, many_blocks - few_blocks
+
+
+@pytest.mark.usefixtures("devnull_stderr")
+@pytest.mark.parametrize(
+    ("preset", "level", "extra", "peak_budget"),
+    [
+        ("prod", logging.INFO, {}, 12_000),
+        ("prod", logging.INFO, TEN_EXTRAS, 18_000),
+        ("prod", logging.INFO, HEADER_EXTRAS, 14_000),
+        ("prod", logging.DEBUG, {}, 1_000),
+        ("dev", logging.INFO, {}, 12_000),
+        ("dev", logging.INFO, TEN_EXTRAS, 16_000),
+    ],
+    ids=["prod-info", "prod-10-extras", "prod-headers", "prod-below-level", "dev-info", "dev-10-extras"],
+)
+def test_allocation_budget(preset: str, level: int, extra: dict[str, object], peak_budget: int):
+    initialize(presets=[preset])
+    logger = logging.getLogger("test.allocations")
+
+    peak, leak, leaked_blocks = _measure(lambda: logger.log(level, "Processed order %s", "A-1234", extra=extra))
+
+    assert peak <= peak_budget
+    assert leak <= 8_000
+    assert leaked_blocks <= 480  # One block every ten calls
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+from typing import TYPE_CHECKING, Any
+
+import loggia.bench
+from loggia.bench import format_report, main, run
+
+if TYPE_CHECKING:
+    import pytest
+
+
+def test_bench_report():
+    os.environ["LOGGIA_LEVEL"] = "WARNING"
+    report = run(records=20)
+
+    by_level = {(s["level"], s["extras"]): s for s in report["scenarios"]}
+    assert not by_level[("INFO", 5)]["enabled"]
+    assert by_level[("WARNING", 20)]["enabled"]
+    assert by_level[("ERROR", 0)]["ns_per_call"] > 0
+    assert report["records_per_second"] > 0
+    assert report["stages"]["format:CustomJsonFormatter"]["count"] == 2 * 3 * 2
+    assert report["worst_stage"] == "format:CustomJsonFormatter"
+    assert "Worst filter or formatter stage: format:CustomJsonFormatter" in format_report(report)
+
+
+def test_bench_throughput_on_configuration_as_given(monkeypatch: pytest.MonkeyPatch):
+    handlers = []
+    run_scenarios = loggia.bench._run_scenarios
+
+    def recording_run_scenarios(logger: logging.Logger, records: int) -> list[dict[str, Any]]:
+        handlers.append(type(logging.getLogger().handlers[0]).__name__)
+        return run_scenarios(logger, records)
+
+    monkeypatch.setattr(loggia.bench, "_run_scenarios", recording_run_scenarios)
+    run(records=10)
+    assert handlers == ["StreamHandler", "LoggiaStreamHandler"]
+
+
+def test_bench_main_json(capsys: pytest.CaptureFixture[str]):
+    assert main(["--records", "10", "--json"]) == 0
+    report = json.loads(capsys.readouterr().out)
+    assert len(report["scenarios"]) == 12
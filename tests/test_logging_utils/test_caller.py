@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import logging
+import sys
+from typing import TYPE_CHECKING
+
+from loggia.logger import initialize
+
+if TYPE_CHECKING:
+    from tests.conftest import JsonStderrCaptureFixture
+
+
+def _line() -> int:
+    return sys._getframe(1).f_lineno
+
+
+def test_sub_caller_off(capjson: JsonStderrCaptureFixture):
+    initialize({"LOGGIA_SUB_CALLER": "app.hot:off"}, presets="prod")
+    logging.getLogger("app.hot.loop").info("hot")
+    logging.getLogger("app").info("cold")
+    line = _line() - 1
+
+    hot, cold = capjson.records
+    assert hot["logger.lineno"] == 0
+    assert hot["logger.method_name"] == "(unknown function)"
+    assert cold["logger.lineno"] == line
+    assert cold["logger.method_name"] == "test_sub_caller_off"
+    assert cold["logger.path_name"] == __file__
+
+
+def test_caller_location(capjson: JsonStderrCaptureFixture):
+    initialize({"LOGGIA_SUB_CALLER": "elsewhere:off"}, presets="prod")
+    logger = logging.getLogger("app")
+    lines = []
+
+    def log_for_caller() -> None:
+        logger.info("stacklevel", stacklevel=2)
+
+    log_for_caller()
+    lines.append(_line() - 1)
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        logger.exception("exception")
+        lines.append(_line() - 1)
+    logging.LoggerAdapter(logger).warning("adapter")
+    lines.append(_line() - 1)
+    logger.info("stack info", stack_info=True)
+    lines.append(_line() - 1)
+
+    assert [record["logger.lineno"] for record in capjson.records] == lines
+    assert {record["logger.method_name"] for record in capjson.records} == {"test_caller_location"}
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import logging
+import threading
+from typing import TYPE_CHECKING
+
+import pytest
+
+import loggia.callsites
+from loggia.callsites import SpaceSaving
+from loggia.conf import LoggerConfiguration
+from loggia.logger import initialize
+
+if TYPE_CHECKING:
+    from tests.conftest import JsonStderrCaptureFixture
+
+
+@pytest.fixture(autouse=True)
+def _disable_profiler():
+    yield
+    loggia.callsites.disable()
+    loggia.callsites.profiler.window = 0.0
+    loggia.callsites.profiler.reset()
+
+
+def test_space_saving_heavy_hitters():
+    sketch = SpaceSaving(capacity=4)
+    for i in range(1000):
+        sketch.add(("heavy.py", 1, "heavy"), 10)
+        sketch.add((f"light{i}.py", i, "light"), 1)
+
+    top = sketch.top(1)[0]
+    assert (top.pathname, top.lineno) == ("heavy.py", 1)
+    assert top.weight - top.error <= 10_000 <= top.weight
+    assert sketch.total == 11_000
+    assert len(sketch.top(10)) == 4
+
+
+def test_space_saving_evicts_the_lightest():
+    sketch = SpaceSaving(capacity=16)
+    weights: dict[tuple[str, int, str], int] = {}
+    for i in range(5000):
+        key = ("app.py", i * i % 61, "msg")
+        weight = i * 37 % 97 + 1
+        if key in weights:
+            weights[key] += weight
+        elif len(weights) < 16:
+            weights[key] = weight
+        else:
+            evicted = min(weights, key=lambda k: (weights[k], k))
+            weights[key] = weights.pop(evicted) + weight
+        sketch.add(key, weight)
+
+    assert {(hit.pathname, hit.lineno, hit.template): hit.weight for hit in sketch.top(16)} == weights
+
+
+def test_space_saving_capacity():
+    with pytest.raises(ValueError, match="positive"):
+        SpaceSaving(capacity=0)
+
+
+def test_callsite_profiler(capjson: JsonStderrCaptureFixture):
+    initialize({"LOGGIA_CALLSITE_PROFILER": "true"})
+    logger = logging.getLogger("test")
+    for i in range(3):
+        logger.info("small %d", i)
+    logger.info("a much, much larger message: %s", "x" * 2000)
+
+    by_count = loggia.callsites.top(by="count")
+    by_bytes = loggia.callsites.top(by="bytes")
+    assert by_count[0].template == "small %d"
+    assert by_count[0].weight == 3
+    assert by_count[0].pathname == __file__
+    assert by_bytes[0].template == "a much, much larger message: %s"
+    assert by_bytes[0].weight == len(capjson.lines[-1]) + 1
+
+
+def test_callsite_profiler_runtime_switch(capjson: JsonStderrCaptureFixture):
+    initialize({"LOGGIA_METRICS": "true"})
+    logging.getLogger("test").info("before")
+    loggia.callsites.enable(capacity=8)
+    logging.getLogger("test").info("during")
+    loggia.callsites.disable()
+    logging.getLogger("test").info("after")
+
+    assert [hit.template for hit in loggia.callsites.top(by="count")] == ["during"]
+
+
+def test_callsite_profiler_disabled_by_initialize(capjson: JsonStderrCaptureFixture):
+    initialize({"LOGGIA_CALLSITE_PROFILER": "true"})
+    assert loggia.callsites.profiler.enabled
+    initialize({"LOGGIA_METRICS": "true"})
+    assert not loggia.callsites.profiler.enabled
+    logging.getLogger("test").info("not profiled")
+    assert loggia.callsites.top(by="count") == []
+
+
+def test_callsite_profiler_window(capjson: JsonStderrCaptureFixture, mocker):
+    initialize({"LOGGIA_CALLSITE_PROFILER": "true", "LOGGIA_CALLSITE_PROFILER_WINDOW": "60"})
+    monotonic = mocker.patch("loggia.callsites.time.monotonic", return_value=0.0)
+    loggia.callsites.profiler._window_end = 60.0
+    for now in (0.0, 61.0):
+        monotonic.return_value = now
+        logging.getLogger("test").info("hello")
+
+    summary = capjson.records[-1]
+    assert summary["logger.name"] == "loggia.callsites"
+    assert summary["loggia.callsites.by_count"][0]["template"] == "hello"
+    assert summary["loggia.callsites.by_count"][0]["weight"] == 2
+    assert loggia.callsites.top(by="count") == []
+
+
+def test_callsite_profiler_window_single_summary(capjson: JsonStderrCaptureFixture, mocker):
+    initialize({"LOGGIA_CALLSITE_PROFILER": "true", "LOGGIA_CALLSITE_PROFILER_WINDOW": "60"})
+    mocker.patch("loggia.callsites.time.monotonic", return_value=61.0)
+    loggia.callsites.profiler._window_end = 60.0
+    barrier = threading.Barrier(8)
+
+    def log() -> None:
+        barrier.wait()
+        for _ in range(50):
+            logging.getLogger("test").info("hello")
+
+    threads = [threading.Thread(target=log) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    summaries = [record for record in capjson.records if record["logger.name"] == "loggia.callsites"]
+    assert len(summaries) == 1
+    assert summaries[0]["loggia.callsites.by_count"][0]["weight"] == 1
+    assert loggia.callsites.top(by="count")[0].weight == 399
+
+
+def test_callsite_profiler_invalid_by():
+    with pytest.raises(ValueError, match="by="):
+        loggia.callsites.top(by="lines")
+
+
+def test_callsite_profiler_conf():
+    conf = LoggerConfiguration(settings={"LOGGIA_CALLSITE_PROFILER": "true"})
+    assert conf._dictconfig["handlers"]["default"]["class"] == "loggia.stdlib_handlers.stream_handler.LoggiaStreamHandler"
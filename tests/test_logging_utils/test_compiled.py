@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import logging
+import os
+import subprocess
+import sys
+from typing import TYPE_CHECKING
+
+from loggia.logger import initialize
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from tests.conftest import BootstrapLoggerFixture
+
+
+def _run(*args: str, **env: str) -> subprocess.CompletedProcess[str]:
+    env = {"PATH": os.environ.get("PATH", ""), "PYTHONPATH": os.pathsep.join(sys.path), **env}
+    return subprocess.run([sys.executable, *args], env=env, capture_output=True, text=True, check=False)  # noqa: S603
+
+
+def test_compile_command(tmp_path: Path):
+    from loggia._internal.compiled import configuration_key
+
+    path = tmp_path / "loggia.conf"
+    result = _run("-m", "loggia", "compile", "-o", str(path), LOGGIA_PRESETS="prod")
+    assert result.returncode == 0, result.stderr
+    assert "Compiled the logging configuration" in result.stdout
+    assert path.read_bytes().split(b"\n", 1)[0].decode() == configuration_key({"LOGGIA_PRESETS": "prod"})
+
+
+def test_initialize_from_compiled_configuration(tmp_path: Path):
+    env = {
+        "LOGGIA_PRESETS": "prod",
+        "LOGGIA_LEVEL": "WARNING",
+        "LOGGIA_EXCEPTION_DEDUP_WINDOW": "30",
+        "LOGGIA_COMPILED_CONFIG": str(tmp_path / "loggia.conf"),
+    }
+    assert _run("-m", "loggia", "compile", **env).returncode == 0
+
+    from loggia._internal.compiled import load_compiled_configuration
+
+    os.environ.update(env)
+    conf = load_compiled_configuration()
+    assert conf is not None
+    assert conf.log_level == logging.WARNING
+    assert conf._exception_dedup is not None
+    assert conf._exception_dedup.window == 30
+
+    initialize()
+    assert logging.getLogger().level == logging.WARNING
+
+
+def test_stale_compiled_configuration(tmp_path: Path, capbootstrap: BootstrapLoggerFixture):
+    env = {"LOGGIA_PRESETS": "prod", "LOGGIA_COMPILED_CONFIG": str(tmp_path / "loggia.conf")}
+    assert _run("-m", "loggia", "compile", **env).returncode == 0
+
+    os.environ.update(env, LOGGIA_LEVEL="ERROR")
+    initialize()
+    capbootstrap.assert_one_message()
+    assert "stale compiled configuration" in capbootstrap.first_entry.msg
+    assert logging.getLogger().level == logging.ERROR
+
+
+def test_unreadable_compiled_configuration(tmp_path: Path, capbootstrap: BootstrapLoggerFixture):
+    os.environ.update(LOGGIA_PRESETS="prod", LOGGIA_COMPILED_CONFIG=str(tmp_path / "missing.conf"))
+    initialize()
+    capbootstrap.assert_one_message()
+    assert "unreadable compiled configuration" in capbootstrap.first_entry.msg
+
+
+def test_uncompilable_configuration(tmp_path: Path):
+    script = (
+        "from loggia.conf import LoggerConfiguration\n"
+        "from loggia._internal.compiled import compile_configuration\n"
+        "conf = LoggerConfiguration(presets='prod')\n"
+        "conf.add_default_handler_filter(lambda _: True)\n"
+        f"compile_configuration({str(tmp_path / 'loggia.conf')!r}, conf)\n"
+    )
+    result = _run("-c", script)
+    assert "ValueError: This configuration cannot be compiled" in result.stderr
+    assert not (tmp_path / "loggia.conf").exists()
+
+
+def test_compile_failure_leaves_no_temporary_file(tmp_path: Path):
+    (tmp_path / "loggia.conf").mkdir()
+    result = _run("-m", "loggia", "compile", "-o", str(tmp_path / "loggia.conf"), LOGGIA_PRESETS="prod")
+    assert "IsADirectoryError" in result.stderr
+    assert [path.name for path in tmp_path.iterdir()] == ["loggia.conf"]
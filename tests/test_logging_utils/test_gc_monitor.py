@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import gc
+import logging
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+import loggia.gc_monitor
+from loggia.conf import LoggerConfiguration
+from loggia.logger import initialize
+
+if TYPE_CHECKING:
+    from tests.conftest import JsonStderrCaptureFixture
+
+
+@pytest.fixture(autouse=True)
+def _reset_gc_monitor():
+    loggia.gc_monitor.reset()
+    yield
+    loggia.gc_monitor.configure(enabled=False)
+    loggia.gc_monitor.reset()
+
+
+def _make_garbage() -> None:
+    for _ in range(100):
+        cycle: list[object] = []
+        cycle.append(cycle)
+
+
+def test_slow_collections_are_logged_later(capjson: JsonStderrCaptureFixture, mocker):
+    mocker.patch.object(loggia.gc_monitor.monitor, "flush_interval", 60.0)
+    initialize({"LOGGIA_GC_MONITOR": "true", "LOGGIA_GC_THRESHOLD": "0", "LOGGIA_GC_SUMMARY_INTERVAL": "0"})
+    _make_garbage()
+    gc.collect()
+    assert capjson.lines == []
+
+    logging.getLogger("test").info("hello")
+    gc_records = [r for r in capjson.records if r["logger.name"] == "loggia.gc"]
+    assert capjson.records[-1]["message"] == "hello"
+    assert gc_records
+    assert gc_records[-1]["message"] == "Slow garbage collection"
+    assert gc_records[-1]["gc.generation"] == 2
+    assert gc_records[-1]["gc.collected"] >= 100
+    assert gc_records[-1]["gc.duration_ms"] >= 0
+    assert "gc.rss_bytes" in gc_records[-1]
+
+
+def test_slow_collections_are_logged_by_the_flusher(capjson: JsonStderrCaptureFixture, mocker):
+    mocker.patch.object(loggia.gc_monitor.monitor, "flush_interval", 0.01)
+    initialize({"LOGGIA_GC_MONITOR": "true", "LOGGIA_GC_THRESHOLD": "0", "LOGGIA_GC_SUMMARY_INTERVAL": "0"})
+    gc.collect()
+    deadline = time.monotonic() + 5
+    while not capjson.lines and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert capjson.records[0]["message"] == "Slow garbage collection"
+    loggia.gc_monitor.configure(enabled=False)
+    assert loggia.gc_monitor._stop is None
+
+
+def test_fast_collections_are_not_logged(capjson: JsonStderrCaptureFixture):
+    initialize({"LOGGIA_GC_MONITOR": "true", "LOGGIA_GC_THRESHOLD": "60", "LOGGIA_GC_SUMMARY_INTERVAL": "0"})
+    gc.collect()
+    logging.getLogger("test").info("hello")
+
+    assert len(capjson.records) == 1
+    assert loggia.gc_monitor.snapshot()["gc.collections"][2] >= 1
+
+
+def test_summary(capjson: JsonStderrCaptureFixture):
+    initialize({"LOGGIA_GC_MONITOR": "true", "LOGGIA_GC_THRESHOLD": "60", "LOGGIA_GC_SUMMARY_INTERVAL": "0.000001"})
+    _make_garbage()
+    gc.collect()
+    logging.getLogger("test").info("hello")
+
+    summary = capjson.records[0]
+    assert summary["message"] == "Garbage collection summary"
+    assert summary["gc.collections"][2] >= 1
+    assert summary["gc.collected"][2] >= 100
+    assert len(summary["gc.max_pause_ms"]) == 3
+    assert loggia.gc_monitor.snapshot()["gc.collections"] == [0, 0, 0]
+
+
+def test_gc_monitor_preset():
+    assert not LoggerConfiguration().gc_monitor_enabled
+    assert LoggerConfiguration(presets="prod,gc_monitor").gc_monitor_enabled
+    initialize(LoggerConfiguration())
+    assert loggia.gc_monitor.monitor.callback not in gc.callbacks
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import logging
+import threading
+from typing import TYPE_CHECKING
+
+import pytest
+
+import loggia.metrics
+from loggia._internal import logger_class
+from loggia.conf import LoggerConfiguration
+from loggia.logger import initialize
+from loggia.stdlib_handlers.stream_handler import LoggiaStreamHandler
+
+if TYPE_CHECKING:
+    from tests.conftest import JsonStderrCaptureFixture
+
+
+@pytest.fixture(autouse=True)
+def _reset_metrics():
+    loggia.metrics.reset()
+    yield
+    loggia.metrics.configure(enabled=False)
+    loggia.metrics.reset()
+
+
+def _initialize_metrics(**settings: str) -> None:
+    conf = LoggerConfiguration(settings={"LOGGIA_METRICS": "true", **settings})
+    initialize(conf)
+
+
+def test_metrics_per_logger_and_level(capjson: JsonStderrCaptureFixture):
+    _initialize_metrics()
+    assert isinstance(logging.getLogger().handlers[0], LoggiaStreamHandler)
+
+    logging.getLogger("test.a").info("hello")
+    logging.getLogger("test.a").warning("hello")
+    logging.getLogger("test.b").info("hello")
+    logging.getLogger("test.b").debug("not emitted")
+
+    snapshot = loggia.metrics.snapshot()
+    lines = capjson.lines
+    assert snapshot["test.a"]["INFO"]["records"] == 1
+    assert snapshot["test.a"]["WARNING"]["records"] == 1
+    assert snapshot["test.b"]["INFO"]["bytes"] == len(lines[2]) + 1
+    assert "DEBUG" not in snapshot["test.b"]
+    assert loggia.metrics.totals()["records"] == 3
+
+
+def test_metrics_aggregate_threads(capjson: JsonStderrCaptureFixture):
+    _initialize_metrics()
+
+    def emit() -> None:
+        for _ in range(10):
+            logging.getLogger("test").info("hello")
+
+    threads = [threading.Thread(target=emit) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert loggia.metrics.snapshot()["test"]["INFO"]["records"] == 40
+    # The counters of the threads that ended are merged, instead of piling up
+    assert len(loggia.metrics.metrics._all_counters) <= 1  # This thread's, if any
+
+
+def test_metrics_dropped_and_format_errors(capjson: JsonStderrCaptureFixture, mocker):
+    conf = LoggerConfiguration()
+    conf.set_metrics(enabled=True)
+    conf.add_default_handler_filter(lambda record: record.msg != "drop me")
+    initialize(conf)
+    logger = logging.getLogger("test")
+    logger.info("drop me")
+    handle_error = mocker.patch.object(LoggiaStreamHandler, "handleError")
+    logger.info("%s %s", "not enough args")  # noqa: PLE1206
+
+    assert handle_error.called
+    counters = loggia.metrics.snapshot()["test"]["INFO"]
+    assert counters["dropped"] == 1
+    assert counters["format_errors"] == 1
+    assert counters["records"] == 0
+
+
+def test_metrics_summary(capjson: JsonStderrCaptureFixture, mocker):
+    _initialize_metrics(LOGGIA_METRICS_SUMMARY_INTERVAL="60")
+    monotonic = mocker.patch("loggia.metrics.time.monotonic", return_value=0.0)
+    loggia.metrics.metrics._next_summary = 60.0
+    logging.getLogger("test").info("hello")
+    snapshot = mocker.spy(loggia.metrics.metrics, "snapshot")
+    monotonic.return_value = 61.0
+    logging.getLogger("test").info("hello")
+
+    assert snapshot.call_count == 1  # Totals are computed from the same snapshot
+    summary = capjson.records[-1]
+    assert summary["logger.name"] == "loggia.metrics"
+    assert summary["loggia.metrics"]["test"]["INFO"]["records"] == 2
+    assert summary["loggia.metrics.totals"]["records"] == 2
+
+
+def test_metrics_disabled_by_default(capjson: JsonStderrCaptureFixture):
+    initialize()
+    logging.getLogger("test").info("hello")
+    assert type(logging.getLogger().handlers[0]) is logging.StreamHandler
+    assert loggia.metrics.snapshot() == {}
+
+
+def test_metrics_suppressed(capjson: JsonStderrCaptureFixture):
+    _initialize_metrics(LOGGIA_METRICS_SUPPRESSED="true")
+    logger = logging.getLogger("test")
+    logger.debug("suppressed")
+    logging.LoggerAdapter(logger).debug("suppressed")
+    logger.info("emitted")
+
+    counters = loggia.metrics.snapshot()["test"]
+    assert counters["DEBUG"]["suppressed"] == 2
+    assert counters["INFO"]["suppressed"] == 0
+    assert counters["INFO"]["records"] == 1
+
+    _initialize_metrics()
+    assert "isEnabledFor" not in vars(logger_class.LoggiaLogger)
+    assert type(logger) is logging.Logger
+    logger.debug("not counted")
+    assert loggia.metrics.snapshot()["test"]["DEBUG"]["suppressed"] == 2
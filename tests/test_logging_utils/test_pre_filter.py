@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any
+
+from loggia.logger import initialize
+
+if TYPE_CHECKING:
+    from tests.conftest import JsonStderrCaptureFixture
+
+
+def test_pre_filter_rules(capjson: JsonStderrCaptureFixture):
+    existing = logging.getLogger("noisy.existing")
+    initialize({"LOGGIA_PRE_FILTER_RULES": 'logger=noisy.* -> drop; msg="Cache hit for %s" -> drop'}, presets="prod")
+
+    created = []
+    factory = logging.getLogRecordFactory()
+
+    def counting_factory(*args: Any, **kwargs: Any) -> logging.LogRecord:
+        created.append(args[0])
+        return factory(*args, **kwargs)
+
+    logging.setLogRecordFactory(counting_factory)
+    existing.warning("hidden")
+    logging.getLogger("noisy.new").warning("hidden")
+    logging.getLogger("app").warning("Cache hit for %s", "key")
+    logging.getLogger("app").warning("Cache miss for %s", "key")
+
+    assert created == ["app"]
+    assert [record["message"] for record in capjson.records] == ["Cache miss for key"]
+    assert capjson.record["logger.method_name"] == "test_pre_filter_rules"
+
+
+def test_logger_class_uninstalled():
+    initialize({"LOGGIA_PRE_FILTER_RULES": "level<INFO -> drop"}, presets="prod")
+    assert type(logging.getLogger("app")).__name__ == "LoggiaLogger"
+    assert type(logging.getLogger()).__name__ == "LoggiaRootLogger"
+
+    initialize(presets="prod")
+    assert type(logging.getLogger("app")) is logging.Logger
+    assert type(logging.getLogger()) is logging.RootLogger
+
+
+def test_logger_class_only_for_dev():
+    import loggia.stdlib_formatters.pretty_formatter  # noqa: F401
+
+    initialize(presets="prod")
+    assert logging.Logger._log.__module__ == "logging"
+    assert type(logging.getLogger("app")) is logging.Logger
+
+    initialize(presets="dev")
+    assert type(logging.getLogger("app")).__name__ == "LoggiaLogger"
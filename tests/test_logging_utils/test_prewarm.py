@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+import loggia.metrics
+from loggia.filters.exception_dedup import ExceptionDedup
+from loggia.logger import initialize
+
+if TYPE_CHECKING:
+    from tests.conftest import BootstrapLoggerFixture, JsonStderrCaptureFixture
+
+
+def test_prewarm_writes_nothing(capjson: JsonStderrCaptureFixture):
+    loggia.metrics.reset()
+    initialize({"LOGGIA_PREWARM": "true", "LOGGIA_METRICS": "true", "LOGGIA_EXCEPTION_DEDUP_WINDOW": "60"}, presets="prod")
+
+    # Only the report of the warm-up is written, and counted
+    assert [r["message"] for r in capjson.records] == [capjson.records[0]["message"]]
+    assert capjson.records[0]["logger.name"] == "loggia.prewarm"
+    assert capjson.records[0]["prewarm.duration_ms"] > 0
+    assert loggia.metrics.totals()["records"] == 1
+    loggia.metrics.configure(enabled=False)
+
+
+def test_prewarm_survives_broken_formatters(capbootstrap: BootstrapLoggerFixture):
+    from loggia._internal.prewarm import prewarm
+
+    class BrokenFormatter(logging.Formatter):
+        def format(self, record: logging.LogRecord) -> str:
+            raise RuntimeError("broken")
+
+    handler = logging.StreamHandler()
+    handler.setFormatter(BrokenFormatter())
+    logger = logging.getLogger("test.prewarm")
+    logger.addHandler(handler)
+    try:
+        assert prewarm([logger]) > 0
+        capbootstrap.assert_one_message()
+        assert "Warming up the handler" in capbootstrap.first_entry.msg
+    finally:
+        logger.removeHandler(handler)
+
+
+def test_prewarm_skips_stateful_filters():
+    from loggia._internal.prewarm import prewarm
+
+    seen: list[logging.LogRecord] = []
+
+    class RecordingFilter(logging.Filter):
+        def filter(self, record: logging.LogRecord) -> bool:
+            seen.append(record)
+            return True
+
+    dedup = ExceptionDedup()
+    handler = logging.NullHandler()
+    handler.addFilter(logging.Filter("loggia"))
+    handler.addFilter(dedup)
+    handler.addFilter(RecordingFilter())
+    logger = logging.getLogger("test.prewarm")
+    logger.addHandler(handler)
+    try:
+        prewarm([logger])
+    finally:
+        logger.removeHandler(handler)
+
+    assert seen == []
+    assert not dedup._occurrences
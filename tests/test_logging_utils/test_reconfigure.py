@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import logging
+import os
+import signal
+import socket
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+import loggia.reconfigure
+from loggia.conf import LoggerConfiguration
+from loggia.logger import initialize
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from pathlib import Path
+
+
+@pytest.fixture(autouse=True)
+def _uninstall() -> Generator[None, None, None]:
+    yield
+    loggia.reconfigure.uninstall()
+
+
+def _wait_for(condition, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def test_apply_keeps_handlers():
+    initialize({"LOGGIA_SUB_LEVEL": "app.db:DEBUG", "LOGGIA_EXCEPTION_DEDUP_WINDOW": "60"}, presets="prod")
+    handler = logging.getLogger().handlers[0]
+    dedup = handler.filters[0]
+
+    conf = LoggerConfiguration(
+        presets="prod",
+        settings={"LOGGIA_LEVEL": "WARNING", "LOGGIA_SUB_LEVEL": "app.http:ERROR", "LOGGIA_SUB_PROPAGATION": "app.http:false"},
+    )
+    changes = loggia.reconfigure.apply(conf)
+
+    assert logging.getLogger().handlers == [handler]
+    assert logging.getLogger().level == logging.WARNING
+    assert logging.getLogger("app.db").level == logging.NOTSET
+    assert logging.getLogger("app.http").level == logging.ERROR
+    assert not logging.getLogger("app.http").propagate
+    assert dedup not in handler.filters
+    assert "logger root level: INFO -> WARNING" in changes
+    assert len(changes) == 5
+    assert loggia.reconfigure.apply(conf) == []
+
+
+def test_apply_filters():
+    initialize(presets="prod")
+    conf = LoggerConfiguration(presets="prod")
+    conf.add_log_filter("app", lambda _: False)
+    loggia.reconfigure.apply(conf)
+    assert len(logging.getLogger("app").filters) == 1
+
+    loggia.reconfigure.apply(LoggerConfiguration(presets="prod"))
+    assert logging.getLogger("app").filters == []
+
+
+def test_set_level_for_a_while():
+    initialize({"LOGGIA_SUB_LEVEL": "app:WARNING"}, presets="prod")
+    loggia.reconfigure.set_level("app", "DEBUG", duration=0.05)
+    assert logging.getLogger("app").level == logging.DEBUG
+
+    # Reconfigurations leave the override alone until it expires
+    loggia.reconfigure.apply(LoggerConfiguration(presets="prod", settings={"LOGGIA_SUB_LEVEL": "app:ERROR"}))
+    assert logging.getLogger("app").level == logging.DEBUG
+    _wait_for(lambda: logging.getLogger("app").level != logging.DEBUG)
+    assert logging.getLogger("app").level == logging.ERROR
+
+
+def test_set_level_cancelled_by_initialize():
+    initialize(presets="prod")
+    loggia.reconfigure.set_level("app.db", "DEBUG", duration=60)
+
+    initialize({"LOGGIA_SUB_LEVEL": "app.db:WARNING"}, presets="prod")
+    assert logging.getLogger("app.db").level == logging.WARNING
+    loggia.reconfigure.apply(LoggerConfiguration(presets="prod"))
+    assert logging.getLogger("app.db").level == logging.NOTSET
+
+
+def test_reconfigure_file(tmp_path: Path):
+    path = tmp_path / "loggia.env"
+    path.write_text("# Raised while investigating\nLOGGIA_SUB_LEVEL=app:DEBUG\n")
+    initialize({"LOGGIA_RECONFIGURE_FILE": str(path), "LOGGIA_RECONFIGURE_INTERVAL": "0.01"}, presets="prod")
+    assert logging.getLogger("app").level == logging.DEBUG
+
+    path.write_text("LOGGIA_SUB_LEVEL=app:ERROR\n")
+    os.utime(path, ns=(0, time.time_ns() + 1_000_000_000))
+    _wait_for(lambda: logging.getLogger("app").level == logging.ERROR)
+    assert logging.getLogger("app").level == logging.ERROR
+
+    path.unlink()
+    assert loggia.reconfigure.reload() == ["logger app level: ERROR -> NOTSET"]
+
+
+def test_reconfigure_signal(tmp_path: Path):
+    path = tmp_path / "loggia.env"
+    initialize(
+        {"LOGGIA_RECONFIGURE_FILE": str(path), "LOGGIA_RECONFIGURE_INTERVAL": "0", "LOGGIA_RECONFIGURE_SIGNAL": "SIGUSR2"}, presets="prod"
+    )
+    path.write_text("LOGGIA_SUB_LEVEL=app:DEBUG\n")
+    time.sleep(0.05)
+    assert logging.getLogger("app").level == logging.NOTSET
+
+    os.kill(os.getpid(), signal.SIGUSR2)
+    _wait_for(lambda: logging.getLogger("app").level == logging.DEBUG)
+    assert logging.getLogger("app").level == logging.DEBUG
+
+
+def _send(path: str, command: str) -> str:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(5)
+        client.connect(path)
+        client.sendall(f"{command}\n".encode())
+        return b"".join(iter(lambda: client.recv(4096), b"")).decode()
+
+
+def test_control_socket(tmp_path: Path):
+    path = str(tmp_path / "loggia.sock")
+    initialize({"LOGGIA_CONTROL_SOCKET": path}, presets="prod")
+
+    def send(command: str) -> str:
+        return _send(path, command)
+
+    assert send("level app.db DEBUG 60") == "ok\n"
+    assert logging.getLogger("app.db").level == logging.DEBUG
+    assert "app.db" in send("show")
+    assert send("level root WHATEVER").startswith("error: ")
+    assert send("dance").startswith("error: expected")
+
+    loggia.reconfigure.uninstall()
+    assert not os.path.exists(path)  # noqa: PTH110
+
+
+def test_control_socket_survives_failed_reload(tmp_path: Path, capsys: pytest.CaptureFixture[str]):
+    path = str(tmp_path / "loggia.sock")
+    settings = tmp_path / "loggia.env"
+    initialize(
+        {"LOGGIA_CONTROL_SOCKET": path, "LOGGIA_RECONFIGURE_FILE": str(settings), "LOGGIA_RECONFIGURE_INTERVAL": "0"}, presets="prod"
+    )
+    settings.write_text("LOGGIA_EXTRA_FILTERS=nope.Nope\n")
+
+    assert _send(path, "reload").startswith("error: ")
+    assert "Control socket command failed" in capsys.readouterr().err
+    settings.write_text("LOGGIA_SUB_LEVEL=app:DEBUG\n")
+    assert _send(path, "reload") == "ok\nlogger app level: NOTSET -> DEBUG\n"
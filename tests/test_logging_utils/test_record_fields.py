@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import logging
+import sys
+from typing import TYPE_CHECKING
+
+from loggia.logger import initialize
+
+if TYPE_CHECKING:
+    from tests.conftest import JsonStderrCaptureFixture
+
+
+def test_lean_records_prod(capjson: JsonStderrCaptureFixture):
+    initialize({"LOGGIA_LEAN_RECORDS": "true"}, presets="prod")
+    assert logging.logThreads
+    assert not logging.logProcesses
+    assert not logging.logMultiprocessing
+
+    logging.getLogger("app").info("hello")
+    assert capjson.record["logger.thread_name"] == "MainThread"
+
+    initialize(presets="prod")
+    assert logging.logProcesses
+    assert logging.logMultiprocessing
+
+
+def test_lean_records_dev():
+    initialize({"LOGGIA_LEAN_RECORDS": "true"}, presets="dev")
+    assert not logging.logThreads
+    assert not logging.logProcesses
+    record = logging.getLogger("app").makeRecord("app", logging.INFO, __file__, 0, "hello", (), None)
+    assert record.process is None
+    assert record.threadName is None
+
+
+def test_lean_records_unknown_handler():
+    handler = logging.StreamHandler(sys.stderr)
+    handler.setFormatter(logging.Formatter("%(process)d %(message)s"))
+    logging.getLogger("app").addHandler(handler)
+    initialize({"LOGGIA_LEAN_RECORDS": "true"}, presets="prod")
+    assert logging.logProcesses
+    assert not logging.logMultiprocessing
+
+    logging.getLogger("app").addFilter(lambda _: True)
+    initialize({"LOGGIA_LEAN_RECORDS": "true"}, presets="prod")
+    assert logging.logMultiprocessing
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import logging
+
+import pytest
+
+import loggia.reconfigure
+from loggia._internal import strip
+from loggia.logger import initialize
+
+
+@pytest.fixture(autouse=True)
+def _unstrip():
+    yield
+    strip.configure(None)
+
+
+def test_strip_below(capsys: pytest.CaptureFixture[str]):
+    created_before = logging.getLogger("app.before")
+    initialize({"LOGGIA_STRIP_BELOW": "INFO", "LOGGIA_SUB_LEVEL": "app.verbose:DEBUG"}, presets="prod")
+    created_after = logging.getLogger("app.after")
+
+    for logger in (created_before, created_after):
+        assert logger.debug is strip._noop
+        assert logger.info is not strip._noop
+    assert logging.getLogger("app.verbose").debug is not strip._noop
+
+    logging.getLogger("app.verbose").debug("kept")
+    created_after.debug("stripped")
+    assert "kept" in capsys.readouterr().err
+
+    strip.configure(None)
+    assert "debug" not in created_after.__dict__
+
+
+def test_strip_follows_reconfigurations():
+    initialize({"LOGGIA_STRIP_BELOW": "ERROR", "LOGGIA_LEVEL": "ERROR"}, presets="prod")
+    logger = logging.getLogger("app")
+    assert logger.warning is strip._noop
+    assert logger.error is not strip._noop
+
+    loggia.reconfigure.set_level("app", "DEBUG")
+    assert logger.debug is not strip._noop
+    assert logger.warning is not strip._noop
+
+    loggia.reconfigure.set_level("app", "ERROR")
+    assert logger.debug is strip._noop
+
+
+def test_strip_below_disabled_by_default():
+    initialize(presets="prod")
+    assert logging.getLogger("app").debug is not strip._noop
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import logging
+import sys
+import threading
+from typing import TYPE_CHECKING
+
+import pytest
+
+from loggia.logger import initialize
+from loggia.stdlib_formatters.pretty_formatter import PrettyFormatter
+
+if TYPE_CHECKING:
+    from tests.conftest import ErrlinesCaptureFixture, JsonStderrCaptureFixture
+
+
+@pytest.fixture
+def _frequent_thread_switches():
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def _run_threads(target, count: int = 8) -> None:
+    barrier = threading.Barrier(count)
+
+    def run(i: int) -> None:
+        barrier.wait()
+        target(i)
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+@pytest.mark.usefixtures("_frequent_thread_switches")
+def test_shared_pretty_formatter_keeps_styles_per_record():
+    formatter = PrettyFormatter()
+    mismatches: list[str] = []
+
+    def format_records(i: int) -> None:
+        level = logging.ERROR if i % 2 else logging.INFO
+        for _ in range(300):
+            record = logging.LogRecord("test", level, __file__, 1, "hello", None, None)
+            if logging.getLevelName(level) not in formatter.format(record):
+                mismatches.append(formatter.format(record))
+
+    _run_threads(format_records)
+    assert mismatches == []
+
+
+@pytest.mark.usefixtures("_frequent_thread_switches")
+def test_prod_logging_from_threads(capjson: JsonStderrCaptureFixture):
+    initialize(presets=["prod"])
+    logger = logging.getLogger("test")
+    shared_extra = {"x-request-id": "abc"}
+
+    def log(i: int) -> None:
+        for j in range(50):
+            logger.info("thread %d record %d", i, j, extra=shared_extra)
+
+    _run_threads(log)
+
+    assert len(capjson.records) == 8 * 50
+    assert all(record["http.headers.x-request-id"] == "abc" for record in capjson.records)
+    assert shared_extra == {"x-request-id": "abc"}
+
+
+def test_stacklevel_does_not_mutate_extra(caperrlines: ErrlinesCaptureFixture):
+    initialize(presets=["dev"])
+    extra = {"key": "value"}
+
+    def log_for_caller() -> None:
+        logging.getLogger("test").info("hello", extra=extra, stacklevel=2)
+
+    log_for_caller()
+
+    assert extra == {"key": "value"}
+    assert "test_threads.py:" in caperrlines.line
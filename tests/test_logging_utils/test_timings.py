@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import logging
+import threading
+from typing import TYPE_CHECKING
+
+import pytest
+
+import loggia.timings
+from loggia.conf import LoggerConfiguration
+from loggia.logger import initialize
+from loggia.timings import TimedFilter, _bucket_index, _bucket_upper_bound
+
+if TYPE_CHECKING:
+    from tests.conftest import JsonStderrCaptureFixture
+
+
+@pytest.fixture(autouse=True)
+def _reset_timings():
+    loggia.timings.reset()
+    yield
+    loggia.timings.configure(enabled=False)
+    loggia.timings.reset()
+
+
+@pytest.mark.parametrize("ns", [0, 1, 3, 4, 7, 8, 9, 100, 1_000, 12_345, 10**9])
+def test_bucket_bounds(ns: int):
+    idx = _bucket_index(ns)
+    assert ns <= _bucket_upper_bound(idx)
+    assert idx == 0 or _bucket_upper_bound(idx - 1) < ns
+    assert _bucket_upper_bound(idx) <= ns * 1.25 + 1
+
+
+def test_percentiles():
+    timings = loggia.timings.timings
+    for ns in range(1, 101):
+        timings.observe("stage", ns * 1000)
+
+    result = loggia.timings.percentiles()["stage"]
+    assert result["count"] == 100
+    assert 50_000 <= result["p50_ns"] <= 50_000 * 1.25
+    assert 99_000 <= result["p99_ns"] <= 99_000 * 1.25
+    assert "p90_ns" in loggia.timings.percentiles(0.9)["stage"]
+
+
+def test_percentiles_of_ended_threads():
+    timings = loggia.timings.timings
+    threads = [threading.Thread(target=timings.observe, args=("stage", 1000)) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+        thread.join()
+
+    assert loggia.timings.percentiles()["stage"]["count"] == 10
+    assert len(timings._all_histograms) <= 1  # This thread's, if any
+
+
+def test_stage_timings(capjson: JsonStderrCaptureFixture):
+    conf = LoggerConfiguration(settings={"LOGGIA_STAGE_TIMINGS": "true"})
+    conf.add_default_handler_filter(lambda record: record.msg != "drop me")
+    initialize(conf)
+    logger = logging.getLogger("test")
+    logger.info("hello")
+    logger.info("drop me")
+
+    result = loggia.timings.percentiles()
+    assert len(capjson.records) == 1
+    assert result["record"]["count"] == 2
+    assert result["filter:<lambda>"]["count"] == 2
+    assert result["format:CustomJsonFormatter"]["count"] == 1
+    assert result["write"]["count"] == 1
+    assert result["write"]["p50_ns"] > 0
+
+
+def test_stage_timings_reinitialize(capjson: JsonStderrCaptureFixture):
+    initialize({"LOGGIA_STAGE_TIMINGS": "true"})
+    initialize({"LOGGIA_STAGE_TIMINGS": "true"})
+    logging.getLogger("test").info("hello")
+
+    assert loggia.timings.percentiles()["record"]["count"] == 1
+    assert all(isinstance(f, TimedFilter) for f in logging.getLogger().handlers[0].filters)
+
+
+def test_stage_timings_disabled_by_default(capjson: JsonStderrCaptureFixture):
+    initialize()
+    logging.getLogger("test").info("hello")
+    assert loggia.timings.percentiles() == {}
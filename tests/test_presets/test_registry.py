@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+from loggia._internal.presets import _BUILTIN_PRESETS
+from loggia.base_preset import BasePreset
+from loggia.utils.loaderutils import import_all_files, import_fqn
+
+
+@pytest.mark.parametrize("key", sorted(_BUILTIN_PRESETS))
+def test_registry_matches_preset_classes(key: str):
+    builtin = _BUILTIN_PRESETS[key]
+    preset = import_fqn(builtin.fqn, ensure_subclass_of=BasePreset)
+    assert preset.preference_key() == key
+    assert tuple(preset.slots()) == builtin.slots
+    assert preset.opt_in() == builtin.opt_in
+
+
+def test_registry_lists_all_builtin_presets():
+    found = {
+        f"{mod.__name__}.{name}"
+        for mod in import_all_files("loggia/presets")
+        for name, thing in vars(mod).items()
+        if isinstance(thing, type) and issubclass(thing, BasePreset) and thing is not BasePreset and thing.__module__ == mod.__name__
+    }
+    assert found == {builtin.fqn for builtin in _BUILTIN_PRESETS.values()}
+
+
+def test_only_selected_presets_are_imported():
+    code = "import sys; from loggia.conf import LoggerConfiguration; LoggerConfiguration(); print(sorted(m for m in sys.modules if m.startswith('loggia.presets.')))"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, env={"LOGGIA_PRESETS": "prod"})  # noqa: S603
+    imported = result.stdout.strip()
+    assert "loggia.presets.prod" in imported
+    assert "loggia.presets.dev" not in imported
+    assert "loggia.presets.gc_monitor" not in imported